@@ -6,6 +6,8 @@ Replica a interface e funcionalidade completa do sistema TypeScript.
 import streamlit as st
 import pandas as pd
 import json
+import os
+import time
 from datetime import datetime, date, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
@@ -13,6 +15,8 @@ from plotly.subplots import make_subplots
 from typing import Dict, List, Any, Optional
 import base64
 import io
+from dataclasses import asdict
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 # Configuração da página
 st.set_page_config(
@@ -32,9 +36,37 @@ try:
     from src.data_processor import TrelloDataProcessor, TaskReport, CollaboratorReport, ReportSummary
     from src.config import (
         GRUPOS_MARKETING, STREAMLIT_CONFIG, STATUS_COLORS, TASK_STATUSES,
-        get_grupo_por_responsavel, CONTENT_CREATORS
+        get_grupo_por_responsavel, CONTENT_CREATORS, ROLLUP_GRANULARITIES, ROLLUP_GRANULARITY,
+        HISTORY_DB_PATH, WATCH_OUTPUT_DIR, WEBHOOK_PORT, METRICS_HOST, METRICS_PORT, METRICS_TEXTFILE,
+        NO_GROUP
     )
-    from src.utils import format_number, format_percentage, create_download_link
+    from src.utils import format_number, format_percentage
+    from src.tables import create_download_link
+    from src.charts import create_aging_chart, create_cycle_time_chart, create_trend_chart, create_burnup_chart
+    from src.board_index import BoardIndex
+    from src.actions import ListTransitionIndex
+    from src.aging import aging_histogram
+    from src.cycle_time import stage_cycle_times
+    from src.rollups import RollupStore
+    from src.cube import OlapCube
+    from src.windows import WindowReport
+    from src.history_store import HistoryStore, board_id_of
+    from src.snapshot_diff import diff_snapshots
+    from src.card_cache import shared_card_cache
+    from src.board_cache import BoardLease, content_key, shared_board_cache
+    from src.watcher import ProcessedBoard, read_manifest, load_processed_board
+    from src.trello_api import TrelloAPIError, fetch_board
+    from src.sync import sync_board
+    from src.live_board import LiveBoardModel
+    from src.profiling import RunProfile, capture_cprofile, profile_run, stage
+    from src.memory import SessionArtifacts, SessionMemory, format_bytes, memory_registry, process_peak_rss
+    from src.webhook import shared_receiver, start_shared_receiver
+    from src.metrics import (
+        observe_profile, observe_upload, record_board, start_shared_metrics_server, watch_card_cache,
+        write_textfile
+    )
+    from src.burnup import burnup_series
+    from src.comparison import METRIC_LABELS, previous_period, metric_deltas, group_deltas, collaborator_deltas
 except ImportError as e:
     st.error(f"Erro ao importar módulos: {e}")
     st.stop()
@@ -131,6 +163,12 @@ def init_session_state():
         end_date = date.today()
         start_date = end_date - timedelta(days=30)
         st.session_state.date_range = (start_date, end_date)
+    if 'as_of' not in st.session_state:
+        st.session_state.as_of = date.today()
+    if 'compare_range' not in st.session_state:
+        st.session_state.compare_range = None
+    if 'comparison' not in st.session_state:
+        st.session_state.comparison = None
 
 def create_sidebar():
     """Cria a barra lateral com controles."""
@@ -154,6 +192,29 @@ def create_sidebar():
     if st.sidebar.button("🎯 Usar Dados de Exemplo", help="Carrega dados de exemplo para demonstração"):
         load_sample_data()
     
+    # Busca direta pela API do Trello
+    with st.sidebar.expander("🔗 Buscar do Trello"):
+        board_id = st.text_input("Id do board", help="Id ou shortLink (trello.com/b/<shortLink>)")
+        api_key = st.text_input("API key", value=os.environ.get('TRELLO_KEY', ''), type="password")
+        api_token = st.text_input("Token", value=os.environ.get('TRELLO_TOKEN', ''), type="password")
+        col1, col2 = st.columns(2)
+        if col1.button("⬇️ Buscar Board", disabled=not board_id):
+            fetch_trello_board(board_id, api_key, api_token)
+        if col2.button("🔄 Sincronizar", disabled=not board_id, help="Aplica apenas as ações novas desde a última sincronização"):
+            sync_trello_board(board_id, api_key, api_token)
+    
+    # Boards já processados pelo watcher (python cli.py watch)
+    processed = read_manifest(WATCH_OUTPUT_DIR)
+    if processed:
+        st.sidebar.header("📂 Boards Processados")
+        selected_export = st.sidebar.selectbox(
+            "Export",
+            options=sorted(processed),
+            format_func=lambda name: f"{processed[name].board_name or name} ({processed[name].as_of})"
+        )
+        if st.sidebar.button("📥 Carregar Board Processado", help="Carrega o resultado gravado pelo watcher, sem reprocessar"):
+            load_watched_board(processed[selected_export])
+    
     # Filtros de data
     st.sidebar.header("📅 Período do Relatório")
     
@@ -174,10 +235,43 @@ def create_sidebar():
     
     st.session_state.date_range = (start_date, end_date)
     
+    st.session_state.as_of = st.sidebar.date_input(
+        "Data de Referência",
+        value=st.session_state.as_of,
+        help="Data usada para calcular atrasos (ex.: relatório \"como na última sexta\")"
+    )
+    
+    # Comparação de períodos
+    st.sidebar.header("🔀 Comparação de Períodos")
+    
+    if st.sidebar.checkbox("Comparar com outro período", value=st.session_state.compare_range is not None):
+        compare_with = st.sidebar.radio(
+            "Comparar com:",
+            options=['Período anterior', 'Personalizado'],
+            help="Período anterior = mesma duração, imediatamente antes do período do relatório"
+        )
+        
+        if compare_with == 'Período anterior':
+            st.session_state.compare_range = previous_period(start_date, end_date)
+            st.sidebar.caption(
+                f"{st.session_state.compare_range[0].strftime('%d/%m/%Y')} a "
+                f"{st.session_state.compare_range[1].strftime('%d/%m/%Y')}"
+            )
+        else:
+            default_range = st.session_state.compare_range or previous_period(start_date, end_date)
+            col1, col2 = st.sidebar.columns(2)
+            with col1:
+                compare_start = st.date_input("Início (comparação)", value=default_range[0])
+            with col2:
+                compare_end = st.date_input("Fim (comparação)", value=default_range[1])
+            st.session_state.compare_range = (compare_start, compare_end)
+    else:
+        st.session_state.compare_range = None
+    
     # Filtro de grupos
     st.sidebar.header("👥 Filtros de Grupos")
     
-    all_groups = [g.name for g in GRUPOS_MARKETING] + ['Sem Grupo']
+    all_groups = [g.name for g in GRUPOS_MARKETING] + [NO_GROUP]
     
     selected_groups = st.sidebar.multiselect(
         "Selecione os grupos:",
@@ -205,6 +299,11 @@ def create_sidebar():
         # Botão de reprocessamento
         if st.sidebar.button("🔄 Reprocessar Dados", help="Reprocessa os dados com filtros atuais"):
             process_trello_data()
+        
+        if st.sidebar.button("💾 Salvar no Histórico", help="Grava este board como snapshot na data de referência"):
+            save_to_history()
+        
+        display_live_webhooks()
     
     # Links úteis
     st.sidebar.markdown("---")
@@ -251,28 +350,136 @@ def load_sample_data():
     except Exception as e:
         st.sidebar.error(f"Erro ao carregar dados de exemplo: {e}")
 
+def fetch_trello_board(board_id: str, api_key: str, api_token: str):
+    """Busca o board pela API do Trello e processa como um export carregado."""
+    try:
+        with st.spinner("Buscando board no Trello..."):
+            fetched = fetch_board(board_id.strip(), api_key, api_token)
+        
+        st.session_state.trello_data = fetched.data
+        st.sidebar.success(
+            f"✅ {len(fetched.data['cards'])} cards em {fetched.requests} requisições ({fetched.seconds:.1f} s)"
+        )
+        process_trello_data()
+        
+    except TrelloAPIError as e:
+        st.sidebar.error(f"❌ Erro da API do Trello: {e}")
+    except OSError as e:
+        st.sidebar.error(f"❌ Falha de conexão com o Trello: {e}")
+
+def sync_trello_board(board_id: str, api_key: str, api_token: str):
+    """Sincroniza o board pelas ações novas; só os cards alterados são reclassificados (cache por card)."""
+    board_id = board_id.strip()
+    board_syncs = st.session_state.setdefault('board_syncs', {})
+    try:
+        with st.spinner("Sincronizando com o Trello..."):
+            board_sync, result = sync_board(board_id, api_key, api_token, board_sync=board_syncs.get(board_id))
+        board_syncs[board_id] = board_sync
+        
+        # Novas listas de topo: o modelo é alterado no lugar e os caches da sessão
+        # (índice, relatórios) comparam por identidade
+        data = board_sync.data
+        st.session_state.trello_data = dict(
+            data, cards=list(data['cards']), lists=list(data['lists']), members=list(data['members'])
+        )
+        mode = "completa" if result.full else f"{result.actions} ações, {len(result.changed_cards)} cards alterados"
+        st.sidebar.success(f"✅ Sincronização {mode} ({result.seconds:.1f} s)")
+        process_trello_data()
+        
+    except TrelloAPIError as e:
+        st.sidebar.error(f"❌ Erro da API do Trello: {e}")
+    except OSError as e:
+        st.sidebar.error(f"❌ Falha de conexão com o Trello: {e}")
+
+def display_live_webhooks():
+    """Receptor de webhooks do Trello e contadores ao vivo do board carregado."""
+    with st.sidebar.expander("⚡ Webhooks ao Vivo"):
+        port = int(st.number_input("Porta", min_value=1, max_value=65535, value=WEBHOOK_PORT))
+        receiver = shared_receiver(port)
+        
+        if st.button("▶️ Iniciar com este board", help="Sobe o receptor com o board carregado como estado inicial"):
+            try:
+                model = LiveBoardModel(
+                    st.session_state.trello_data, as_of=st.session_state.as_of, transitions=get_transition_index()
+                )
+                receiver = start_shared_receiver(model, port=port)
+            except OSError as e:
+                st.error(f"❌ Não foi possível abrir a porta {port}: {e}")
+        
+        if receiver is None:
+            st.caption("Receptor parado. Registre o webhook do Trello apontando para este servidor.")
+            return
+        
+        snapshot = receiver.model.snapshot()
+        status = snapshot['status']
+        st.caption(f"Recebendo em {receiver.url} | {snapshot['events']} eventos")
+        col1, col2 = st.columns(2)
+        col1.metric("Tarefas", snapshot['tasks'])
+        col2.metric("Concluídas", status.get('Concluída', 0))
+        col1.metric("Atrasadas", status.get('Atrasada', 0))
+        col2.metric("Bloqueadas", status.get('Bloqueada', 0))
+        st.button("🔄 Atualizar contadores")
+
+def load_watched_board(entry: ProcessedBoard):
+    """Carrega um board processado pelo watcher, reaproveitando os relatórios gravados."""
+    try:
+        result = load_processed_board(entry, WATCH_OUTPUT_DIR)
+        # O hash do manifesto é o mesmo do upload do arquivo: o board é compartilhado com quem enviou o export
+        lease = shared_board_cache().acquire(entry.content_hash, load=lambda: result['data'])
+        
+        st.session_state.board_lease = lease
+        st.session_state.trello_data = lease.data
+        st.session_state.as_of = result['as_of']
+        st.session_state.board_reports = (
+            lease.data, result['as_of'], result['task_reports'], result['report_days']
+        )
+        st.sidebar.success(f"✅ {entry.source} carregado ({entry.task_reports} relatórios)")
+        process_trello_data()
+        
+    except Exception as e:
+        st.sidebar.error(f"Erro ao carregar board processado: {e}")
+
 def process_uploaded_file(uploaded_file):
     """Processa arquivo carregado pelo usuário."""
     try:
-        # Ler arquivo JSON
-        data = json.load(uploaded_file)
+        # Tamanho do upload (uma vez por arquivo, não a cada execução do script)
+        if st.session_state.get('metrics_upload_id') != uploaded_file.file_id:
+            st.session_state.metrics_upload_id = uploaded_file.file_id
+            observe_upload(uploaded_file.size)
         
-        # Validar estrutura
-        processor = TrelloDataProcessor()
-        is_valid, errors = processor.validate_trello_data(data)
+        # Board compartilhado entre as sessões: mesmo conteúdo, mesmo objeto decodificado
+        raw = uploaded_file.getvalue()
+        key = content_key(raw)
+        lease = st.session_state.get('board_lease')
+        if lease is None or lease.key != key:
+            lease = shared_board_cache().acquire(key)
         
-        if not is_valid:
-            st.error("❌ Arquivo JSON inválido!")
-            for error in errors:
-                st.error(f"• {error}")
-            return False
+        if lease is None:
+            # Ler arquivo JSON
+            with stage('decodificação JSON') as timing:
+                data = json.loads(raw)
+                if timing:
+                    timing.add_rows(len(data.get('cards', [])) if isinstance(data, dict) else 0)
+            
+            # Validar estrutura
+            processor = TrelloDataProcessor()
+            with stage('validação'):
+                is_valid, errors = processor.validate_trello_data(data)
+            
+            if not is_valid:
+                st.error("❌ Arquivo JSON inválido!")
+                for error in errors:
+                    st.error(f"• {error}")
+                return False
+            
+            lease = shared_board_cache().acquire(key, load=lambda: data)
         
         # Salvar dados na sessão
-        st.session_state.trello_data = data
+        st.session_state.board_lease = lease
+        st.session_state.trello_data = lease.data
         st.sidebar.success("✅ Arquivo carregado com sucesso!")
         
-        # Processar dados automaticamente
-        process_trello_data()
+        # Os relatórios da sessão são regerados em refresh_session_reports, só se o board ou os filtros mudaram
         return True
         
     except json.JSONDecodeError:
@@ -283,38 +490,237 @@ def process_uploaded_file(uploaded_file):
         return False
 
 def process_trello_data():
-    """Processa dados do Trello com filtros aplicados."""
+    """Processa dados do Trello com filtros aplicados (sob o cProfile se pedido no painel)."""
+    data = st.session_state.trello_data or {}
+    board_name = data.get('name', 'board')
+    cards = len(data.get('cards', []))
+    
+    started = time.perf_counter()
+    with memory_registry().track_run(get_session_artifacts().session_id, board_name, cards):
+        if not st.session_state.get('cprofile_next_run'):
+            generate_session_reports()
+        else:
+            _, capture = capture_cprofile(generate_session_reports, label=board_name)
+            st.session_state.cprofile_capture = capture
+            st.session_state.cprofile_captured = True
+    record_board('app', cards, time.perf_counter() - started)
+
+def session_filters() -> tuple:
+    """Filtros que definem os relatórios da sessão (além do board)."""
+    return (
+        st.session_state.date_range,
+        st.session_state.compare_range,
+        tuple(st.session_state.selected_groups),
+        st.session_state.as_of
+    )
+
+def refresh_session_reports():
+    """Regera os relatórios da sessão apenas quando o board ou os filtros mudaram desde a última geração."""
+    if not st.session_state.trello_data:
+        return
+    cached = st.session_state.get('session_reports_key')
+    if cached is None or cached[0] is not st.session_state.trello_data or cached[1] != session_filters():
+        process_trello_data()
+
+def generate_session_reports():
+    """Gera os relatórios da sessão para o período e os grupos selecionados."""
     if not st.session_state.trello_data:
         return
         
     try:
         processor = TrelloDataProcessor()
         
-        # Gerar relatórios de tarefas
+        # Recorte dos relatórios do board inteiro: a mesma fatia que o cubo agrega
         start_date, end_date = st.session_state.date_range
-        task_reports = processor.generate_task_reports(
-            st.session_state.trello_data,
-            start_date,
-            end_date
-        )
-        
-        # Filtrar por grupos selecionados
-        filtered_reports = []
-        for report in task_reports:
-            report_group = report.grupo or 'Sem Grupo'
-            if report_group in st.session_state.selected_groups:
-                filtered_reports.append(report)
+        with stage('recorte do período') as timing:
+            filtered_reports = slice_board_reports(start_date, end_date)
+            if timing:
+                timing.add_rows(len(filtered_reports))
         
         # Gerar relatórios derivados
         st.session_state.task_reports = filtered_reports
-        st.session_state.collaborator_reports = processor.generate_collaborator_reports(filtered_reports)
-        st.session_state.report_summary = processor.generate_report_summary(filtered_reports)
+        with stage('relatórios de colaboradores') as timing:
+            st.session_state.collaborator_reports = processor.generate_collaborator_reports(filtered_reports)
+            if timing:
+                timing.add_rows(len(st.session_state.collaborator_reports))
+        st.session_state.report_summary = get_dashboard_summary()
         
-        st.sidebar.success(f"✅ Processados {len(filtered_reports)} registros")
+        if st.session_state.compare_range is not None:
+            previous = process_comparison(processor)
+            st.session_state.comparison = previous
+            st.sidebar.success(
+                f"✅ Processados {len(filtered_reports)} registros "
+                f"({len(previous.task_reports)} no período de comparação)"
+            )
+        else:
+            st.session_state.comparison = None
+            st.sidebar.success(f"✅ Processados {len(filtered_reports)} registros")
+        
+        st.session_state.session_reports_key = (st.session_state.trello_data, session_filters())
         
     except Exception as e:
         st.error(f"❌ Erro ao processar dados: {e}")
 
+def process_comparison(processor: TrelloDataProcessor) -> WindowReport:
+    """Relatórios do período de comparação, recortados dos mesmos relatórios do board inteiro."""
+    start_date, end_date = st.session_state.compare_range
+    with stage('relatórios do período de comparação') as timing:
+        task_reports = slice_board_reports(start_date, end_date)
+        if timing:
+            timing.add_rows(len(task_reports))
+        return WindowReport(
+            start_date=start_date,
+            end_date=end_date,
+            task_reports=task_reports,
+            summary=get_olap_cube().summary(start_date, end_date, st.session_state.selected_groups),
+            collaborator_reports=processor.generate_collaborator_reports(task_reports)
+        )
+
+def get_session_artifacts() -> SessionArtifacts:
+    """Artefatos da sessão acompanhados pelo registro de memória do processo."""
+    if st.session_state.get('memory_session') is None:
+        ctx = get_script_run_ctx()
+        session = SessionArtifacts(ctx.session_id if ctx else str(id(st.session_state)))
+        memory_registry().register_session(session)
+        st.session_state.memory_session = session
+    return st.session_state.memory_session
+
+def update_session_artifacts():
+    """Atualiza as referências aos artefatos da sessão (sem medir)."""
+    data = st.session_state.trello_data or {}
+    get_session_artifacts().update(
+        # O lease alcança o cache de boards inteiro; o board da sessão já está em trello_data
+        {name: value for name, value in st.session_state.items() if name not in ('memory_session', 'board_lease')},
+        board_name=data.get('name', ''),
+        cards=len(data.get('cards', []))
+    )
+
+def get_history_store() -> HistoryStore:
+    """Histórico de snapshots (uma conexão por sessão)."""
+    if st.session_state.get('history_store') is None:
+        st.session_state.history_store = HistoryStore(HISTORY_DB_PATH)
+    return st.session_state.history_store
+
+def save_to_history():
+    """Grava o board carregado como snapshot na data de referência."""
+    try:
+        snapshot_id = get_history_store().save_snapshot(
+            st.session_state.trello_data,
+            TrelloDataProcessor(),
+            as_of=st.session_state.as_of,
+            transitions=get_transition_index(),
+            index=get_board_index()
+        )
+        st.sidebar.success(f"✅ Snapshot {snapshot_id} gravado no histórico")
+    except Exception as e:
+        st.sidebar.error(f"❌ Erro ao gravar histórico: {e}")
+
+def get_board_lease() -> Optional[BoardLease]:
+    """Lease do board compartilhado em uso (None se o board atual não veio do cache de boards)."""
+    lease = st.session_state.get('board_lease')
+    if lease is not None and lease.data is not st.session_state.trello_data:
+        # Board trocado por outra fonte (exemplo, API, sincronização): libera o compartilhado
+        lease.release()
+        st.session_state.board_lease = lease = None
+    return lease
+
+def get_board_index() -> BoardIndex:
+    """Índice do board carregado (reconstruído apenas quando os dados mudam)."""
+    data = st.session_state.trello_data
+    index = st.session_state.get('board_index')
+    
+    if index is None or index.cards is not data.get('cards', []):
+        lease = get_board_lease()
+        if lease is not None:
+            index = lease.derived('board_index', lambda: BoardIndex.from_data(data))
+        else:
+            index = BoardIndex.from_data(data)
+        st.session_state.board_index = index
+        
+    return index
+
+def get_transition_index():
+    """Índice de movimentações do log de ações (None se o export não trouxer ações)."""
+    actions = st.session_state.trello_data.get('actions')
+    if not actions:
+        return None
+    
+    cached = st.session_state.get('transition_index')
+    if cached is None or cached[0] is not actions:
+        lease = get_board_lease()
+        if lease is not None:
+            transitions = lease.derived('transition_index', lambda: ListTransitionIndex.from_actions(actions))
+        else:
+            transitions = ListTransitionIndex.from_actions(actions)
+        cached = (actions, transitions)
+        st.session_state.transition_index = cached
+        
+    return cached[1]
+
+def get_board_reports():
+    """Relatórios do board inteiro e o dia de cada um (gerados uma vez por carga e data de referência)."""
+    data = st.session_state.trello_data
+    as_of = st.session_state.as_of
+    cached = st.session_state.get('board_reports')
+    
+    if cached is None or cached[0] is not data or cached[1] != as_of:
+        index = get_board_index()
+        transitions = get_transition_index()
+        with stage('relatórios do board inteiro') as timing:
+            task_reports, report_days = TrelloDataProcessor().generate_board_reports(
+                data,
+                index,
+                as_of=as_of,
+                transitions=transitions,
+                card_cache=shared_card_cache()
+            )
+            if timing:
+                timing.add_rows(len(task_reports))
+        cached = (data, as_of, task_reports, report_days)
+        st.session_state.board_reports = cached
+        
+    return cached[2], cached[3]
+
+def slice_board_reports(start_date: date, end_date: date) -> List[TaskReport]:
+    """Relatórios do board inteiro no período e nos grupos selecionados (na ordem do processador)."""
+    task_reports, report_days = get_board_reports()
+    selected_groups = set(st.session_state.selected_groups)
+    return [
+        report for report, day in zip(task_reports, report_days)
+        if start_date <= day <= end_date and (report.grupo or NO_GROUP) in selected_groups
+    ]
+
+def get_rollup_store() -> RollupStore:
+    """Rollup diário do board (materializado uma vez por carga e data de referência)."""
+    cached = st.session_state.get('rollup_store')
+    task_reports, report_days = get_board_reports()
+    
+    if cached is None or cached[0] is not task_reports:
+        with stage('rollup diário', rows=len(task_reports)):
+            cached = (task_reports, RollupStore.from_reports(task_reports, report_days, st.session_state.as_of))
+        st.session_state.rollup_store = cached
+        
+    return cached[1]
+
+def get_olap_cube() -> OlapCube:
+    """Cubo pré-agregado do board (materializado uma vez por carga e data de referência)."""
+    cached = st.session_state.get('olap_cube')
+    task_reports, report_days = get_board_reports()
+    
+    if cached is None or cached[0] is not task_reports:
+        with stage('cubo OLAP', rows=len(task_reports)):
+            cached = (task_reports, OlapCube.from_reports(task_reports, report_days))
+        st.session_state.olap_cube = cached
+        
+    return cached[1]
+
+def get_dashboard_summary() -> ReportSummary:
+    """Resumo do período e dos grupos selecionados, respondido pelo cubo (sem reprocessar o board)."""
+    start_date, end_date = st.session_state.date_range
+    cube = get_olap_cube()
+    with stage('resumo (cubo)'):
+        return cube.summary(start_date, end_date, st.session_state.selected_groups)
+
 def display_header():
     """Exibe cabeçalho principal."""
     st.markdown("""
@@ -329,7 +735,7 @@ def display_metrics_overview():
     if not st.session_state.report_summary:
         return
         
-    summary = st.session_state.report_summary
+    summary = get_dashboard_summary()
     
     st.header("📈 Visão Geral")
     
@@ -372,16 +778,75 @@ def display_metrics_overview():
             help="Número de colaboradores únicos"
         )
 
+def display_comparison_section():
+    """Exibe as diferenças entre o período do relatório e o de comparação."""
+    previous = st.session_state.comparison
+    summary = st.session_state.report_summary
+    if previous is None or summary is None:
+        return
+    
+    st.markdown(f"""
+    ### 🔀 Comparação de Períodos
+    **Atual:** {st.session_state.date_range[0].strftime('%d/%m/%Y')} a {st.session_state.date_range[1].strftime('%d/%m/%Y')} |
+    **Comparação:** {previous.start_date.strftime('%d/%m/%Y')} a {previous.end_date.strftime('%d/%m/%Y')}
+    """)
+    
+    # Métricas em que aumento é ruim aparecem com delta invertido (vermelho)
+    worse_when_higher = {'late_tasks', 'overdue_tasks', 'blocked_tasks', 'late_deliveries',
+                         'average_days_late', 'average_business_days_late'}
+    
+    deltas = metric_deltas(summary, previous.summary)
+    columns = st.columns(len(deltas))
+    for column, (metric, values) in zip(columns, deltas.items()):
+        with column:
+            st.metric(
+                METRIC_LABELS.get(metric, metric),
+                format_number(values.current),
+                delta=round(values.delta, 1),
+                delta_color='inverse' if metric in worse_when_higher else 'normal'
+            )
+    
+    by_group, by_collaborator = st.tabs(["👥 Por Grupo", "👤 Por Colaborador"])
+    
+    for tab, key, table in [
+        (by_group, 'grupo', group_deltas(summary, previous.summary)),
+        (by_collaborator, 'colaborador', collaborator_deltas(
+            st.session_state.collaborator_reports, previous.collaborator_reports
+        ))
+    ]:
+        with tab:
+            if table.empty:
+                st.info("Nenhum dado nos períodos selecionados.")
+                continue
+            
+            metric = st.selectbox(
+                "Métrica:",
+                options=list(dict.fromkeys(table['metrica'])),
+                format_func=lambda m: METRIC_LABELS.get(m, m),
+                key=f'comparison_metric_{key}'
+            )
+            rows = table[table['metrica'] == metric].drop(columns='metrica')
+            st.dataframe(
+                rows.rename(columns={
+                    'grupo': 'Grupo',
+                    'colaborador': 'Colaborador',
+                    'atual': 'Atual',
+                    'anterior': 'Anterior',
+                    'delta': 'Δ'
+                }).sort_values('Δ', key=abs, ascending=False),
+                use_container_width=True,
+                hide_index=True
+            )
+
 def create_status_distribution_chart():
     """Cria gráfico de distribuição de status."""
     if not st.session_state.task_reports:
         return None
         
-    # Contar status
-    status_counts = {}
-    for report in st.session_state.task_reports:
-        status = report.status
-        status_counts[status] = status_counts.get(status, 0) + 1
+    # Contar status (linhas de relatório) pelo cubo
+    start_date, end_date = st.session_state.date_range
+    by_status = get_olap_cube().rollup(['status'], start_date, end_date, st.session_state.selected_groups)
+    status_counts = dict(zip(by_status['status'], by_status['tasks'].tolist()))
     
     # Criar gráfico de pizza
     fig = go.Figure(data=[go.Pie(
@@ -407,7 +872,7 @@ def create_group_distribution_chart():
     if not st.session_state.report_summary:
         return None
         
-    summary = st.session_state.report_summary
+    summary = get_dashboard_summary()
     
     # Preparar dados
     groups = [gs.grupo for gs in summary.group_summaries]
@@ -454,7 +919,7 @@ def display_group_details():
         
     st.header("👥 Detalhes dos Grupos")
     
-    summary = st.session_state.report_summary
+    summary = get_dashboard_summary()
     
     # Criar cards para cada grupo
     for group_summary in summary.group_summaries:
@@ -475,6 +940,8 @@ def display_group_details():
                 st.metric("Concluídas", group_summary.completed_tasks)
                 st.metric("Em Andamento", group_summary.in_progress_tasks)
                 st.metric("Atrasadas", group_summary.late_tasks)
+                if group_summary.average_business_days_late > 0:
+                    st.metric("Média de Atraso", f"{group_summary.average_business_days_late} dias úteis")
                 
             with col3:
                 st.markdown("**👤 Responsáveis**")
@@ -497,10 +964,12 @@ def display_group_details():
                         'Colaborador': task.collaborator_name,
                         'Status': task.status,
                         'Prazo': task.due_date,
-                        'Atraso (dias)': task.days_late if task.days_late > 0 else '-'
+                        'Atraso (dias)': task.days_late if task.days_late > 0 else '-',
+                        'Atraso (dias úteis)': task.business_days_late if task.days_late > 0 else '-'
                     })
                 
-                df_tasks = pd.DataFrame(task_data)
+                with stage('DataFrame: tarefas do grupo', rows=len(task_data)):
+                    df_tasks = pd.DataFrame(task_data)
                 st.dataframe(df_tasks, use_container_width=True)
                 
                 if len(group_tasks) > 10:
@@ -535,7 +1004,8 @@ def display_collaborator_analysis():
                 st.metric("Em Andamento", collaborator.in_progress_tasks)
                 st.metric("Atrasadas", collaborator.late_tasks)
                 if collaborator.average_days_late > 0:
-                    st.metric("Média de Atraso", f"{collaborator.average_days_late} dias")
+                    st.metric("Média de Atraso", f"{collaborator.average_days_late} dias",
+                              help=f"{collaborator.average_business_days_late} dias úteis")
             
             # Mostrar algumas tarefas
             if collaborator.tasks:
@@ -552,26 +1022,30 @@ def display_reports_section():
     st.header("📊 Relatórios Detalhados")
     
     # Tabs para diferentes relatórios
-    tab1, tab2, tab3 = st.tabs(["📋 Relatório de Tarefas", "👤 Relatório de Colaboradores", "📈 Análise Temporal"])
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "📋 Relatório de Tarefas", "👤 Relatório de Colaboradores", "📈 Análise Temporal", "🗂️ Histórico"
+    ])
     
     with tab1:
         st.subheader("Relatório Completo de Tarefas")
         
         # Criar DataFrame para exibição
-        task_data = []
-        for task in st.session_state.task_reports:
-            task_data.append({
-                'Tarefa': task.task_name,
-                'Colaborador': task.collaborator_name,
-                'Grupo': task.grupo or 'Sem Grupo',
-                'Status': task.status,
-                'Lista Atual': task.list_name,
-                'Prazo': task.due_date,
-                'Dias de Atraso': task.days_late if task.days_late > 0 else 0,
-                'Observações': task.observations[:50] + '...' if len(task.observations) > 50 else task.observations
-            })
-        
-        df_tasks = pd.DataFrame(task_data)
+        with stage('DataFrame: tarefas', rows=len(st.session_state.task_reports)):
+            task_data = []
+            for task in st.session_state.task_reports:
+                task_data.append({
+                    'Tarefa': task.task_name,
+                    'Colaborador': task.collaborator_name,
+                    'Grupo': task.grupo or NO_GROUP,
+                    'Status': task.status,
+                    'Lista Atual': task.list_name,
+                    'Prazo': task.due_date,
+                    'Dias de Atraso': task.days_late if task.days_late > 0 else 0,
+                    'Dias Úteis de Atraso': task.business_days_late,
+                    'Observações': task.observations[:50] + '...' if len(task.observations) > 50 else task.observations
+                })
+            
+            df_tasks = pd.DataFrame(task_data)
         
         # Filtros adicionais
         col1, col2 = st.columns(2)
@@ -620,10 +1094,12 @@ def display_reports_section():
                     'Em Andamento': collab.in_progress_tasks,
                     'Atrasadas': collab.late_tasks,
                     'Taxa de Conclusão': f"{collab.completion_rate:.1f}%",
-                    'Média de Atraso (dias)': collab.average_days_late
+                    'Média de Atraso (dias)': collab.average_days_late,
+                    'Média de Atraso (dias úteis)': collab.average_business_days_late
                 })
             
-            df_collabs = pd.DataFrame(collab_data)
+            with stage('DataFrame: colaboradores', rows=len(collab_data)):
+                df_collabs = pd.DataFrame(collab_data)
             st.dataframe(df_collabs, use_container_width=True)
             
             # Download
@@ -637,7 +1113,270 @@ def display_reports_section():
     
     with tab3:
         st.subheader("Análise Temporal")
-        st.info("🚧 Em desenvolvimento - será implementado em versão futura")
+        display_trend_analysis()
+        st.markdown("---")
+        display_burnup_analysis()
+        st.markdown("---")
+        display_cycle_time_analysis()
+        st.markdown("---")
+        display_aging_analysis()
+    
+    with tab4:
+        st.subheader("Histórico de Snapshots")
+        display_history_section()
+        st.markdown("---")
+        display_snapshot_diff()
+
+def display_history_section():
+    """Exibe os snapshots gravados do board e a evolução dos status entre eles."""
+    store = get_history_store()
+    board_id = board_id_of(st.session_state.trello_data)
+    snapshots = store.snapshots(board_id)
+    
+    if snapshots.empty:
+        st.info("Nenhum snapshot deste board no histórico. Use \"💾 Salvar no Histórico\" na barra lateral.")
+        return
+    
+    start_date, end_date = st.session_state.date_range
+    counts = store.status_counts(board_id, start_date, end_date, grupos=st.session_state.selected_groups)
+    if counts.empty:
+        st.info("Nenhum snapshot no período selecionado.")
+    else:
+        with stage('gráfico: histórico'):
+            st.plotly_chart(
+                create_trend_chart(counts, "Tarefas por Status em cada Snapshot", colors=STATUS_COLORS),
+                use_container_width=True
+            )
+    
+    st.dataframe(
+        snapshots[['snapshot_date', 'as_of', 'saved_at', 'cards', 'task_rows']].rename(columns={
+            'snapshot_date': 'Snapshot',
+            'as_of': 'Referência',
+            'saved_at': 'Gravado em',
+            'cards': 'Cards',
+            'task_rows': 'Linhas de Tarefa'
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
+
+def display_snapshot_diff():
+    """Exibe as mudanças entre um export anterior e o board carregado."""
+    st.markdown("**🔍 Mudanças desde um Export Anterior**")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        previous_file = st.file_uploader("Export anterior (JSON)", type=['json'], key='diff_previous')
+    with col2:
+        previous_as_of = st.date_input(
+            "Referência do export anterior",
+            value=st.session_state.as_of - timedelta(days=7),
+            help="Data usada para calcular o status (atrasos) no export anterior"
+        )
+    
+    if previous_file is None:
+        return
+    
+    try:
+        previous = json.load(previous_file)
+    except json.JSONDecodeError as e:
+        st.error(f"❌ Arquivo JSON inválido: {e}")
+        return
+    
+    diff = diff_snapshots(
+        previous,
+        st.session_state.trello_data,
+        previous_as_of=previous_as_of,
+        current_as_of=st.session_state.as_of
+    )
+    
+    labels = {
+        'adicionado': 'Adicionados',
+        'removido': 'Removidos',
+        'movido': 'Movidos',
+        'status': 'Mudaram de Status',
+        'prazo': 'Mudaram de Prazo',
+        'responsaveis': 'Reatribuídos'
+    }
+    counts = diff.counts()
+    for column, (kind, label) in zip(st.columns(len(labels)), labels.items()):
+        with column:
+            st.metric(label, counts[kind])
+    
+    if not diff.changes:
+        st.info(f"Nenhuma mudança ({diff.unchanged_cards} cards iguais).")
+        return
+    
+    kinds = st.multiselect(
+        "Tipos de mudança:",
+        options=list(labels),
+        default=[kind for kind in labels if counts[kind]],
+        format_func=labels.get
+    )
+    changes = diff.to_dataframe()
+    st.dataframe(
+        changes[changes['kind'].isin(kinds)].replace({'kind': labels}).rename(columns={
+            'card_name': 'Card',
+            'kind': 'Mudança',
+            'before': 'Antes',
+            'after': 'Depois'
+        }).drop(columns='card_id'),
+        use_container_width=True,
+        hide_index=True
+    )
+
+def display_trend_analysis():
+    """Exibe a evolução das tarefas no período a partir do rollup diário."""
+    st.markdown("**📈 Tendência no Período**")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        granularity = st.selectbox(
+            "Granularidade:",
+            options=ROLLUP_GRANULARITIES,
+            index=ROLLUP_GRANULARITIES.index(ROLLUP_GRANULARITY),
+            format_func={'day': 'Diária', 'week': 'Semanal', 'month': 'Mensal'}.get
+        )
+    
+    with col2:
+        dimension = st.selectbox(
+            "Agrupar por:",
+            options=['status', 'grupo', 'colaborador'],
+            format_func=str.capitalize,
+            key='trend_dimension'
+        )
+    
+    start_date, end_date = st.session_state.date_range
+    series = get_rollup_store().series(
+        start_date,
+        end_date,
+        by=[dimension],
+        granularity=granularity,
+        grupos=st.session_state.selected_groups
+    )
+    series = series.loc[:, series.sum() > 0]
+    
+    if series.empty:
+        st.info("Nenhuma tarefa no período selecionado.")
+        return
+    
+    with stage('gráfico: tendência'):
+        st.plotly_chart(
+            create_trend_chart(series, colors=STATUS_COLORS if dimension == 'status' else None),
+            use_container_width=True
+        )
+
+def display_burnup_analysis():
+    """Exibe o burn-up/burn-down de cada grupo no período selecionado."""
+    st.markdown("**🔥 Burn-up por Grupo**")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        grupo = st.selectbox("Grupo:", options=st.session_state.selected_groups, key='burnup_group')
+    with col2:
+        mode = st.radio("Visualização:", options=['Burn-up', 'Burn-down'], horizontal=True)
+    
+    if not grupo:
+        st.info("Selecione ao menos um grupo na barra lateral.")
+        return
+    
+    start_date, end_date = st.session_state.date_range
+    burnup = burnup_series(
+        get_board_index(),
+        start_date,
+        end_date,
+        transitions=get_transition_index(),
+        as_of=st.session_state.as_of
+    )
+    group_burnup = burnup[burnup['grupo'] == grupo]
+    
+    with stage('gráfico: burn-up'):
+        st.plotly_chart(
+            create_burnup_chart(group_burnup, title=f"{mode} - {grupo}", burndown=mode == 'Burn-down'),
+            use_container_width=True
+        )
+
+def display_cycle_time_analysis():
+    """Exibe os percentis de permanência por etapa, a partir do log de ações."""
+    st.markdown("**⏱️ Tempo de Ciclo por Etapa**")
+    
+    transitions = get_transition_index()
+    if transitions is None:
+        st.info("O export não contém o log de ações (actions) - exporte o board com as ações para ver o tempo de ciclo.")
+        return
+    
+    include_ongoing = st.checkbox(
+        "Incluir permanência atual",
+        help="Considera também o tempo que os cards estão na etapa atual até a data de referência"
+    )
+    
+    start_date, end_date = st.session_state.date_range
+    cycle_times = stage_cycle_times(
+        transitions,
+        get_board_index(),
+        st.session_state.as_of,
+        start_date=start_date,
+        end_date=end_date,
+        include_ongoing=include_ongoing,
+        lists=st.session_state.trello_data.get('lists', [])
+    )
+    cycle_times = [c for c in cycle_times if c.grupo in st.session_state.selected_groups]
+    
+    if not cycle_times:
+        st.info("Nenhuma movimentação entre etapas no período selecionado.")
+        return
+    
+    df = pd.DataFrame([asdict(c) for c in cycle_times])
+    with stage('gráfico: tempo de ciclo'):
+        st.plotly_chart(create_cycle_time_chart(df), use_container_width=True)
+    st.dataframe(
+        df.rename(columns={
+            'grupo': 'Grupo',
+            'etapa': 'Etapa',
+            'cards': 'Cards',
+            'intervals': 'Passagens',
+            'p50_days': 'p50 (dias)',
+            'p90_days': 'p90 (dias)'
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
+
+def display_aging_analysis():
+    """Exibe o histograma de envelhecimento dos cards em aberto."""
+    st.markdown("**⏳ Envelhecimento dos Cards**")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        by = st.radio(
+            "Agrupar por:",
+            options=['lista', 'grupo'],
+            format_func=str.capitalize,
+            horizontal=True
+        )
+    
+    with col2:
+        only_period = st.checkbox(
+            "Apenas cards criados no período",
+            help="Usa a data de criação codificada no ID de cada card"
+        )
+    
+    start_date, end_date = st.session_state.date_range if only_period else (None, None)
+    histogram = aging_histogram(
+        get_board_index(),
+        st.session_state.as_of,
+        by=by,
+        start_date=start_date,
+        end_date=end_date
+    )
+    
+    if histogram.empty:
+        st.info("Nenhum card em aberto com data de criação identificável.")
+        return
+    
+    with stage('gráfico: envelhecimento'):
+        st.plotly_chart(create_aging_chart(histogram), use_container_width=True)
+    st.dataframe(histogram, use_container_width=True)
 
 def display_charts_section():
     """Exibe seção de gráficos."""
@@ -648,13 +1387,13 @@ def display_charts_section():
     
     col1, col2 = st.columns(2)
     
-    with col1:
+    with col1, stage('gráfico: status'):
         # Gráfico de distribuição de status
         status_chart = create_status_distribution_chart()
         if status_chart:
             st.plotly_chart(status_chart, use_container_width=True)
     
-    with col2:
+    with col2, stage('gráfico: grupos'):
         # Gráfico de distribuição por grupos
         group_chart = create_group_distribution_chart()
         if group_chart:
@@ -706,17 +1445,197 @@ def display_welcome_screen():
     Use o botão **"🎯 Usar Dados de Exemplo"** na barra lateral para ver o sistema funcionando!
     """)
 
+def display_profiling_panel(profile: RunProfile):
+    """Tempos por etapa da última execução, na barra lateral."""
+    if not profile.stages:
+        return
+    
+    with st.sidebar.expander("⏱️ Tempos da Execução"):
+        st.caption(f"Execução de {profile.started_at.strftime('%H:%M:%S')}: {profile.total_ms:.0f} ms no total")
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    'Etapa': '↳ ' * timing['depth'] + timing['name'],
+                    'ms': round(timing['ms'], 1),
+                    'Chamadas': timing['calls'],
+                    'Linhas': timing['rows']
+                }
+                for timing in profile.rows()
+            ]),
+            use_container_width=True,
+            hide_index=True
+        )
+        st.download_button(
+            label="📥 Baixar JSON",
+            data=profile.to_json(),
+            file_name=f"tempos_{profile.started_at.strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json"
+        )
+
+def display_cprofile_panel():
+    """Perfil cProfile sob demanda do processamento, na barra lateral."""
+    with st.sidebar.expander("🔬 Perfil cProfile"):
+        # A captura desliga a opção (vale apenas para a próxima execução)
+        if st.session_state.pop('cprofile_captured', False):
+            st.session_state.cprofile_next_run = False
+        st.toggle(
+            "Perfilar próxima execução",
+            key='cprofile_next_run',
+            help="O próximo processamento (upload, reprocessamento ou troca de board) roda sob o cProfile"
+        )
+        
+        capture = st.session_state.get('cprofile_capture')
+        if capture is None:
+            return
+        
+        st.caption(f"{capture.label}: {capture.calls} chamadas em {capture.seconds * 1000:.0f} ms")
+        st.dataframe(
+            pd.DataFrame(capture.top)[['function', 'calls', 'cumtime_ms', 'tottime_ms']].rename(columns={
+                'function': 'Função',
+                'calls': 'Chamadas',
+                'cumtime_ms': 'Acumulado (ms)',
+                'tottime_ms': 'Próprio (ms)'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+        stamp = date.today().strftime('%Y%m%d')
+        st.download_button(
+            label="📥 Baixar .pstats",
+            data=capture.pstats_data,
+            file_name=f"perfil_{stamp}.pstats",
+            mime="application/octet-stream"
+        )
+        st.download_button(
+            label="📥 Baixar tabela CSV",
+            data=capture.top_csv(),
+            file_name=f"perfil_top_{stamp}.csv",
+            mime="text/csv"
+        )
+
+def display_memory_admin():
+    """Memória das sessões e dos processamentos do processo (abra o app com ?admin=1)."""
+    st.markdown("---")
+    st.header("🧠 Memória")
+    registry = memory_registry()
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Pico RSS do Processo", format_bytes(process_peak_rss()))
+    with col2:
+        st.metric("Sessões Ativas", len(registry.sessions()))
+    with col3:
+        registry.trace_runs = st.toggle(
+            "Medir pico por processamento",
+            value=registry.trace_runs,
+            help="Liga o tracemalloc durante cada processamento (para todas as sessões; deixa o processamento mais lento)"
+        )
+    
+    boards = shared_board_cache().stats()
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Boards Compartilhados", f"{boards['boards']} ({boards['in_use']} em uso)")
+    with col2:
+        st.metric("Cache de Boards", f"{format_bytes(boards['bytes'])} / {format_bytes(boards['max_bytes'])}")
+    with col3:
+        st.metric("Reaproveitados", boards['hits'], help=f"{boards['misses']} carregados, {boards['evictions']} removidos")
+    
+    if st.button("📏 Medir sessões", help="Percorre os artefatos de todas as sessões ativas"):
+        st.session_state.memory_measurement = (
+            registry.measure_sessions(), SessionMemory.measure(get_session_artifacts())
+        )
+    
+    measurement = st.session_state.get('memory_measurement')
+    if measurement is not None:
+        sessions, current = measurement
+        st.subheader("Sessões")
+        st.caption("Objetos compartilhados entre sessões entram apenas na primeira.")
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    'Sessão': report.session_id[:8] + (' (esta)' if report.session_id == current.session_id else ''),
+                    'Board': report.board_name,
+                    'Cards': report.cards,
+                    'Memória': format_bytes(report.total_bytes),
+                    'Atualizada': report.updated_at.strftime('%H:%M:%S')
+                }
+                for report in sessions
+            ]),
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        st.subheader("Artefatos desta Sessão")
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    'Artefato': artifact.name,
+                    'Tamanho': format_bytes(artifact.bytes),
+                    'Exclusivo': format_bytes(artifact.exclusive_bytes)
+                }
+                for artifact in current.artifacts if artifact.bytes >= 1024
+            ]),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    st.subheader("Processamentos Recentes")
+    if not registry.runs:
+        st.info("Nenhum processamento medido. Ligue \"Medir pico por processamento\" e reprocesse um board.")
+        return
+    st.dataframe(
+        pd.DataFrame([
+            {
+                'Board': run.board_name,
+                'Cards': run.cards,
+                'Pico (tracemalloc)': format_bytes(run.peak_bytes),
+                'Tempo (s)': round(run.seconds, 2),
+                'Concluído': run.finished_at.strftime('%H:%M:%S')
+            }
+            for run in registry.runs
+        ]),
+        use_container_width=True,
+        hide_index=True
+    )
+
 def main():
     """Função principal da aplicação."""
     # Inicializar estado
     init_session_state()
     
+    with profile_run('app') as profile:
+        render_app()
+    
+    get_board_lease()
+    update_session_artifacts()
+    export_metrics(profile)
+    display_profiling_panel(profile)
+    display_cprofile_panel()
+    
+    if st.query_params.get('admin') == '1':
+        display_memory_admin()
+
+def export_metrics(profile: RunProfile):
+    """Registra as etapas da execução e exporta as métricas (METRICS_PORT / METRICS_TEXTFILE)."""
+    observe_profile(profile)
+    watch_card_cache(shared_card_cache())
+    if METRICS_PORT:
+        try:
+            start_shared_metrics_server(METRICS_PORT, METRICS_HOST)
+        except OSError as e:
+            st.sidebar.warning(f"Servidor de métricas não iniciado: {e}")
+    if METRICS_TEXTFILE:
+        write_textfile(METRICS_TEXTFILE)
+
+def render_app():
+    """Monta a barra lateral e o conteúdo principal (uma execução do script)."""
     # Criar sidebar e obter arquivo carregado
     uploaded_file = create_sidebar()
     
     # Processar arquivo carregado
     if uploaded_file is not None:
         process_uploaded_file(uploaded_file)
+    refresh_session_reports()
     
     # Exibir conteúdo principal
     if st.session_state.trello_data is None:
@@ -724,6 +1643,7 @@ def main():
     else:
         display_header()
         display_metrics_overview()
+        display_comparison_section()
         
         # Seções principais
         display_charts_section()
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Interface de linha de comando do Trelliq Python.
+
+Uso:
+    python cli.py process board.json --start 2024-11-01 --end 2024-12-31
+    python cli.py process board.json --cprofile perfil.pstats --top 20
+    python cli.py process board.json --metrics-textfile /var/lib/node_exporter/trelliq.prom
+    python cli.py parity --engine indexed board.json --cards 2000
+    python cli.py windows board.json --weeks 52
+    python cli.py history save board.json
+    python cli.py history query BOARD_ID --start 2024-01-01 --status Atrasada
+    python cli.py diff semana-passada.json esta-semana.json
+    python cli.py watch exports/ --workers 4
+    python cli.py watch exports/ --metrics-port 9464
+    TRELLO_KEY=... TRELLO_TOKEN=... python cli.py fetch BOARD_ID --output board.json
+    TRELLO_KEY=... TRELLO_TOKEN=... python cli.py sync BOARD_ID --output board.json
+    python cli.py webhook serve board.json --port 8765
+    python cli.py webhook replay http://127.0.0.1:8765/webhook board.json --events 10000
+"""
+
+import argparse
+import json
+import os
+import sys
+from contextlib import nullcontext
+from dataclasses import asdict
+from datetime import date, timedelta
+from typing import List, Optional
+
+from src.data_processor import TrelloDataProcessor
+from src.config import (
+    PROCESSING_ENGINE, HISTORY_DB_PATH, WATCH_OUTPUT_DIR, WATCH_POLL_SECONDS, WATCH_DEBOUNCE_SECONDS, WATCH_WORKERS,
+    TRELLO_API_URL, SYNC_STATE_DIR, WEBHOOK_HOST, WEBHOOK_PORT, CPROFILE_TOP_N,
+    METRICS_HOST, METRICS_PORT, METRICS_TEXTFILE
+)
+
+def _parse_date(value: str) -> date:
+    """Converte argumento AAAA-MM-DD em date."""
+    return date.fromisoformat(value)
+
+def _load_board(path: str) -> dict:
+    """Carrega um export JSON do Trello."""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def _load_transitions(path: str):
+    """Índice de movimentações do export, lido do arquivo em fluxo (sem os dicts das ações)."""
+    from src.actions import ListTransitionIndex
+
+    return ListTransitionIndex.from_file(path)
+
+def cmd_process(args: argparse.Namespace) -> int:
+    """Processa um board sem interface e imprime o resumo em JSON."""
+    data = _load_board(args.board)
+    processor = TrelloDataProcessor(engine=args.engine, as_of=args.as_of)
+
+    is_valid, errors = processor.validate_trello_data(data)
+    if not is_valid:
+        for error in errors:
+            print(f"❌ {error}", file=sys.stderr)
+        return 1
+
+    def run():
+        task_reports = processor.generate_task_reports(
+            data, args.start, args.end, transitions=_load_transitions(args.board)
+        )
+        return processor.generate_report_summary(task_reports), processor.generate_collaborator_reports(task_reports)
+
+    from src.profiling import profile_run
+
+    # Etapas medidas apenas quando as métricas são gravadas
+    with (profile_run(args.board) if args.metrics_textfile else nullcontext()) as profile:
+        if args.cprofile:
+            from src.profiling import capture_cprofile
+
+            (summary, collaborator_reports), capture = capture_cprofile(run, label=args.board, top=args.top)
+            capture.write_pstats(args.cprofile)
+            print(f"🔬 {capture.calls} chamadas em {capture.seconds:.2f} s | perfil gravado em {args.cprofile}", file=sys.stderr)
+            print(capture.format_top(), file=sys.stderr)
+        else:
+            summary, collaborator_reports = run()
+
+    if profile is not None:
+        from src.metrics import observe_profile, record_board, write_textfile
+
+        record_board('cli', len(data.get('cards', [])), profile.total_ms / 1000)
+        observe_profile(profile)
+        write_textfile(args.metrics_textfile)
+
+    output = {
+        'summary': asdict(summary),
+        'collaborators': [
+            {k: v for k, v in asdict(report).items() if k != 'tasks'}
+            for report in collaborator_reports
+        ]
+    }
+    print(json.dumps(output, ensure_ascii=False, indent=2))
+    return 0
+
+def cmd_parity(args: argparse.Namespace) -> int:
+    """Compara um motor com a referência em boards gerados e reais."""
+    from src.parity import run_parity, generate_board
+
+    as_of = args.as_of or date.today()
+    runs = []
+    for seed in range(args.generated):
+        board = generate_board(args.cards, seed=seed, reference_date=as_of)
+        runs.append((board, as_of - timedelta(days=90), as_of, None))
+    for path in args.boards:
+        runs.append((_load_board(path), args.start, args.end, _load_transitions(path)))
+
+    all_ok = True
+    for data, start_date, end_date, transitions in runs:
+        report = run_parity(data, start_date, end_date, args.engine, repeat=args.repeat, as_of=as_of,
+                            transitions=transitions)
+        status = '✅ PARIDADE' if report.ok else f'❌ {len(report.mismatches)} DIVERGÊNCIAS'
+        print(f"{status} | {report.board_name} | {report.task_reports} reports | "
+              f"referência {report.reference_seconds * 1000:.1f} ms | "
+              f"{report.engine} {report.candidate_seconds * 1000:.1f} ms | "
+              f"speed-up {report.speedup:.1f}x")
+        for mismatch in report.mismatches[:args.max_mismatches]:
+            print(f"    {mismatch.path}: referência={mismatch.reference!r} candidato={mismatch.candidate!r}")
+        all_ok = all_ok and report.ok
+
+    return 0 if all_ok else 1
+
+def cmd_windows(args: argparse.Namespace) -> int:
+    """Gera os resumos semanais das últimas N semanas em uma única passada."""
+    from src.windows import weekly_windows
+
+    data = _load_board(args.board)
+    processor = TrelloDataProcessor(engine=args.engine, as_of=args.as_of)
+
+    is_valid, errors = processor.validate_trello_data(data)
+    if not is_valid:
+        for error in errors:
+            print(f"❌ {error}", file=sys.stderr)
+        return 1
+
+    windows = weekly_windows(args.end, args.weeks)
+    output = [
+        {
+            'start_date': window.start_date.isoformat(),
+            'end_date': window.end_date.isoformat(),
+            'summary': asdict(window.summary)
+        }
+        for window in processor.generate_window_reports(data, windows, transitions=_load_transitions(args.board))
+    ]
+    print(json.dumps(output, ensure_ascii=False, indent=2))
+    return 0
+
+def cmd_history_save(args: argparse.Namespace) -> int:
+    """Grava o board como snapshot no histórico."""
+    from src.history_store import HistoryStore, board_id_of
+
+    data = _load_board(args.board)
+    processor = TrelloDataProcessor(engine=args.engine, as_of=args.as_of)
+
+    is_valid, errors = processor.validate_trello_data(data)
+    if not is_valid:
+        for error in errors:
+            print(f"❌ {error}", file=sys.stderr)
+        return 1
+
+    with HistoryStore(args.db) as store:
+        snapshot_id = store.save_snapshot(
+            data, processor, snapshot_date=args.date, transitions=_load_transitions(args.board)
+        )
+    print(f"✅ Snapshot {snapshot_id} gravado | board {board_id_of(data)} | {args.db}")
+    return 0
+
+def cmd_history_list(args: argparse.Namespace) -> int:
+    """Lista os snapshots gravados."""
+    from src.history_store import HistoryStore
+
+    with HistoryStore(args.db) as store:
+        snapshots = store.snapshots(args.board_id)
+    print(snapshots.to_string(index=False) if not snapshots.empty else 'Nenhum snapshot gravado.')
+    return 0
+
+def cmd_history_query(args: argparse.Namespace) -> int:
+    """Consulta o histórico de um board e imprime as linhas (ou contagens) em JSON."""
+    from src.history_store import HistoryStore
+
+    with HistoryStore(args.db) as store:
+        if args.counts:
+            counts = store.status_counts(args.board_id, args.start, args.end, grupos=args.grupo)
+            output = {day: row.to_dict() for day, row in counts.iterrows()}
+        else:
+            rows = store.task_rows(
+                args.board_id, args.start, args.end, status=args.status, grupos=args.grupo,
+                due_from=args.due_from, due_to=args.due_to
+            )
+            output = rows.to_dict(orient='records')
+    print(json.dumps(output, ensure_ascii=False, indent=2, default=str))
+    return 0
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    """Compara dois exports do mesmo board e imprime as mudanças em JSON."""
+    from src.snapshot_diff import diff_snapshots
+
+    diff = diff_snapshots(
+        _load_board(args.previous),
+        _load_board(args.current),
+        previous_as_of=args.previous_as_of,
+        current_as_of=args.current_as_of
+    )
+    output = {
+        'previous_as_of': diff.previous_as_of.isoformat(),
+        'current_as_of': diff.current_as_of.isoformat(),
+        'counts': diff.counts(),
+        'unchanged_cards': diff.unchanged_cards,
+        'changes': [asdict(change) for change in diff.changes]
+    }
+    print(json.dumps(output, ensure_ascii=False, indent=2))
+    return 0
+
+def cmd_watch(args: argparse.Namespace) -> int:
+    """Monitora uma pasta de exports e processa os novos ou alterados."""
+    from src.watcher import DropFolderWatcher
+
+    watcher = DropFolderWatcher(
+        args.folder, output_dir=args.output, workers=args.workers,
+        debounce=0 if args.once else args.debounce, engine=args.engine, as_of=args.as_of,
+        metrics_textfile=args.metrics_textfile
+    )
+    print(f"👀 Monitorando {args.folder} -> {args.output}")
+    if args.metrics_port:
+        from src.metrics import start_shared_metrics_server
+
+        server = start_shared_metrics_server(args.metrics_port, args.metrics_host)
+        print(f"📈 Métricas em {server.url}")
+    try:
+        watcher.run(poll_interval=args.interval, once=args.once)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+def cmd_fetch(args: argparse.Namespace) -> int:
+    """Busca um board pela API do Trello e grava no formato do export."""
+    from src.trello_api import TrelloAPIError, fetch_board
+
+    record = {} if args.record else None
+    try:
+        fetched = fetch_board(
+            args.board_id, os.environ.get('TRELLO_KEY', ''), os.environ.get('TRELLO_TOKEN', ''),
+            base_url=args.base_url, record=record
+        )
+    except TrelloAPIError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(fetched.data, f, ensure_ascii=False)
+    if record is not None:
+        with open(args.record, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False)
+    print(
+        f"✅ {len(fetched.data['cards'])} cards, {len(fetched.data['actions'])} ações | "
+        f"{fetched.requests} requisições em {fetched.seconds:.2f} s -> {args.output}"
+    )
+    return 0
+
+def cmd_sync(args: argparse.Namespace) -> int:
+    """Sincroniza um board com as ações novas desde a última sincronização."""
+    from src.sync import sync_board
+    from src.trello_api import TrelloAPIError
+
+    try:
+        board_sync, result = sync_board(
+            args.board_id, os.environ.get('TRELLO_KEY', ''), os.environ.get('TRELLO_TOKEN', ''),
+            state_dir=args.state_dir, full=args.full, base_url=args.base_url
+        )
+    except TrelloAPIError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(board_sync.data, f, ensure_ascii=False)
+    mode = 'completa' if result.full else 'incremental'
+    print(
+        f"✅ Sincronização {mode}: {result.actions} ações, {len(result.changed_cards)} cards alterados, "
+        f"{len(result.removed_cards)} removidos | {result.requests} requisições em {result.seconds:.2f} s"
+    )
+    return 0
+
+def cmd_webhook_serve(args: argparse.Namespace) -> int:
+    """Recebe webhooks do Trello e mantém os contadores do board em memória."""
+    import time
+    from src.live_board import LiveBoardModel
+    from src.webhook import WebhookReceiver
+
+    data = _load_board(args.board)
+    model = LiveBoardModel(data, TrelloDataProcessor(engine=args.engine), as_of=args.as_of)
+    receiver = WebhookReceiver(
+        model, host=args.host, port=args.port, secret=args.secret, callback_url=args.callback_url
+    ).start()
+    print(f"⚡ Recebendo webhooks em {receiver.url} | contadores em /summary")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        receiver.stop()
+    return 0
+
+def cmd_webhook_replay(args: argparse.Namespace) -> int:
+    """Dispara eventos sintéticos de um board contra um receptor."""
+    from src.webhook import replay_events, synthetic_events
+
+    events = synthetic_events(_load_board(args.board), args.events, seed=args.seed)
+    stats = replay_events(
+        args.url, events, connections=args.connections, secret=args.secret, callback_url=args.callback_url
+    )
+    print(
+        f"✅ {stats.events} eventos em {stats.seconds:.2f} s "
+        f"({stats.events_per_second:.0f} eventos/s, {stats.errors} erros)"
+    )
+    return 1 if stats.errors else 0
+
+def build_parser() -> argparse.ArgumentParser:
+    """Monta o parser de argumentos."""
+    parser = argparse.ArgumentParser(description='Trelliq Python - relatórios Trello sem interface')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    process = subparsers.add_parser('process', help='Processa um export JSON do Trello')
+    process.add_argument('board', help='Arquivo JSON exportado do Trello')
+    process.add_argument('--start', type=_parse_date, default=date.today() - timedelta(days=30))
+    process.add_argument('--end', type=_parse_date, default=date.today())
+    process.add_argument('--engine', default=PROCESSING_ENGINE)
+    process.add_argument('--as-of', type=_parse_date, default=None, help='Data de referência para atrasos (padrão: hoje)')
+    process.add_argument('--cprofile', default=None, metavar='ARQUIVO.pstats',
+                         help='Perfila o processamento com cProfile e grava o .pstats')
+    process.add_argument('--top', type=int, default=CPROFILE_TOP_N, help='Funções listadas com --cprofile')
+    process.add_argument('--metrics-textfile', default=METRICS_TEXTFILE or None, metavar='ARQUIVO.prom',
+                         help='Grava as métricas do processamento no formato do Prometheus')
+    process.set_defaults(func=cmd_process)
+
+    windows = subparsers.add_parser('windows', help='Resumos semanais de vários períodos em uma passada')
+    windows.add_argument('board', help='Arquivo JSON exportado do Trello')
+    windows.add_argument('--weeks', type=int, default=52, help='Número de semanas')
+    windows.add_argument('--end', type=_parse_date, default=date.today(), help='Último dia da semana mais recente')
+    windows.add_argument('--engine', default=PROCESSING_ENGINE)
+    windows.add_argument('--as-of', type=_parse_date, default=None, help='Data de referência para atrasos (padrão: hoje)')
+    windows.set_defaults(func=cmd_windows)
+
+    diff = subparsers.add_parser('diff', help='Mudanças entre dois exports do mesmo board')
+    diff.add_argument('previous', help='Export anterior')
+    diff.add_argument('current', help='Export atual')
+    diff.add_argument('--previous-as-of', type=_parse_date, default=None, help='Data de referência do export anterior')
+    diff.add_argument('--current-as-of', type=_parse_date, default=None, help='Data de referência do export atual')
+    diff.set_defaults(func=cmd_diff)
+
+    history = subparsers.add_parser('history', help='Histórico de snapshots em SQLite')
+    history_commands = history.add_subparsers(dest='history_command', required=True)
+
+    history_save = history_commands.add_parser('save', help='Grava um export como snapshot')
+    history_save.add_argument('board', help='Arquivo JSON exportado do Trello')
+    history_save.add_argument('--date', type=_parse_date, default=None, help='Data do snapshot (padrão: data de referência)')
+    history_save.add_argument('--engine', default=PROCESSING_ENGINE)
+    history_save.add_argument('--as-of', type=_parse_date, default=None, help='Data de referência para atrasos (padrão: hoje)')
+    history_save.add_argument('--db', default=HISTORY_DB_PATH, help='Arquivo SQLite do histórico')
+    history_save.set_defaults(func=cmd_history_save)
+
+    history_list = history_commands.add_parser('list', help='Lista os snapshots gravados')
+    history_list.add_argument('board_id', nargs='?', default=None, help='Restringe a um board')
+    history_list.add_argument('--db', default=HISTORY_DB_PATH, help='Arquivo SQLite do histórico')
+    history_list.set_defaults(func=cmd_history_list)
+
+    history_query = history_commands.add_parser('query', help='Consulta linhas de tarefa do histórico')
+    history_query.add_argument('board_id', help='Board (id do export)')
+    history_query.add_argument('--start', type=_parse_date, default=None, help='Primeira data de snapshot')
+    history_query.add_argument('--end', type=_parse_date, default=None, help='Última data de snapshot')
+    history_query.add_argument('--status', action='append', default=None, help='Status (pode repetir)')
+    history_query.add_argument('--grupo', action='append', default=None, help='Grupo (pode repetir)')
+    history_query.add_argument('--due-from', type=_parse_date, default=None, help='Prazo a partir de')
+    history_query.add_argument('--due-to', type=_parse_date, default=None, help='Prazo até')
+    history_query.add_argument('--counts', action='store_true', help='Tarefas por status em cada snapshot')
+    history_query.add_argument('--db', default=HISTORY_DB_PATH, help='Arquivo SQLite do histórico')
+    history_query.set_defaults(func=cmd_history_query)
+
+    watch = subparsers.add_parser('watch', help='Processa os exports deixados em uma pasta')
+    watch.add_argument('folder', help='Pasta monitorada (*.json)')
+    watch.add_argument('--output', default=WATCH_OUTPUT_DIR, help='Pasta de saída lida pelo app')
+    watch.add_argument('--workers', type=int, default=WATCH_WORKERS, help='Processos no pool')
+    watch.add_argument('--interval', type=float, default=WATCH_POLL_SECONDS, help='Segundos entre varreduras')
+    watch.add_argument('--debounce', type=float, default=WATCH_DEBOUNCE_SECONDS, help='Segundos sem alteração antes de processar')
+    watch.add_argument('--once', action='store_true', help='Processa o que estiver na pasta e sai')
+    watch.add_argument('--engine', default=PROCESSING_ENGINE)
+    watch.add_argument('--as-of', type=_parse_date, default=None, help='Data de referência para atrasos (padrão: hoje)')
+    watch.add_argument('--metrics-port', type=int, default=METRICS_PORT, help='Porta de GET /metrics (Prometheus)')
+    watch.add_argument('--metrics-host', default=METRICS_HOST, help='Endereço do servidor de métricas')
+    watch.add_argument('--metrics-textfile', default=METRICS_TEXTFILE, metavar='ARQUIVO.prom',
+                       help='Arquivo de métricas regravado após cada lote')
+    watch.set_defaults(func=cmd_watch)
+
+    fetch = subparsers.add_parser('fetch', help='Busca um board pela API do Trello (TRELLO_KEY/TRELLO_TOKEN)')
+    fetch.add_argument('board_id', help='Id ou shortLink do board')
+    fetch.add_argument('--output', default='board.json', help='Arquivo JSON de saída')
+    fetch.add_argument('--base-url', default=TRELLO_API_URL, help='URL base da API')
+    fetch.add_argument('--record', default=None, help='Grava as respostas para replay (trello_replay.ReplayServer.from_file)')
+    fetch.set_defaults(func=cmd_fetch)
+
+    sync = subparsers.add_parser('sync', help='Sincroniza um board pelas ações novas (TRELLO_KEY/TRELLO_TOKEN)')
+    sync.add_argument('board_id', help='Id ou shortLink do board')
+    sync.add_argument('--output', default=None, help='Grava o board sincronizado em JSON')
+    sync.add_argument('--state-dir', default=SYNC_STATE_DIR, help='Pasta do estado da sincronização')
+    sync.add_argument('--full', action='store_true', help='Ignora o cursor e busca o board inteiro')
+    sync.add_argument('--base-url', default=TRELLO_API_URL, help='URL base da API')
+    sync.set_defaults(func=cmd_sync)
+
+    webhook = subparsers.add_parser('webhook', help='Receptor de webhooks do Trello e gerador de carga')
+    webhook_commands = webhook.add_subparsers(dest='webhook_command', required=True)
+
+    webhook_serve = webhook_commands.add_parser('serve', help='Recebe webhooks e mantém contadores ao vivo')
+    webhook_serve.add_argument('board', help='Export inicial do board')
+    webhook_serve.add_argument('--host', default=WEBHOOK_HOST)
+    webhook_serve.add_argument('--port', type=int, default=WEBHOOK_PORT)
+    webhook_serve.add_argument('--secret', default=None, help='Segredo do app do Trello (confere as assinaturas)')
+    webhook_serve.add_argument('--callback-url', default=None, help='URL registrada no webhook')
+    webhook_serve.add_argument('--engine', default=PROCESSING_ENGINE)
+    webhook_serve.add_argument('--as-of', type=_parse_date, default=None, help='Data de referência fixa (padrão: hoje)')
+    webhook_serve.set_defaults(func=cmd_webhook_serve)
+
+    webhook_replay = webhook_commands.add_parser('replay', help='Dispara eventos sintéticos contra um receptor')
+    webhook_replay.add_argument('url', help='URL do receptor')
+    webhook_replay.add_argument('board', help='Export do board usado para gerar os eventos')
+    webhook_replay.add_argument('--events', type=int, default=10000)
+    webhook_replay.add_argument('--connections', type=int, default=8)
+    webhook_replay.add_argument('--seed', type=int, default=0)
+    webhook_replay.add_argument('--secret', default=None, help='Assina os payloads com este segredo')
+    webhook_replay.add_argument('--callback-url', default=None, help='URL usada na assinatura')
+    webhook_replay.set_defaults(func=cmd_webhook_replay)
+
+    parity = subparsers.add_parser('parity', help='Compara um motor com o motor de referência')
+    parity.add_argument('boards', nargs='*', help='Exports reais do Trello a incluir na comparação')
+    parity.add_argument('--engine', default='indexed')
+    parity.add_argument('--generated', type=int, default=3, help='Número de boards sintéticos')
+    parity.add_argument('--cards', type=int, default=1000, help='Cards por board sintético')
+    parity.add_argument('--start', type=_parse_date, default=date(2000, 1, 1))
+    parity.add_argument('--end', type=_parse_date, default=date(2100, 12, 31))
+    parity.add_argument('--repeat', type=int, default=3)
+    parity.add_argument('--as-of', type=_parse_date, default=None, help='Data de referência para atrasos (padrão: hoje)')
+    parity.add_argument('--max-mismatches', type=int, default=20)
+    parity.set_defaults(func=cmd_parity)
+
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada da CLI."""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
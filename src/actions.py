@@ -0,0 +1,332 @@
+"""
+Ingestão do log de ações (actions) do export do Trello.
+
+Lê as ações em fluxo, guardando apenas colunas compactas (card, instante e
+lista de destino) em vez dos dicts originais, e monta um índice de transições
+de lista por card ordenado no tempo. A partir dele obtém-se a data real de
+conclusão: a entrada do card em uma lista FEITO/FEITOS.
+"""
+
+import json
+import re
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+
+import numpy as np
+
+from .config import GRUPOS_MARKETING
+from .profiling import timed_stage
+
+# Ações que colocam um card em uma lista sem listBefore/listAfter
+CARD_CREATION_ACTIONS = {'createCard', 'copyCard', 'moveCardToBoard', 'convertToCardFromCheckItem', 'emailCard'}
+
+# Nomes de lista que marcam a conclusão (etapa_feito dos grupos)
+DONE_LIST_NAMES = sorted({etapa for grupo in GRUPOS_MARKETING for etapa in grupo.etapa_feito})
+
+# Quantidade de datas convertidas por lote ao ingerir
+_DATE_BATCH_SIZE = 65536
+
+# Valor de NaT em milissegundos (data de ação inválida)
+_NAT_MS = np.datetime64('NaT', 'ms').astype(np.int64)
+
+_ACTIONS_KEY = re.compile(r'"actions"\s*:\s*\[')
+
+def is_done_list_name(list_name: Optional[str]) -> bool:
+    """Verifica se a lista é uma etapa FEITO/FEITOS."""
+    if not list_name:
+        return False
+    list_name_upper = list_name.upper()
+    return any(etapa in list_name_upper for etapa in DONE_LIST_NAMES)
+
+def iter_actions_from_file(path: str, chunk_size: int = 1 << 20) -> Iterator[Dict[str, Any]]:
+    """
+    Lê o array 'actions' de um export do Trello uma ação por vez.
+
+    O arquivo é lido em blocos e cada ação é decodificada isoladamente, de
+    modo que nunca há mais que um bloco e uma ação em memória.
+
+    Args:
+        path: Caminho do export JSON
+        chunk_size: Tamanho dos blocos lidos do disco
+
+    Yields:
+        Dict de cada ação
+    """
+    decoder = json.JSONDecoder()
+
+    with open(path, encoding='utf-8') as f:
+        buffer = ''
+        eof = False
+
+        # Localiza o início do array "actions"
+        while True:
+            match = _ACTIONS_KEY.search(buffer)
+            if match:
+                buffer = buffer[match.end():]
+                break
+            if eof:
+                return
+            # Mantém o final do bloco caso a chave esteja dividida entre leituras
+            buffer = buffer[-32:]
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+
+            if position < len(buffer) and buffer[position] == ']':
+                return
+
+            try:
+                action, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                buffer = buffer[position:]
+                position = 0
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+
+            yield action
+            position = end
+
+class ListTransitionIndex:
+    """
+    Índice colunar de movimentações de cards entre listas.
+
+    IDs de cards e listas são internados como inteiros; cada transição ocupa
+    três colunas (card, instante em ms, lista de destino). Após finalize(), as
+    colunas ficam ordenadas por (card, instante) com offsets por card.
+    """
+
+    def __init__(self):
+        """Inicializa um índice vazio."""
+        self.card_ids: List[str] = []
+        self.list_ids: List[str] = []
+        self.list_names: Dict[str, str] = {}
+        self._card_codes: Dict[str, int] = {}
+        self._list_codes: Dict[str, int] = {}
+        self._cards = array('i')
+        self._lists = array('i')
+        self._times = array('q')
+        self._pending_dates: List[str] = []
+
+        self.cards: Optional[np.ndarray] = None
+        self.times: Optional[np.ndarray] = None
+        self.lists: Optional[np.ndarray] = None
+        self.offsets: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        # Após finalize(), sem as movimentações de data inválida
+        return len(self._cards) if self.cards is None else len(self.cards)
+
+    @classmethod
+    @timed_stage('índice de movimentações')
+    def from_actions(cls, actions: Iterable[Dict[str, Any]]) -> 'ListTransitionIndex':
+        """Constrói o índice a partir de um iterável de ações."""
+        index = cls()
+        index.ingest(actions)
+        return index.finalize()
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> Optional['ListTransitionIndex']:
+        """Constrói o índice a partir do JSON já carregado (None se não houver ações)."""
+        if not data.get('actions'):
+            return None
+        return cls.from_actions(data['actions'])
+
+    @classmethod
+    def from_file(cls, path: str) -> 'ListTransitionIndex':
+        """Constrói o índice lendo as ações do arquivo em fluxo."""
+        return cls.from_actions(iter_actions_from_file(path))
+
+    def add(self, action: Dict[str, Any]) -> bool:
+        """
+        Registra uma ação se ela colocar um card em uma lista.
+
+        Os nomes de lista guardados são os da primeira ação em que a lista
+        aparece - no export do Trello, a mais recente.
+
+        Args:
+            action: Ação do Trello
+
+        Returns:
+            True se a ação gerou uma transição
+        """
+        data = action.get('data') or {}
+        card_id = (data.get('card') or {}).get('id')
+        target = data.get('listAfter')
+        if target is None and action.get('type') in CARD_CREATION_ACTIONS:
+            target = data.get('list')
+        list_id = target.get('id') if target else None
+        moment = action.get('date')
+
+        if not card_id or not list_id or not moment or not isinstance(moment, str):
+            return False
+
+        card_code = self._card_codes.get(card_id)
+        if card_code is None:
+            card_code = self._card_codes[card_id] = len(self.card_ids)
+            self.card_ids.append(card_id)
+
+        list_code = self._list_codes.get(list_id)
+        if list_code is None:
+            list_code = self._list_codes[list_id] = len(self.list_ids)
+            self.list_ids.append(list_id)
+        if list_id not in self.list_names and target.get('name'):
+            self.list_names[list_id] = target['name']
+
+        list_before = data.get('listBefore')
+        if list_before and list_before.get('name') and list_before.get('id') not in self.list_names:
+            self.list_names[list_before['id']] = list_before['name']
+
+        self._cards.append(card_code)
+        self._lists.append(list_code)
+        self._pending_dates.append(moment.rstrip('Z'))
+        if len(self._pending_dates) >= _DATE_BATCH_SIZE:
+            self._flush_dates()
+        return True
+
+    def ingest(self, actions: Iterable[Dict[str, Any]]) -> 'ListTransitionIndex':
+        """Registra todas as ações de um iterável (consumido em fluxo)."""
+        for action in actions:
+            self.add(action)
+        return self
+
+    def _flush_dates(self) -> None:
+        """Converte em lote as datas pendentes para milissegundos (NaT nas inválidas)."""
+        if self._pending_dates:
+            try:
+                parsed = np.array(self._pending_dates, dtype='datetime64[ms]')
+            except ValueError:
+                # Alguma data inválida no lote: converte uma a uma
+                parsed = np.array([_parse_moment(value) for value in self._pending_dates], dtype='datetime64[ms]')
+            self._times.extend(parsed.astype(np.int64).tolist())
+            self._pending_dates = []
+
+    def finalize(self) -> 'ListTransitionIndex':
+        """Ordena as transições por (card, instante) e calcula os offsets por card."""
+        self._flush_dates()
+
+        cards = np.frombuffer(self._cards, dtype=np.int32) if len(self._cards) else np.array([], dtype=np.int32)
+        times = np.frombuffer(self._times, dtype=np.int64) if len(self._times) else np.array([], dtype=np.int64)
+        lists = np.frombuffer(self._lists, dtype=np.int32) if len(self._lists) else np.array([], dtype=np.int32)
+
+        # Movimentações com data inválida são descartadas (como em parse_trello_date)
+        valid = times != _NAT_MS
+        if not valid.all():
+            cards, times, lists = cards[valid], times[valid], lists[valid]
+
+        order = np.lexsort((times, cards))
+        self.cards = cards[order]
+        self.times = times[order]
+        self.lists = lists[order]
+        self.offsets = np.searchsorted(self.cards, np.arange(len(self.card_ids) + 1))
+        return self
+
+    def list_name(self, list_id: str) -> Optional[str]:
+        """Nome conhecido de uma lista (pelas ações)."""
+        return self.list_names.get(list_id)
+
+    def transitions(self, card_id: str) -> List[Tuple[datetime, str]]:
+        """
+        Movimentações de um card em ordem cronológica.
+
+        Args:
+            card_id: ID do card
+
+        Returns:
+            Lista de (instante UTC, ID da lista de destino)
+        """
+        code = self._card_codes.get(card_id)
+        if code is None:
+            return []
+        start, end = self.offsets[code], self.offsets[code + 1]
+        return [
+            (_from_ms(ms), self.list_ids[list_code])
+            for ms, list_code in zip(self.times[start:end].tolist(), self.lists[start:end].tolist())
+        ]
+
+    def done_list_codes(self, lists: Optional[List[Dict[str, Any]]] = None) -> List[int]:
+        """
+        Códigos internos das listas FEITO/FEITOS.
+
+        Args:
+            lists: Listas do board (complementam os nomes vistos nas ações)
+
+        Returns:
+            Lista de códigos de lista
+        """
+        names = dict(self.list_names)
+        for lista in lists or []:
+            names.setdefault(lista['id'], lista['name'])
+        return [code for code, list_id in enumerate(self.list_ids) if is_done_list_name(names.get(list_id))]
+
+    def last_rows_in(self, list_codes: List[int]) -> np.ndarray:
+        """
+        Última transição de cada card para uma das listas informadas.
+
+        Args:
+            list_codes: Códigos das listas de destino
+
+        Returns:
+            Índices das linhas (ordenados por card)
+        """
+        rows = np.flatnonzero(np.isin(self.lists, list_codes))
+        if len(rows) == 0:
+            return rows
+        row_cards = self.cards[rows]
+        return rows[np.r_[row_cards[1:] != row_cards[:-1], True]]
+
+    def first_rows_in(self, list_codes: List[int]) -> np.ndarray:
+        """
+        Primeira transição de cada card para uma das listas informadas.
+
+        Args:
+            list_codes: Códigos das listas de destino
+
+        Returns:
+            Índices das linhas (ordenados por card)
+        """
+        rows = np.flatnonzero(np.isin(self.lists, list_codes))
+        if len(rows) == 0:
+            return rows
+        row_cards = self.cards[rows]
+        return rows[np.r_[True, row_cards[1:] != row_cards[:-1]]]
+
+    def completion_times(self, lists: Optional[List[Dict[str, Any]]] = None) -> Dict[str, datetime]:
+        """
+        Data real de conclusão de cada card: a última entrada em uma lista FEITO/FEITOS.
+
+        Args:
+            lists: Listas do board (complementam os nomes vistos nas ações)
+
+        Returns:
+            Dict card_id -> instante UTC da conclusão
+        """
+        done_codes = self.done_list_codes(lists)
+        if not done_codes or len(self.cards) == 0:
+            return {}
+
+        last_rows = self.last_rows_in(done_codes)
+        return {
+            self.card_ids[card_code]: _from_ms(ms)
+            for card_code, ms in zip(self.cards[last_rows].tolist(), self.times[last_rows].tolist())
+        }
+
+def _parse_moment(value: str) -> np.datetime64:
+    """Converte a data de uma ação (NaT se inválida)."""
+    try:
+        return np.datetime64(value, 'ms')
+    except ValueError:
+        return np.datetime64('NaT', 'ms')
+
+def _from_ms(ms: int) -> datetime:
+    """Converte milissegundos desde a época Unix para datetime UTC."""
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
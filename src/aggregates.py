@@ -0,0 +1,194 @@
+"""
+Resumos mantidos incrementalmente (visões materializadas).
+
+SummaryAggregate guarda os contadores que compõem o ReportSummary - total,
+concluídas, em andamento, atrasadas, bloqueadas, entregas no prazo e com
+atraso, soma e quantidade dos atrasos em dias úteis - no geral e por grupo,
+mais a contagem de colaboradores. A mudança de um card entra como
+apply(antes, depois): a contribuição antiga sai, a nova entra, em tempo
+proporcional às linhas do card e não ao tamanho do board.
+
+A contribuição de um card (card_summary) segue a deduplicação dos resumos:
+no geral vale a primeira linha do card; em cada grupo, a primeira linha
+daquele grupo. O recálculo completo (generate_report_summary) fica apenas
+como conferência (SummaryAggregate.mismatches).
+"""
+
+from collections import Counter
+from dataclasses import dataclass, fields
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .config import GRUPOS_MARKETING, NO_GROUP
+from .data_processor import TaskReport, GroupReportSummary, ReportSummary, TrelloDataProcessor
+
+# Status considerados na média de atraso em dias úteis
+LATE_STATUSES = ('Atrasada', 'Em Andamento')
+
+Tally = Tuple[Tuple[str, int], ...]
+
+def row_tally(row: TaskReport) -> Tally:
+    """Medidas de uma linha de relatório (a linha que o resumo considera para o card)."""
+    tally = [('total', 1), (row.status, 1)]
+    if row.status == 'Concluída' and row.due_date != 'Não definida':
+        if row.days_late == 0:
+            tally.append(('on_time', 1))
+        elif row.days_late > 0:
+            tally.append(('late_deliveries', 1))
+    if row.days_late > 0 and row.status in LATE_STATUSES:
+        tally += [('late_days_sum', row.business_days_late), ('late_days_count', 1)]
+    return tuple(tally)
+
+@dataclass(frozen=True)
+class CardSummary:
+    """Contribuição de um card para o resumo."""
+    tally: Tally
+    groups: Tuple[Tuple[str, Tally], ...]
+    collaborators: Tuple[str, ...]
+
+def card_summary(rows: List[TaskReport]) -> Optional[CardSummary]:
+    """
+    Contribuição de um card a partir das suas linhas de relatório.
+
+    Args:
+        rows: Linhas do card (as de um mesmo task_id, na ordem do relatório)
+
+    Returns:
+        CardSummary ou None se o card não tem linhas
+    """
+    if not rows:
+        return None
+
+    first = rows[0]
+    groups: Dict[str, Tally] = {}
+    for row in rows:
+        grupo = row.grupo or NO_GROUP
+        if grupo not in groups:
+            groups[grupo] = row_tally(row)
+
+    if ',' in first.collaborator_name:
+        collaborators = tuple(dict.fromkeys(name.strip() for name in first.collaborator_name.split(',')))
+    else:
+        collaborators = (first.collaborator_name,)
+    return CardSummary(row_tally(first), tuple(groups.items()), collaborators)
+
+def _average(counter: Counter) -> int:
+    count = counter['late_days_count']
+    return round(counter['late_days_sum'] / count) if count else 0
+
+class SummaryAggregate:
+    """Contadores do ReportSummary atualizados por diferença, card a card."""
+
+    def __init__(self):
+        self.totals: Counter = Counter()
+        self.groups: Dict[str, Counter] = {}
+        self.collaborators: Counter = Counter()
+
+    @classmethod
+    def from_reports(cls, task_reports: Iterable[TaskReport]) -> 'SummaryAggregate':
+        """Monta o agregado a partir de relatórios já gerados."""
+        rows_by_task: Dict[str, List[TaskReport]] = {}
+        for row in task_reports:
+            rows_by_task.setdefault(row.task_id, []).append(row)
+
+        aggregate = cls()
+        for rows in rows_by_task.values():
+            aggregate.apply(None, card_summary(rows))
+        return aggregate
+
+    @staticmethod
+    def _add(counter: Counter, tally: Tally, sign: int):
+        for key, value in tally:
+            counter[key] += sign * value
+            if counter[key] == 0:
+                del counter[key]
+
+    def _count(self, card: Optional[CardSummary], sign: int):
+        if card is None:
+            return
+        self._add(self.totals, card.tally, sign)
+        for grupo, tally in card.groups:
+            counter = self.groups.setdefault(grupo, Counter())
+            self._add(counter, tally, sign)
+            if not counter:
+                del self.groups[grupo]
+        self._add(self.collaborators, tuple((name, 1) for name in card.collaborators), sign)
+
+    def apply(self, card_before: Optional[CardSummary], card_after: Optional[CardSummary]):
+        """
+        Aplica a mudança de um card.
+
+        Args:
+            card_before: Contribuição anterior (None para card novo)
+            card_after: Contribuição atual (None para card removido ou fora do relatório)
+        """
+        if card_before == card_after:
+            return
+        self._count(card_before, -1)
+        self._count(card_after, +1)
+
+    def _group_summary(self, grupo: str, responsaveis: List[str]) -> GroupReportSummary:
+        counter = self.groups.get(grupo, Counter())
+        return GroupReportSummary(
+            grupo=grupo,
+            responsaveis=responsaveis,
+            total_tasks=counter['total'],
+            completed_tasks=counter['Concluída'],
+            in_progress_tasks=counter['Em Andamento'],
+            late_tasks=counter['Atrasada'],
+            blocked_tasks=counter['Bloqueada'],
+            on_time_deliveries=counter['on_time'],
+            late_deliveries=counter['late_deliveries'],
+            average_business_days_late=_average(counter)
+        )
+
+    def summary(self) -> ReportSummary:
+        """ReportSummary atual (igual ao de generate_report_summary sobre os mesmos relatórios)."""
+        group_summaries = [
+            self._group_summary(grupo.name, [r.nome for r in grupo.responsaveis]) for grupo in GRUPOS_MARKETING
+        ]
+        if NO_GROUP in self.groups:
+            group_summaries.append(self._group_summary(NO_GROUP, []))
+
+        return ReportSummary(
+            total_tasks=self.totals['total'],
+            completed_tasks=self.totals['Concluída'],
+            in_progress_tasks=self.totals['Em Andamento'],
+            late_tasks=self.totals['Atrasada'],
+            overdue_tasks=self.totals['Atrasada'],
+            blocked_tasks=self.totals['Bloqueada'],
+            total_collaborators=len(self.collaborators),
+            group_summaries=group_summaries,
+            average_business_days_late=_average(self.totals)
+        )
+
+    def mismatches(self, task_reports: List[TaskReport],
+                   processor: Optional[TrelloDataProcessor] = None) -> List[str]:
+        """
+        Confere o agregado contra o recálculo completo.
+
+        Args:
+            task_reports: Relatórios atuais do board
+            processor: Processador usado no recálculo
+
+        Returns:
+            Campos divergentes ('grupo.campo' nos grupos); vazio se consistente
+        """
+        expected = (processor or TrelloDataProcessor()).generate_report_summary(task_reports)
+        actual = self.summary()
+        differences = [
+            f.name for f in fields(ReportSummary)
+            if f.name != 'group_summaries' and getattr(actual, f.name) != getattr(expected, f.name)
+        ]
+
+        actual_groups = {group.grupo: group for group in actual.group_summaries}
+        for group in expected.group_summaries:
+            current = actual_groups.pop(group.grupo, None)
+            if current is None:
+                differences.append(group.grupo)
+                continue
+            differences += [
+                f'{group.grupo}.{f.name}' for f in fields(GroupReportSummary)
+                if getattr(current, f.name) != getattr(group, f.name)
+            ]
+        differences += list(actual_groups)
+        return differences
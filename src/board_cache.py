@@ -0,0 +1,190 @@
+"""
+Boards compartilhados entre as sessões do processo.
+
+Cada sessão do app guardava a sua cópia do board decodificado; quando várias
+pessoas abrem o mesmo export, o processo mantinha uma cópia por sessão. O
+SharedBoardCache guarda cada board uma única vez, endereçado pelo SHA-256 do
+conteúdo do arquivo (o mesmo hash do manifesto do watcher), junto com os
+índices derivados dele (BoardIndex, ListTransitionIndex), que também passam a
+ser construídos uma vez por board.
+
+As sessões recebem um BoardLease; enquanto houver lease o board fica fixo no
+cache. Sem leases, o board continua disponível para reaproveitamento e sai
+por LRU quando o total passa de BOARD_CACHE_MAX_BYTES. O lease é liberado ao
+ser substituído ou quando a sessão é descartada (weakref.finalize), sem
+depender de um evento de encerramento da sessão.
+
+Os boards e índices do cache são compartilhados: não devem ser alterados no
+lugar (quem precisa alterar, como a sincronização incremental, trabalha em
+uma cópia).
+"""
+
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+from .config import BOARD_CACHE_MAX_BYTES
+from .memory import deep_sizeof
+
+def content_key(raw: bytes) -> str:
+    """Chave de um export: SHA-256 do conteúdo (igual a watcher.file_content_hash)."""
+    return hashlib.sha256(raw).hexdigest()
+
+def _board_ids(data: Dict[str, Any]) -> Set[int]:
+    """Ids do board e dos seus elementos de topo (já contados no board, não nos índices)."""
+    ids = {id(data)}
+    for value in data.values():
+        ids.add(id(value))
+        if isinstance(value, list):
+            ids.update(id(item) for item in value)
+    return ids
+
+class BoardEntry:
+    """Board decodificado, índices derivados e contagem de leases."""
+
+    def __init__(self, key: str, data: Dict[str, Any]):
+        self.key = key
+        self.data = data
+        self.derived: Dict[Hashable, Any] = {}
+        self.bytes = deep_sizeof(data)
+        self.leases = 0
+        self.hits = 0
+
+class BoardLease:
+    """Uso de um board do cache por uma sessão (liberado ao ser descartado)."""
+
+    def __init__(self, cache: 'SharedBoardCache', entry: BoardEntry):
+        self._cache = cache
+        self.entry = entry
+        self._finalizer = weakref.finalize(self, cache._release, entry)
+
+    @property
+    def key(self) -> str:
+        return self.entry.key
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        return self.entry.data
+
+    def derived(self, name: Hashable, build: Callable[[], Any]) -> Any:
+        """Índice derivado do board (construído na primeira chamada, por qualquer sessão)."""
+        return self._cache.derived(self.entry, name, build)
+
+    def release(self):
+        self._finalizer()
+
+class SharedBoardCache:
+    """Boards endereçados por conteúdo, com orçamento em bytes, LRU e contagem de leases."""
+
+    def __init__(self, max_bytes: int = BOARD_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[str, BoardEntry]' = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry.bytes for entry in self._entries.values())
+
+    def acquire(self, key: str, load: Optional[Callable[[], Dict[str, Any]]] = None) -> Optional[BoardLease]:
+        """
+        Lease do board `key`.
+
+        Args:
+            key: Chave do conteúdo (content_key)
+            load: Decodifica o board quando ele não está no cache (fora do lock)
+
+        Returns:
+            BoardLease, ou None se o board não está no cache e load não foi informado
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.leases += 1
+                entry.hits += 1
+                self.hits += 1
+                return BoardLease(self, entry)
+        if load is None:
+            return None
+
+        entry = BoardEntry(key, load())
+        with self._lock:
+            # Outra sessão pode ter carregado o mesmo board enquanto este era decodificado
+            entry = self._entries.setdefault(key, entry)
+            self.misses += 1
+            self._entries.move_to_end(key)
+            entry.leases += 1
+            self._evict()
+            return BoardLease(self, entry)
+
+    def derived(self, entry: BoardEntry, name: Hashable, build: Callable[[], Any]) -> Any:
+        """Índice derivado de um board do cache; o tamanho dele entra no orçamento."""
+        value = entry.derived.get(name)
+        if value is not None:
+            return value
+
+        value = build()
+        size = deep_sizeof(value, _board_ids(entry.data))
+        with self._lock:
+            if name in entry.derived:
+                return entry.derived[name]
+            entry.derived[name] = value
+            if self._entries.get(entry.key) is entry:
+                entry.bytes += size
+                self._evict()
+        return value
+
+    def _release(self, entry: BoardEntry):
+        with self._lock:
+            entry.leases -= 1
+            if self._entries.get(entry.key) is entry:
+                self._evict()
+
+    def _evict(self):
+        """Remove boards sem leases, do menos recente ao mais recente, até caber no orçamento."""
+        total = self.total_bytes
+        for key in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            if entry.leases > 0:
+                continue
+            del self._entries[key]
+            total -= entry.bytes
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Números do cache (painel de administração)."""
+        with self._lock:
+            return {
+                'boards': len(self._entries),
+                'in_use': sum(1 for entry in self._entries.values() if entry.leases > 0),
+                'leases': sum(entry.leases for entry in self._entries.values()),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+_shared_cache: Optional[SharedBoardCache] = None
+_shared_lock = threading.Lock()
+
+def shared_board_cache() -> SharedBoardCache:
+    """Cache de boards do processo (compartilhado entre as sessões do app)."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = SharedBoardCache()
+        return _shared_cache
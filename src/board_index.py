@@ -0,0 +1,328 @@
+"""
+Índice do board Trello - estruturas pré-computadas para motores de processamento.
+
+Resolve uma única vez tudo que a implementação de referência recalcula card a
+card: busca de listas e membros, classificação de status por lista, grupo de
+cada responsável e datas já convertidas.
+"""
+
+from datetime import datetime, date
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .config import (
+    LIST_STATUS_MAP, COMPLETED_LIST_KEYWORDS, NO_GROUP, GrupoMarketing,
+    get_grupo_por_responsavel
+)
+from .profiling import timed_stage
+
+# Lista em que criadores de conteúdo ainda estão trabalhando na tarefa
+CONTENT_LIST_NAME = 'EM PROCESSO DE CONTEÚDO'
+MISSING_LIST_NAME = 'Lista não encontrada'
+
+# IDs do Trello anteriores a 2011-01-01 não são ObjectIds reais
+MIN_OBJECT_ID_TIMESTAMP = 1293840000
+
+_HEX_VALUES = np.full(256, -1, dtype=np.int64)
+for _digit, _char in enumerate(b'0123456789abcdef'):
+    _HEX_VALUES[_char] = _digit
+    _HEX_VALUES[bytes([_char]).upper()[0]] = _digit
+_HEX_WEIGHTS = 16 ** np.arange(7, -1, -1, dtype=np.int64)
+
+def parse_trello_date(value: Optional[str]) -> Optional[date]:
+    """Converte data ISO do Trello para date (None se ausente ou inválida)."""
+    if not value:
+        return None
+
+    try:
+        if value.endswith('Z'):
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).date()
+        return datetime.fromisoformat(value).date()
+    except (ValueError, TypeError):
+        return None
+
+def decode_object_id_timestamps(ids: Sequence[Optional[str]]) -> np.ndarray:
+    """
+    Extrai de uma vez o instante de criação codificado nos IDs do Trello.
+
+    Os IDs são ObjectIds de 24 caracteres hexadecimais cujos 8 primeiros
+    representam os segundos desde a época Unix.
+
+    Args:
+        ids: IDs dos cards (ou de qualquer objeto do Trello)
+
+    Returns:
+        Array datetime64[s] com NaT para IDs que não são ObjectIds
+    """
+    if len(ids) == 0:
+        return np.array([], dtype='datetime64[s]')
+
+    full_ids = np.asarray(ids, dtype=str)
+    try:
+        prefixes = full_ids.astype('U8').astype('S8')
+    except UnicodeEncodeError:
+        prefixes = np.array([i[:8].encode('ascii', 'replace') for i in full_ids], dtype='S8')
+
+    digits = _HEX_VALUES[prefixes.view(np.uint8).reshape(-1, 8)]
+    seconds = digits @ _HEX_WEIGHTS
+    valid = (
+        (np.char.str_len(full_ids) == 24) &
+        (digits >= 0).all(axis=1) &
+        (seconds >= MIN_OBJECT_ID_TIMESTAMP)
+    )
+
+    timestamps = np.full(len(full_ids), np.datetime64('NaT'), dtype='datetime64[s]')
+    timestamps[valid] = seconds[valid].astype('datetime64[s]')
+    return timestamps
+
+def card_created_at(cards: List[Dict[str, Any]], timestamps: Optional[np.ndarray] = None) -> List[str]:
+    """
+    Data de criação (ISO, formato do Trello) de cada card, decodificada do ID.
+
+    Cards cujo ID não é um ObjectId mantêm o comportamento antigo e usam
+    dateLastActivity.
+
+    Args:
+        cards: Cards do Trello
+        timestamps: Instantes já decodificados (evita decodificar de novo)
+
+    Returns:
+        Lista de datas ISO alinhada com os cards
+    """
+    if timestamps is None:
+        timestamps = decode_object_id_timestamps([card.get('id', '') for card in cards])
+    iso = np.char.add(np.datetime_as_string(timestamps, unit='ms'), 'Z').tolist()
+    missing = np.isnat(timestamps).tolist()
+    return [
+        card.get('dateLastActivity', '') if is_missing else value
+        for card, value, is_missing in zip(cards, iso, missing)
+    ]
+
+def classify_list_name(list_name: str) -> Tuple[str, bool]:
+    """
+    Classifica uma lista do Trello com as mesmas regras de get_task_status.
+
+    Args:
+        list_name: Nome da lista
+
+    Returns:
+        Tupla (status_base, pode_atrasar) - pode_atrasar indica se um card
+        vencido nesta lista passa a ser 'Atrasada'
+    """
+    list_name_upper = list_name.upper().strip()
+
+    if any(keyword in list_name_upper for keyword in COMPLETED_LIST_KEYWORDS):
+        return 'Concluída', False
+
+    if ('AGUARDANDO' in list_name_upper and
+        'RETORNO' in list_name_upper and
+        'TERCEIRO' in list_name_upper):
+        return 'Concluída', False
+
+    direct_status = LIST_STATUS_MAP.get(list_name_upper)
+    if direct_status:
+        return direct_status, direct_status != 'Concluída'
+
+    if any(keyword in list_name_upper for keyword in ['BLOQUEADA', 'PARADA', 'AGUARDANDO']):
+        return 'Bloqueada', False
+
+    if any(keyword in list_name_upper for keyword in ['PLANEJ', 'PLAN']):
+        return 'Planejamento', False
+
+    if 'RECORREN' in list_name_upper:
+        return 'Recorrente', False
+
+    return 'Em Andamento', True
+
+@dataclass
+class ListInfo:
+    """Informações pré-computadas de uma lista do board."""
+    list_id: Optional[str]
+    name: str
+    status: str
+    can_be_late: bool
+    is_completed: bool
+    is_content_list: bool
+    found: bool = True
+
+def make_list_info(lista: Dict[str, Any]) -> ListInfo:
+    """Classifica uma lista do board (status, atraso, conclusão e lista de conteúdo)."""
+    status, can_be_late = classify_list_name(lista['name'])
+    list_name_upper = lista['name'].upper().strip()
+    return ListInfo(
+        list_id=lista['id'],
+        name=lista['name'],
+        status=status,
+        can_be_late=can_be_late,
+        is_completed=any(keyword in list_name_upper for keyword in COMPLETED_LIST_KEYWORDS),
+        is_content_list=list_name_upper == CONTENT_LIST_NAME
+    )
+
+MISSING_LIST = ListInfo(
+    list_id=None,
+    name=MISSING_LIST_NAME,
+    status='Em Andamento',
+    can_be_late=False,
+    is_completed=False,
+    is_content_list=False,
+    found=False
+)
+
+@dataclass
+class BoardIndex:
+    """
+    Modelo indexado de um board Trello.
+
+    Mantém os cards na ordem original do JSON (a ordem dos relatórios depende
+    dela) junto com as datas de filtro e de prazo já convertidas, além de um
+    índice ordenado pela data de criação decodificada dos IDs.
+    """
+    cards: List[Dict[str, Any]]
+    lists_by_id: Dict[str, ListInfo]
+    member_positions: Dict[str, List[int]]
+    members: List[Dict[str, Any]]
+    period_dates: List[Optional[date]]
+    due_dates: List[Optional[date]]
+    created_at: np.ndarray
+    created_at_iso: List[str]
+    created_order: np.ndarray
+    created_sorted: np.ndarray
+    _grupo_cache: Dict[str, Optional[GrupoMarketing]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    @timed_stage('índice do board')
+    def from_data(cls, data: Dict[str, Any]) -> 'BoardIndex':
+        """
+        Constrói o índice a partir do JSON do Trello.
+
+        Args:
+            data: Dados do Trello
+
+        Returns:
+            Índice do board
+        """
+        cards = data.get('cards', [])
+        lists = data.get('lists', [])
+        members = data.get('members', [])
+
+        lists_by_id = {}
+        for lista in lists:
+            lists_by_id.setdefault(lista['id'], make_list_info(lista))
+
+        member_positions = {}
+        for position, member in enumerate(members):
+            member_positions.setdefault(member['id'], []).append(position)
+
+        period_dates = []
+        due_dates = []
+        for card in cards:
+            due_date = parse_trello_date(card.get('due'))
+            due_dates.append(due_date)
+            period_dates.append(cls._period_date(card, lists_by_id, due_date))
+
+        created_at = decode_object_id_timestamps([card.get('id', '') for card in cards])
+        with_creation = np.flatnonzero(~np.isnat(created_at))
+        created_order = with_creation[np.argsort(created_at[with_creation], kind='stable')]
+
+        return cls(
+            cards=cards,
+            lists_by_id=lists_by_id,
+            member_positions=member_positions,
+            members=members,
+            period_dates=period_dates,
+            due_dates=due_dates,
+            created_at=created_at,
+            created_at_iso=card_created_at(cards, created_at),
+            created_order=created_order,
+            created_sorted=created_at[created_order]
+        )
+
+    @staticmethod
+    def _period_date(card: Dict[str, Any], lists_by_id: Dict[str, ListInfo], due_date: Optional[date]) -> Optional[date]:
+        """
+        Data usada pelo filtro de período (None = card nunca entra no relatório).
+
+        Replica filter_cards_by_date_range: cards arquivados ficam de fora,
+        cards em listas concluídas usam o prazo e os demais a última atividade.
+        """
+        if card.get('closed', False):
+            return None
+
+        list_info = lists_by_id.get(card.get('idList'))
+        if list_info is not None and list_info.is_completed:
+            return due_date
+
+        return parse_trello_date(card.get('dateLastActivity'))
+
+    def list_info(self, list_id: Optional[str]) -> ListInfo:
+        """Obtém a lista de um card (MISSING_LIST se não existir no board)."""
+        return self.lists_by_id.get(list_id, MISSING_LIST)
+
+    def card_status(self, position: int, as_of: date) -> str:
+        """Status do card pela lista e pelo prazo (equivalente a TrelloDataProcessor.get_task_status)."""
+        card = self.cards[position]
+        if card.get('closed', False):
+            return 'Concluída'
+
+        list_info = self.list_info(card.get('idList'))
+        due_date = self.due_dates[position]
+        if list_info.can_be_late and card.get('due') and due_date is not None and as_of > due_date:
+            return 'Atrasada'
+        return list_info.status
+
+    def card_members(self, card: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Membros do card na ordem em que aparecem no board."""
+        positions = set()
+        for member_id in card.get('idMembers', []):
+            positions.update(self.member_positions.get(member_id, ()))
+        return [self.members[position] for position in sorted(positions)]
+
+    def grupo_por_responsavel(self, username: str) -> Optional[GrupoMarketing]:
+        """Versão memorizada de get_grupo_por_responsavel."""
+        if username not in self._grupo_cache:
+            self._grupo_cache[username] = get_grupo_por_responsavel(username)
+        return self._grupo_cache[username]
+
+    def card_group_names(self, card: Dict[str, Any]) -> List[str]:
+        """Grupos de marketing do card, na ordem dos membros (NO_GROUP se nenhum)."""
+        names = []
+        for member in self.card_members(card):
+            grupo = self.grupo_por_responsavel(member['username'])
+            if grupo and grupo.name not in names:
+                names.append(grupo.name)
+        return names or [NO_GROUP]
+
+    @timed_stage('filtro por período', count_rows=True)
+    def cards_in_period(self, start_date: date, end_date: date) -> List[int]:
+        """
+        Posições dos cards dentro do período, na ordem original do board.
+
+        Args:
+            start_date: Data de início
+            end_date: Data de fim
+
+        Returns:
+            Lista de posições de cards
+        """
+        return [
+            position for position, period_date in enumerate(self.period_dates)
+            if period_date is not None and start_date <= period_date <= end_date
+        ]
+
+    def cards_created_between(self, start_date: date, end_date: date) -> np.ndarray:
+        """
+        Posições dos cards criados no período (busca binária no índice ordenado).
+
+        Args:
+            start_date: Data de início
+            end_date: Data de fim (inclusiva)
+
+        Returns:
+            Array de posições, em ordem de criação
+        """
+        start = np.datetime64(start_date, 's')
+        end = np.datetime64(end_date, 'D') + np.timedelta64(1, 'D')
+        lo, hi = np.searchsorted(self.created_sorted, [start, end.astype('datetime64[s]')])
+        return self.created_order[lo:hi]
@@ -0,0 +1,115 @@
+"""
+Séries de burn-up/burn-down por grupo de marketing.
+
+O escopo de cada dia é o número de cards criados até ele e o realizado é o
+número de cards concluídos até ele. As duas séries saem de um único bincount
+sobre (grupo, dia) seguido de soma acumulada, em O(cards + grupos x dias).
+"""
+
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .actions import ListTransitionIndex
+from .board_index import BoardIndex, parse_trello_date
+from .config import GRUPOS_MARKETING, NO_GROUP
+
+def card_completion_days(index: BoardIndex, transitions: Optional[ListTransitionIndex] = None,
+                         as_of: Optional[date] = None) -> np.ndarray:
+    """
+    Dia de conclusão de cada card (NaT se não concluído).
+
+    Usa a data real de conclusão do log de ações quando disponível; para os
+    demais cards em listas concluídas, a última atividade (como em
+    TaskReport.completed_at).
+
+    Args:
+        index: Índice do board
+        transitions: Índice de movimentações (opcional)
+        as_of: Ignora conclusões posteriores a esta data
+
+    Returns:
+        Array datetime64[D] alinhado com index.cards
+    """
+    completions = {}
+    if transitions is not None:
+        lists = [{'id': list_id, 'name': info.name} for list_id, info in index.lists_by_id.items()]
+        completions = transitions.completion_times(lists)
+
+    days = np.full(len(index.cards), np.datetime64('NaT'), dtype='datetime64[D]')
+    for position, card in enumerate(index.cards):
+        if index.list_info(card.get('idList')).status != 'Concluída':
+            continue
+        completed = completions.get(card.get('id'))
+        day = completed.date() if completed is not None else parse_trello_date(card.get('dateLastActivity'))
+        if day is not None and (as_of is None or day <= as_of):
+            days[position] = np.datetime64(day, 'D')
+    return days
+
+def _cumulative_by_group(group_codes: np.ndarray, days: np.ndarray, start: np.datetime64,
+                         n_groups: int, n_days: int) -> np.ndarray:
+    """
+    Contagem acumulada por grupo e dia.
+
+    Eventos anteriores ao início contam desde o primeiro dia; eventos
+    posteriores ao fim (ou NaT) são descartados.
+    """
+    valid = ~np.isnat(days)
+    offsets = np.maximum((days[valid] - start).astype(np.int64), 0)
+    in_range = offsets < n_days
+    flat = group_codes[valid][in_range] * n_days + offsets[in_range]
+    counts = np.bincount(flat, minlength=n_groups * n_days).reshape(n_groups, n_days)
+    return counts.cumsum(axis=1)
+
+def burnup_series(index: BoardIndex, start_date: date, end_date: date,
+                  transitions: Optional[ListTransitionIndex] = None,
+                  as_of: Optional[date] = None) -> pd.DataFrame:
+    """
+    Escopo, concluídas e restantes por grupo e dia do período.
+
+    Cards arquivados ficam de fora; cards sem data de criação identificável
+    (IDs que não são ObjectIds) contam como escopo desde o início do período.
+    Um card com membros de vários grupos entra na série de cada grupo.
+
+    Args:
+        index: Índice do board
+        start_date: Data de início
+        end_date: Data de fim (inclusiva)
+        transitions: Índice de movimentações (datas reais de conclusão)
+        as_of: Ignora conclusões posteriores a esta data
+
+    Returns:
+        DataFrame com colunas grupo, data, total, concluidas e restantes
+    """
+    group_names = [grupo.name for grupo in GRUPOS_MARKETING] + [NO_GROUP]
+    group_codes_by_name = {name: code for code, name in enumerate(group_names)}
+    start = np.datetime64(start_date, 'D')
+    n_days = max((end_date - start_date).days + 1, 0)
+
+    positions, group_codes = [], []
+    for position, card in enumerate(index.cards):
+        if card.get('closed', False):
+            continue
+        for name in index.card_group_names(card):
+            positions.append(position)
+            group_codes.append(group_codes_by_name[name])
+    positions = np.array(positions, dtype=np.int64)
+    group_codes = np.array(group_codes, dtype=np.int64)
+
+    created = index.created_at.astype('datetime64[D]')
+    created = np.where(np.isnat(created), start, created)
+    completed = card_completion_days(index, transitions, as_of)
+
+    total = _cumulative_by_group(group_codes, created[positions], start, len(group_names), n_days)
+    done = _cumulative_by_group(group_codes, completed[positions], start, len(group_names), n_days)
+
+    dates = pd.date_range(start_date, periods=n_days, freq='D').date
+    return pd.DataFrame({
+        'grupo': np.repeat(group_names, n_days),
+        'data': np.tile(dates, len(group_names)),
+        'total': total.ravel(),
+        'concluidas': done.ravel(),
+        'restantes': (total - done).ravel()
+    })
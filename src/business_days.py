@@ -0,0 +1,118 @@
+"""
+Cálculo vetorizado de atraso em dias úteis com calendário de feriados.
+
+Usa numpy.busday_count sobre todos os relatórios de uma vez, com o
+calendário de feriados nacionais brasileiros (configurável em config.py).
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from .config import HOLIDAY_CALENDAR, INCLUDE_OPTIONAL_HOLIDAYS, EXTRA_HOLIDAYS
+
+# Anos cobertos pelo calendário pré-computado
+CALENDAR_YEARS = range(1990, 2101)
+
+def easter_sunday(year: int) -> date:
+    """Domingo de Páscoa (algoritmo de Meeus/Jones/Butcher)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+def brazilian_holidays(years: Iterable[int], include_optional: bool = True) -> List[date]:
+    """
+    Feriados nacionais brasileiros.
+
+    Args:
+        years: Anos a incluir
+        include_optional: Inclui Carnaval e Corpus Christi (pontos facultativos
+            observados pela maioria das empresas)
+
+    Returns:
+        Lista de datas de feriado
+    """
+    holidays = []
+    for year in years:
+        easter = easter_sunday(year)
+        holidays.extend([
+            date(year, 1, 1),    # Confraternização Universal
+            easter - timedelta(days=2),  # Sexta-feira Santa
+            date(year, 4, 21),   # Tiradentes
+            date(year, 5, 1),    # Dia do Trabalho
+            date(year, 9, 7),    # Independência
+            date(year, 10, 12),  # Nossa Senhora Aparecida
+            date(year, 11, 2),   # Finados
+            date(year, 11, 15),  # Proclamação da República
+            date(year, 12, 25),  # Natal
+        ])
+        if year >= 2024:
+            holidays.append(date(year, 11, 20))  # Consciência Negra
+        if include_optional:
+            holidays.extend([
+                easter - timedelta(days=48),  # Carnaval (segunda)
+                easter - timedelta(days=47),  # Carnaval (terça)
+                easter + timedelta(days=60),  # Corpus Christi
+            ])
+    return holidays
+
+@lru_cache(maxsize=8)
+def get_business_calendar(calendar: str = HOLIDAY_CALENDAR,
+                          include_optional: bool = INCLUDE_OPTIONAL_HOLIDAYS,
+                          extra_holidays: Tuple[str, ...] = tuple(EXTRA_HOLIDAYS)) -> np.busdaycalendar:
+    """
+    Monta (uma vez) o calendário de dias úteis do numpy.
+
+    Args:
+        calendar: Código do calendário ('BR' ou '' para apenas fins de semana)
+        include_optional: Inclui pontos facultativos nacionais
+        extra_holidays: Feriados adicionais em ISO (ex.: municipais)
+
+    Returns:
+        Calendário para numpy.busday_count
+    """
+    holidays = [date.fromisoformat(day) for day in extra_holidays]
+    if calendar == 'BR':
+        holidays.extend(brazilian_holidays(CALENDAR_YEARS, include_optional))
+    elif calendar:
+        raise ValueError(f"Calendário de feriados desconhecido: '{calendar}'")
+
+    return np.busdaycalendar(weekmask='1111100', holidays=np.array(sorted(set(holidays)), dtype='datetime64[D]'))
+
+def business_days_late(days_late: np.ndarray, end_dates: np.ndarray,
+                       busdaycal: np.busdaycalendar = None) -> np.ndarray:
+    """
+    Converte atrasos em dias corridos para dias úteis, de forma vetorizada.
+
+    O atraso útil conta os dias úteis no intervalo (prazo, data final], onde
+    prazo = data final - dias de atraso.
+
+    Args:
+        days_late: Atrasos em dias corridos (int)
+        end_dates: Data final de cada atraso (datetime64[D] ou escalar)
+        busdaycal: Calendário de dias úteis (padrão: get_business_calendar())
+
+    Returns:
+        Array de atrasos em dias úteis (0 onde não há atraso)
+    """
+    busdaycal = busdaycal if busdaycal is not None else get_business_calendar()
+    days_late = np.asarray(days_late, dtype=np.int64)
+    end_dates = np.broadcast_to(np.asarray(end_dates, dtype='datetime64[D]'), days_late.shape)
+
+    late = days_late > 0
+    result = np.zeros(days_late.shape, dtype=np.int64)
+    if late.any():
+        ends = end_dates[late] + np.timedelta64(1, 'D')
+        starts = ends - days_late[late].astype('timedelta64[D]')
+        result[late] = np.busday_count(starts, ends, busdaycal=busdaycal)
+    return result
@@ -0,0 +1,159 @@
+"""
+Cache de relatórios por card, indexado pela impressão digital do card.
+
+Exports reenviados várias vezes por dia mudam poucos cards. A impressão
+digital projeta os campos do card que afetam os relatórios (idList,
+idMembers, due, closed, dateLastActivity, name, desc) junto com o contexto
+de que a classificação depende (nome da lista, membros do card, data real
+de conclusão e data de referência). Cards com a mesma impressão reutilizam
+as linhas de TaskReport já calculadas; só os demais são reclassificados.
+
+O cache é limitado (LRU) e compartilhado por todas as sessões do processo.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import fields
+from datetime import date, datetime
+from typing import Dict, List, Any, Optional
+
+from .actions import ListTransitionIndex
+from .board_index import BoardIndex
+from .config import CARD_CACHE_MAX_CARDS
+from .data_processor import TaskReport
+
+# Campos de TaskReport, na ordem do construtor
+TASK_FIELDS = [f.name for f in fields(TaskReport)]
+
+# Campos do card que entram na impressão digital
+FINGERPRINT_FIELDS = ['id', 'idList', 'idMembers', 'due', 'closed', 'dateLastActivity', 'name', 'desc']
+
+def card_fingerprint(index: BoardIndex, position: int, as_of: date,
+                     completed_at: Optional[datetime] = None) -> str:
+    """
+    Impressão digital de um card no contexto do board.
+
+    Args:
+        index: Índice do board
+        position: Posição do card em index.cards
+        as_of: Data de referência
+        completed_at: Data real de conclusão (ListTransitionIndex.completion_times)
+
+    Returns:
+        Hash hexadecimal
+    """
+    card = index.cards[position]
+    projection = (
+        tuple(card.get(name) for name in FINGERPRINT_FIELDS),
+        index.list_info(card.get('idList')).name,
+        tuple((member['id'], member['username'], member['fullName']) for member in index.card_members(card)),
+        completed_at,
+        as_of
+    )
+    return hashlib.blake2b(repr(projection).encode('utf-8'), digest_size=16).hexdigest()
+
+class CardReportCache:
+    """
+    Cache LRU de impressão digital -> linhas de TaskReport do card.
+
+    As linhas ficam guardadas como tuplas de valores; cada consulta devolve
+    instâncias novas, que o chamador pode alterar sem afetar o cache.
+    """
+
+    def __init__(self, max_cards: int = CARD_CACHE_MAX_CARDS):
+        self.max_cards = max_cards
+        self._entries: 'OrderedDict[str, List[tuple]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[List[TaskReport]]:
+        """Linhas do card ou None."""
+        with self._lock:
+            rows = self._entries.get(key)
+            if rows is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return [TaskReport(*values) for values in rows]
+
+    def put(self, key: str, rows: List[TaskReport]):
+        """Guarda as linhas do card, descartando as menos usadas acima do limite."""
+        with self._lock:
+            self._entries[key] = [tuple(getattr(row, name) for name in TASK_FIELDS) for row in rows]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_cards:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {'cards': len(self._entries), 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+_shared_cache: Optional[CardReportCache] = None
+_shared_lock = threading.Lock()
+
+def shared_card_cache() -> CardReportCache:
+    """Cache do processo (compartilhado entre as sessões do app)."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = CardReportCache()
+        return _shared_cache
+
+def generate_cached_task_reports(processor, data: Dict[str, Any], start_date: date, end_date: date,
+                                 as_of: date, cache: CardReportCache,
+                                 transitions: Optional[ListTransitionIndex] = None,
+                                 index: Optional[BoardIndex] = None) -> List[TaskReport]:
+    """
+    Gera os relatórios do período reclassificando apenas os cards alterados.
+
+    O resultado é igual ao de processor.generate_task_reports (inclusive na
+    ordem): os cards novos ou alterados passam pelo motor do processador
+    (processor.card_reports) e pelas etapas finais antes de entrarem no cache.
+
+    Args:
+        processor: TrelloDataProcessor
+        data: Dados do Trello
+        start_date: Data de início
+        end_date: Data de fim
+        as_of: Data de referência (já resolvida)
+        cache: Cache de relatórios por card
+        transitions: Índice de movimentações (ver generate_task_reports)
+        index: Índice do board (evita reconstruir)
+
+    Returns:
+        Lista de relatórios de tarefas
+    """
+    index = index or BoardIndex.from_data(data)
+    completions = transitions.completion_times(data.get('lists', [])) if transitions is not None else {}
+
+    card_rows = []
+    missing = []
+    for position in index.cards_in_period(start_date, end_date):
+        card_id = index.cards[position].get('id', '')
+        key = card_fingerprint(index, position, as_of, completions.get(card_id))
+        rows = cache.get(key)
+        if rows is None:
+            rows = processor.card_reports(data, index, position, as_of)
+            missing.append((key, rows))
+        card_rows.append(rows)
+
+    # Etapas finais apenas para os cards reclassificados
+    new_rows = [row for _, rows in missing for row in rows]
+    end_dates = processor.apply_completion_dates(new_rows, completions, as_of)
+    processor.apply_business_days_late(new_rows, end_dates)
+    for key, rows in missing:
+        cache.put(key, rows)
+
+    return [row for rows in card_rows for row in rows]
@@ -0,0 +1,393 @@
+"""
+Gráficos Plotly do app (status, grupos, colaboradores, idade, tendência,
+burn-up e tempo por etapa).
+
+Separado de src/utils.py para que o processamento sem interface (CLI,
+watcher, workers) não importe o Plotly.
+"""
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from typing import Dict, Any, Optional
+
+def create_status_pie_chart(status_data: Dict[str, int], title: str = "Distribuição de Status") -> go.Figure:
+    """
+    Cria gráfico de pizza para distribuição de status.
+    
+    Args:
+        status_data: Dicionário com contagem por status
+        title: Título do gráfico
+        
+    Returns:
+        Figura Plotly
+    """
+    if not status_data:
+        return go.Figure()
+    
+    labels = list(status_data.keys())
+    values = list(status_data.values())
+    
+    colors = {
+        'pendente': '#E74C3C',
+        'andamento': '#F39C12', 
+        'revisao': '#3498DB',
+        'concluido': '#27AE60',
+        'arquivado': '#95A5A6'
+    }
+    
+    chart_colors = [colors.get(label, '#BDC3C7') for label in labels]
+    
+    fig = px.pie(
+        values=values,
+        names=labels,
+        title=title,
+        color_discrete_sequence=chart_colors
+    )
+    
+    fig.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate='<b>%{label}</b><br>Quantidade: %{value}<br>Percentual: %{percent}<extra></extra>'
+    )
+    
+    fig.update_layout(
+        showlegend=True,
+        height=400,
+        font=dict(size=12)
+    )
+    
+    return fig
+
+def create_group_bar_chart(group_data: Dict[str, int], title: str = "Tarefas por Grupo") -> go.Figure:
+    """
+    Cria gráfico de barras para distribuição por grupos.
+    
+    Args:
+        group_data: Dicionário com contagem por grupo
+        title: Título do gráfico
+        
+    Returns:
+        Figura Plotly
+    """
+    if not group_data:
+        return go.Figure()
+    
+    groups = list(group_data.keys())
+    counts = list(group_data.values())
+    
+    colors = ['#E74C3C', '#3498DB', '#27AE60', '#F39C12']
+    
+    fig = px.bar(
+        x=groups,
+        y=counts,
+        title=title,
+        color=groups,
+        color_discrete_sequence=colors
+    )
+    
+    fig.update_traces(
+        hovertemplate='<b>%{x}</b><br>Tarefas: %{y}<extra></extra>'
+    )
+    
+    fig.update_layout(
+        showlegend=False,
+        height=400,
+        xaxis_title="Grupos",
+        yaxis_title="Número de Tarefas",
+        font=dict(size=12)
+    )
+    
+    return fig
+
+def create_collaborator_chart(collab_data: pd.DataFrame, top_n: int = 10) -> go.Figure:
+    """
+    Cria gráfico de colaboradores mais ativos.
+    
+    Args:
+        collab_data: DataFrame com dados de colaboradores
+        top_n: Número de top colaboradores a mostrar
+        
+    Returns:
+        Figura Plotly
+    """
+    if collab_data.empty:
+        return go.Figure()
+    
+    # Pega top N colaboradores
+    top_collabs = collab_data.nlargest(top_n, 'total_tasks')
+    
+    fig = px.bar(
+        top_collabs,
+        x='total_tasks',
+        y='colaborador',
+        orientation='h',
+        title=f"Top {top_n} Colaboradores Mais Ativos",
+        color='total_tasks',
+        color_continuous_scale='viridis'
+    )
+    
+    fig.update_traces(
+        hovertemplate='<b>%{y}</b><br>Tarefas: %{x}<extra></extra>'
+    )
+    
+    fig.update_layout(
+        height=max(400, top_n * 40),
+        xaxis_title="Número de Tarefas",
+        yaxis_title="Colaboradores",
+        showlegend=False,
+        font=dict(size=12)
+    )
+    
+    return fig
+
+def create_progress_metrics(metrics: Dict[str, Any]) -> go.Figure:
+    """
+    Cria dashboard de métricas de progresso.
+    
+    Args:
+        metrics: Dicionário com métricas do projeto
+        
+    Returns:
+        Figura Plotly com subplots
+    """
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=[
+            'Taxa de Conclusão',
+            'Cards Ativos vs Total',
+            'Distribuição por Status',
+            'Colaboradores Únicos'
+        ],
+        specs=[
+            [{'type': 'indicator'}, {'type': 'bar'}],
+            [{'type': 'pie'}, {'type': 'indicator'}]
+        ]
+    )
+    
+    # Taxa de conclusão
+    completion_rate = metrics.get('completion_rate', 0)
+    fig.add_trace(
+        go.Indicator(
+            mode="gauge+number+delta",
+            value=completion_rate,
+            domain={'x': [0, 1], 'y': [0, 1]},
+            title={'text': "Taxa de Conclusão (%)"},
+            gauge={
+                'axis': {'range': [None, 100]},
+                'bar': {'color': "#27AE60"},
+                'steps': [
+                    {'range': [0, 50], 'color': "#E74C3C"},
+                    {'range': [50, 80], 'color': "#F39C12"},
+                    {'range': [80, 100], 'color': "#27AE60"}
+                ],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 90
+                }
+            }
+        ),
+        row=1, col=1
+    )
+    
+    # Cards ativos vs total
+    total_cards = metrics.get('total_cards', 0)
+    active_cards = metrics.get('active_cards', 0)
+    
+    fig.add_trace(
+        go.Bar(
+            x=['Total', 'Ativos'],
+            y=[total_cards, active_cards],
+            marker_color=['#3498DB', '#27AE60'],
+            name='Cards'
+        ),
+        row=1, col=2
+    )
+    
+    # Distribuição por status
+    status_dist = metrics.get('status_distribution', {})
+    if status_dist:
+        fig.add_trace(
+            go.Pie(
+                labels=list(status_dist.keys()),
+                values=list(status_dist.values()),
+                name='Status'
+            ),
+            row=2, col=1
+        )
+    
+    # Colaboradores únicos
+    unique_collaborators = metrics.get('unique_collaborators', 0)
+    fig.add_trace(
+        go.Indicator(
+            mode="number",
+            value=unique_collaborators,
+            title={'text': "Colaboradores Únicos"},
+            number={'font': {'size': 40, 'color': '#2C3E50'}}
+        ),
+        row=2, col=2
+    )
+    
+    fig.update_layout(
+        height=600,
+        showlegend=False,
+        title_text="Dashboard de Métricas",
+        title_x=0.5
+    )
+    
+    return fig
+
+def create_aging_chart(histogram: pd.DataFrame, title: str = "Idade dos Cards em Aberto") -> go.Figure:
+    """
+    Cria gráfico de barras empilhadas do histograma de envelhecimento.
+    
+    Args:
+        histogram: DataFrame com uma linha por lista/grupo e uma coluna por faixa de idade
+        title: Título do gráfico
+        
+    Returns:
+        Figura Plotly
+    """
+    if histogram.empty:
+        return go.Figure()
+    
+    colors = ['#27AE60', '#2ECC71', '#F1C40F', '#F39C12', '#E67E22', '#E74C3C']
+    
+    fig = go.Figure()
+    for i, faixa in enumerate(histogram.columns):
+        fig.add_trace(go.Bar(
+            name=faixa,
+            y=histogram.index.tolist(),
+            x=histogram[faixa].tolist(),
+            orientation='h',
+            marker_color=colors[i % len(colors)],
+            hovertemplate='<b>%{y}</b><br>' + faixa + ': %{x} cards<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title=title,
+        barmode='stack',
+        height=max(400, len(histogram) * 30),
+        xaxis_title="Número de Cards",
+        font=dict(size=12)
+    )
+    
+    return fig
+
+def create_trend_chart(series: pd.DataFrame, title: str = "Tendência de Tarefas",
+                       colors: Optional[Dict[str, str]] = None) -> go.Figure:
+    """
+    Cria gráfico de barras empilhadas de uma série temporal de contagens.
+    
+    Args:
+        series: DataFrame com uma linha por período e uma coluna por categoria
+        title: Título do gráfico
+        colors: Cor de cada categoria (opcional)
+        
+    Returns:
+        Figura Plotly
+    """
+    if series.empty:
+        return go.Figure()
+    
+    fig = go.Figure()
+    for column in series.columns:
+        name = ' / '.join(map(str, column)) if isinstance(column, tuple) else str(column)
+        fig.add_trace(go.Bar(
+            name=name,
+            x=series.index.tolist(),
+            y=series[column].tolist(),
+            marker_color=(colors or {}).get(name),
+            hovertemplate='%{x}<br>' + name + ': %{y}<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title=title,
+        barmode='stack',
+        height=400,
+        xaxis_title="Período",
+        yaxis_title="Tarefas",
+        font=dict(size=12)
+    )
+    
+    return fig
+
+def create_burnup_chart(burnup: pd.DataFrame, title: str = "Burn-up", burndown: bool = False) -> go.Figure:
+    """
+    Cria gráfico de burn-up (escopo x concluídas) ou burn-down (restantes).
+    
+    Args:
+        burnup: DataFrame com colunas data, total, concluidas e restantes de um grupo
+        title: Título do gráfico
+        burndown: Exibe apenas as tarefas restantes
+        
+    Returns:
+        Figura Plotly
+    """
+    if burnup.empty:
+        return go.Figure()
+    
+    if burndown:
+        lines = [('restantes', 'Restantes', '#E74C3C', 'tozeroy')]
+    else:
+        lines = [('total', 'Escopo', '#3498DB', None), ('concluidas', 'Concluídas', '#27AE60', 'tozeroy')]
+    
+    fig = go.Figure()
+    for column, name, color, fill in lines:
+        fig.add_trace(go.Scatter(
+            name=name,
+            x=burnup['data'].tolist(),
+            y=burnup[column].tolist(),
+            mode='lines',
+            fill=fill,
+            line=dict(color=color, width=2),
+            hovertemplate='%{x}<br>' + name + ': %{y}<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title=title,
+        height=400,
+        xaxis_title="Data",
+        yaxis_title="Tarefas",
+        hovermode='x unified',
+        font=dict(size=12)
+    )
+    
+    return fig
+
+def create_cycle_time_chart(cycle_times: pd.DataFrame, title: str = "Tempo de Permanência por Etapa") -> go.Figure:
+    """
+    Cria gráfico de barras agrupadas com a mediana (p50) por etapa e grupo.
+    
+    Args:
+        cycle_times: DataFrame com colunas grupo, etapa, p50_days, p90_days e cards
+        title: Título do gráfico
+        
+    Returns:
+        Figura Plotly
+    """
+    if cycle_times.empty:
+        return go.Figure()
+    
+    fig = go.Figure()
+    for grupo, rows in cycle_times.groupby('grupo', sort=False):
+        fig.add_trace(go.Bar(
+            name=grupo,
+            x=rows['etapa'].tolist(),
+            y=rows['p50_days'].tolist(),
+            customdata=rows[['p90_days', 'cards']].values.tolist(),
+            hovertemplate='<b>%{x}</b><br>p50: %{y} dias<br>p90: %{customdata[0]} dias<br>'
+                          'Cards: %{customdata[1]}<extra>' + grupo + '</extra>'
+        ))
+    
+    fig.update_layout(
+        title=title,
+        barmode='group',
+        height=450,
+        yaxis_title="Dias (mediana)",
+        font=dict(size=12)
+    )
+    
+    return fig
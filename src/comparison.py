@@ -0,0 +1,122 @@
+"""
+Comparação entre dois períodos (ex.: este mês x mês anterior).
+
+No app, os dois períodos são recortes dos mesmos relatórios do board inteiro
+(TrelloDataProcessor.generate_board_reports, ver slice_board_reports em
+app.py), com os resumos respondidos pelo cubo; aqui ficam apenas as
+diferenças entre as métricas numéricas dos resumos.
+"""
+
+from dataclasses import dataclass, fields
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from .data_processor import ReportSummary, GroupReportSummary, CollaboratorReport
+
+# Rótulos das métricas comparáveis
+METRIC_LABELS = {
+    'total_tasks': 'Total de Tarefas',
+    'completed_tasks': 'Concluídas',
+    'in_progress_tasks': 'Em Andamento',
+    'pending_tasks': 'Pendentes',
+    'late_tasks': 'Atrasadas',
+    'overdue_tasks': 'Vencidas',
+    'blocked_tasks': 'Bloqueadas',
+    'total_collaborators': 'Colaboradores',
+    'on_time_deliveries': 'Entregas no Prazo',
+    'late_deliveries': 'Entregas Atrasadas',
+    'completion_rate': 'Taxa de Conclusão (%)',
+    'average_days_late': 'Média de Dias de Atraso',
+    'average_business_days_late': 'Média de Dias Úteis de Atraso'
+}
+
+@dataclass
+class MetricDelta:
+    """Valor de uma métrica nos dois períodos."""
+    current: float
+    previous: float
+
+    @property
+    def delta(self) -> float:
+        return self.current - self.previous
+
+def previous_period(start_date: date, end_date: date) -> Tuple[date, date]:
+    """Período de mesma duração imediatamente anterior."""
+    length = end_date - start_date
+    previous_end = start_date - timedelta(days=1)
+    return previous_end - length, previous_end
+
+def metric_fields(cls) -> List[str]:
+    """Campos numéricos (comparáveis) de um dataclass de relatório."""
+    return [f.name for f in fields(cls) if f.type in (int, float)]
+
+def metric_deltas(current, previous) -> Dict[str, MetricDelta]:
+    """
+    Diferenças entre as métricas numéricas de dois relatórios do mesmo tipo.
+
+    Args:
+        current: Relatório do período atual (ReportSummary, GroupReportSummary...)
+        previous: Relatório do período de comparação
+
+    Returns:
+        Dict campo -> MetricDelta
+    """
+    return {
+        name: MetricDelta(getattr(current, name), getattr(previous, name))
+        for name in metric_fields(type(current))
+    }
+
+def _empty_like(cls, **identity):
+    """Relatório zerado (entidade ausente em um dos períodos)."""
+    values = {f.name: 0 for f in fields(cls) if f.type in (int, float)}
+    values.update({f.name: [] for f in fields(cls) if f.name in ('responsaveis', 'tasks', 'group_summaries')})
+    values.update(identity)
+    return cls(**values)
+
+def _tidy_deltas(key: str, current: Dict[str, object], previous: Dict[str, object], cls) -> pd.DataFrame:
+    """Tabela longa (entidade, métrica, atual, anterior, delta) de dois conjuntos de relatórios."""
+    rows = []
+    names = list(current) + [name for name in previous if name not in current]
+    for name in names:
+        identity = {key if key != 'colaborador' else 'collaborator_name': name}
+        cur = current.get(name) or _empty_like(cls, **identity)
+        prev = previous.get(name) or _empty_like(cls, **identity)
+        for metric, values in metric_deltas(cur, prev).items():
+            rows.append({
+                key: name,
+                'metrica': metric,
+                'atual': values.current,
+                'anterior': values.previous,
+                'delta': values.delta
+            })
+    return pd.DataFrame(rows, columns=[key, 'metrica', 'atual', 'anterior', 'delta'])
+
+def group_deltas(current: ReportSummary, previous: ReportSummary) -> pd.DataFrame:
+    """
+    Diferenças de todas as métricas de GroupReportSummary, grupo a grupo.
+
+    Returns:
+        DataFrame com colunas grupo, metrica, atual, anterior e delta
+    """
+    return _tidy_deltas(
+        'grupo',
+        {g.grupo: g for g in current.group_summaries},
+        {g.grupo: g for g in previous.group_summaries},
+        GroupReportSummary
+    )
+
+def collaborator_deltas(current: List[CollaboratorReport], previous: List[CollaboratorReport]) -> pd.DataFrame:
+    """
+    Diferenças de todas as métricas de CollaboratorReport, colaborador a colaborador.
+
+    Returns:
+        DataFrame com colunas colaborador, metrica, atual, anterior e delta
+    """
+    return _tidy_deltas(
+        'colaborador',
+        {c.collaborator_name: c for c in current},
+        {c.collaborator_name: c for c in previous},
+        CollaboratorReport
+    )
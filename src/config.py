@@ -85,6 +85,84 @@ LIST_STATUS_MAP = {
     'FEITOS': 'Concluída'  # Variação plural
 }
 
+# Palavras-chave que identificam listas de tarefas concluídas
+COMPLETED_LIST_KEYWORDS = ['FEITO', 'FEITOS', 'CONCLUÍ', 'FINALIZADO', 'COMPLETO', 'DONE', 'FINISHED']
+
+# Motor de processamento usado pelo TrelloDataProcessor.
+# 'reference' é a implementação original; troque apenas após o harness de
+# paridade (python cli.py parity) não apontar divergências.
+PROCESSING_ENGINE = 'reference'
+
+# Calendário de dias úteis para o atraso em dias úteis
+# 'BR' = feriados nacionais brasileiros; '' = apenas fins de semana
+HOLIDAY_CALENDAR = 'BR'
+# Considera Carnaval e Corpus Christi como feriados
+INCLUDE_OPTIONAL_HOLIDAYS = True
+# Feriados adicionais (ISO, ex.: '2024-01-25' para feriados municipais)
+EXTRA_HOLIDAYS: List[str] = []
+
+# Limites (em dias) das faixas do histograma de envelhecimento dos cards
+AGING_BUCKET_EDGES = [7, 14, 30, 60, 90]
+
+# Granularidade das séries de tendência (rollups diários agregados em 'day', 'week' ou 'month')
+ROLLUP_GRANULARITIES = ['day', 'week', 'month']
+ROLLUP_GRANULARITY = 'week'
+
+# Arquivo SQLite do histórico de snapshots dos boards (python cli.py history)
+HISTORY_DB_PATH = 'data/history.db'
+
+# Máximo de cards no cache de relatórios por impressão digital (LRU, compartilhado entre sessões)
+CARD_CACHE_MAX_CARDS = 50_000
+
+# Pasta monitorada de exports (python cli.py watch): saída, intervalo de varredura,
+# segundos sem alteração antes de processar (gravações parciais) e processos no pool
+WATCH_OUTPUT_DIR = 'data/processed'
+WATCH_POLL_SECONDS = 2.0
+WATCH_DEBOUNCE_SECONDS = 2.0
+WATCH_WORKERS = 2
+
+# API REST do Trello (python cli.py fetch): conexões no pool, limite de taxa
+# (o Trello aceita 100 requisições a cada 10 s por token), novas tentativas
+# e tamanho das páginas de ações
+TRELLO_API_URL = 'https://api.trello.com/1'
+TRELLO_MAX_CONNECTIONS = 8
+TRELLO_RATE_LIMIT = 100
+TRELLO_RATE_PERIOD = 10.0
+TRELLO_MAX_RETRIES = 4
+TRELLO_PAGE_SIZE = 1000
+
+# Estado da sincronização incremental (snapshot do board, journal e cursor por board);
+# o snapshot é regravado quando o journal passa de SYNC_COMPACT_ACTIONS ações
+SYNC_STATE_DIR = 'data/sync'
+SYNC_COMPACT_ACTIONS = 5000
+
+# Receptor de webhooks do Trello (python cli.py webhook serve)
+WEBHOOK_HOST = '127.0.0.1'
+WEBHOOK_PORT = 8765
+WEBHOOK_PATH = '/webhook'
+
+# Funções listadas na tabela do perfil cProfile (app e python cli.py process --cprofile)
+CPROFILE_TOP_N = 30
+
+# Pico de memória (tracemalloc) por processamento no app: desligado por padrão,
+# pois o tracemalloc deixa as alocações mais lentas; liga também pelo painel de
+# administração (?admin=1). Processamentos recentes guardados no registro.
+MEMORY_TRACE_RUNS = False
+MEMORY_RUN_HISTORY = 50
+
+# Boards decodificados compartilhados entre as sessões do app (src/board_cache.py):
+# boards sem sessão usando saem por LRU quando o total passa deste limite
+BOARD_CACHE_MAX_BYTES = 512 * 1024 ** 2
+
+# Métricas no formato do Prometheus: porta local de GET /metrics (None desliga)
+# e arquivo .prom para o textfile collector do node_exporter ('' desliga)
+METRICS_HOST = '127.0.0.1'
+METRICS_PORT = None
+METRICS_TEXTFILE = ''
+
+# Rótulo dos relatórios de membros que não pertencem a nenhum grupo
+NO_GROUP = 'Sem Grupo'
+
 # Configurações do Streamlit
 STREAMLIT_CONFIG = {
     'page_title': 'Trelliq - Relatórios de Marketing',
@@ -0,0 +1,319 @@
+"""
+Cubo OLAP pré-agregado dos relatórios de tarefas.
+
+Os relatórios do board inteiro são gerados uma única vez e agregados em
+células (linha de relatório, dia, lista), com contagens e somas. Trocar o
+período, os grupos selecionados ou as listas vira uma agregação sobre as
+células - O(células), independente do número de cards.
+
+Para que os totais com deduplicação por task_id (ReportSummary) continuem
+exatos, cada card é classificado pela sua assinatura: a sequência ordenada
+das suas linhas de relatório (grupo, status, colaboradores). Para cada
+assinatura e cada combinação de grupos selecionados sabe-se de antemão qual
+linha seria a primeira ocorrência do card - a que o resumo considera.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import GRUPOS_MARKETING, NO_GROUP
+from .data_processor import TaskReport, GroupReportSummary, ReportSummary
+
+GROUP_LABELS = [grupo.name for grupo in GRUPOS_MARKETING] + [NO_GROUP]
+
+# Medidas somadas em cada célula
+MEASURES = ['tasks', 'on_time', 'late_delivery', 'late_population', 'business_days_late_sum', 'days_late_sum']
+
+# Dimensões disponíveis em OlapCube.rollup
+ROLLUP_DIMENSIONS = ['grupo', 'status', 'colaborador', 'lista', 'dia', 'semana']
+
+@dataclass
+class _Slot:
+    """Linha de relatório de uma assinatura."""
+    signature: int
+    position: int
+    label: int
+    status: int
+    collaborator: int
+
+class OlapCube:
+    """Cubo de contagens por (linha de assinatura, dia, lista)."""
+
+    def __init__(self, first_day: date, statuses: List[str], collaborators: List[str], lists: List[str],
+                 slots: List[_Slot], signature_slots: List[List[int]],
+                 cell_slots: np.ndarray, cell_days: np.ndarray, cell_lists: np.ndarray,
+                 measures: Dict[str, np.ndarray]):
+        self.first_day = first_day
+        self.statuses = statuses
+        self.collaborators = collaborators
+        self.lists = lists
+        self.cell_slots = cell_slots
+        self.cell_days = cell_days
+        self.cell_lists = cell_lists
+        self.measures = measures
+
+        self.slot_label = np.array([slot.label for slot in slots], dtype=np.int64)
+        self.slot_status = np.array([slot.status for slot in slots], dtype=np.int64)
+        self.slot_collaborator = np.array([slot.collaborator for slot in slots], dtype=np.int64)
+
+        # Nomes individuais de cada colaborador agrupado (como em generate_report_summary)
+        self.collaborator_names = [
+            {name.strip() for name in value.split(',')} if ',' in value else {value}
+            for value in collaborators
+        ]
+
+        # Primeira linha de cada grupo dentro da assinatura (deduplicação por grupo)
+        self.slot_group_first = np.zeros(len(slots), dtype=bool)
+        # Primeira linha da assinatura entre os grupos de cada máscara de seleção
+        self.slot_overall_first = np.zeros((len(slots), 1 << len(GROUP_LABELS)), dtype=bool)
+        for slot_ids in signature_slots:
+            seen = set()
+            for slot_id in slot_ids:
+                if slots[slot_id].label not in seen:
+                    seen.add(slots[slot_id].label)
+                    self.slot_group_first[slot_id] = True
+            for group_mask in range(1 << len(GROUP_LABELS)):
+                for slot_id in slot_ids:
+                    if group_mask >> slots[slot_id].label & 1:
+                        self.slot_overall_first[slot_id, group_mask] = True
+                        break
+
+    @property
+    def cells(self) -> int:
+        return len(self.cell_slots)
+
+    @classmethod
+    def from_reports(cls, task_reports: List[TaskReport], report_days: Sequence[date]) -> 'OlapCube':
+        """
+        Agrega relatórios já gerados (do board inteiro) em células.
+
+        Args:
+            task_reports: Relatórios de tarefas (linhas de um card contíguas, na ordem original)
+            report_days: Dia de cada relatório (data do filtro de período)
+
+        Returns:
+            Cubo materializado
+        """
+        statuses: Dict[str, int] = {}
+        collaborators: Dict[str, int] = {}
+        lists: Dict[str, int] = {}
+        signatures: Dict[Tuple, int] = {}
+        slots: List[_Slot] = []
+        signature_slots: List[List[int]] = []
+
+        days = np.array(report_days, dtype='datetime64[D]') if len(report_days) else np.array([], dtype='datetime64[D]')
+        first_day = days.min().astype(date) if len(days) else date.today()
+        offsets = (days - np.datetime64(first_day, 'D')).astype(np.int64)
+
+        row_slot = np.empty(len(task_reports), dtype=np.int64)
+        row_list = np.empty(len(task_reports), dtype=np.int64)
+        row_measures = np.zeros((len(task_reports), len(MEASURES)), dtype=np.int64)
+
+        start = 0
+        while start < len(task_reports):
+            end = start + 1
+            while end < len(task_reports) and task_reports[end].task_id == task_reports[start].task_id:
+                end += 1
+            rows = task_reports[start:end]
+
+            key = tuple(
+                (GROUP_LABELS.index(row.grupo or NO_GROUP),
+                 statuses.setdefault(row.status, len(statuses)),
+                 collaborators.setdefault(row.collaborator_name, len(collaborators)))
+                for row in rows
+            )
+            signature = signatures.get(key)
+            if signature is None:
+                signature = signatures[key] = len(signature_slots)
+                signature_slots.append([])
+                for position, (label, status, collaborator) in enumerate(key):
+                    signature_slots[-1].append(len(slots))
+                    slots.append(_Slot(signature, position, label, status, collaborator))
+
+            list_code = lists.setdefault(rows[0].list_name, len(lists))
+            for position, row in enumerate(rows, start=start):
+                row_slot[position] = signature_slots[signature][position - start]
+                row_list[position] = list_code
+                completed_with_due = row.status == 'Concluída' and row.due_date != 'Não definida'
+                late_population = row.days_late > 0 and row.status in ['Atrasada', 'Em Andamento']
+                row_measures[position] = [
+                    1,
+                    completed_with_due and row.days_late == 0,
+                    completed_with_due and row.days_late > 0,
+                    late_population,
+                    row.business_days_late if late_population else 0,
+                    row.days_late
+                ]
+            start = end
+
+        # Agrega linhas com a mesma (linha de assinatura, dia, lista)
+        n_days = int(offsets.max()) + 1 if len(offsets) else 1
+        keys = (row_slot * n_days + offsets) * max(len(lists), 1) + row_list
+        cell_keys, inverse = np.unique(keys, return_inverse=True)
+        measures = {
+            name: np.bincount(inverse, weights=row_measures[:, i], minlength=len(cell_keys)).astype(np.int64)
+            for i, name in enumerate(MEASURES)
+        }
+        cell_lists = cell_keys % max(len(lists), 1)
+        cell_days = (cell_keys // max(len(lists), 1)) % n_days
+        cell_slots = cell_keys // max(len(lists), 1) // n_days
+
+        return cls(
+            first_day=first_day,
+            statuses=list(statuses),
+            collaborators=list(collaborators),
+            lists=list(lists),
+            slots=slots,
+            signature_slots=signature_slots,
+            cell_slots=cell_slots,
+            cell_days=cell_days,
+            cell_lists=cell_lists,
+            measures=measures
+        )
+
+    def _cell_mask(self, start_date: Optional[date], end_date: Optional[date],
+                   lists: Optional[Sequence[str]]) -> np.ndarray:
+        """Células dentro do período e das listas informadas."""
+        mask = np.ones(self.cells, dtype=bool)
+        if start_date is not None:
+            mask &= self.cell_days >= (start_date - self.first_day).days
+        if end_date is not None:
+            mask &= self.cell_days <= (end_date - self.first_day).days
+        if lists is not None:
+            codes = [code for code, name in enumerate(self.lists) if name in set(lists)]
+            mask &= np.isin(self.cell_lists, codes)
+        return mask
+
+    @staticmethod
+    def _group_mask(grupos: Optional[Sequence[str]]) -> int:
+        if grupos is None:
+            return (1 << len(GROUP_LABELS)) - 1
+        return sum(1 << label for label, name in enumerate(GROUP_LABELS) if name in grupos)
+
+    def _status_counts(self, cells: np.ndarray) -> Dict[str, int]:
+        counts = np.bincount(self.slot_status[self.cell_slots[cells]], weights=self.measures['tasks'][cells],
+                             minlength=len(self.statuses)).astype(np.int64)
+        return dict(zip(self.statuses, counts.tolist()))
+
+    def _average(self, cells: np.ndarray) -> int:
+        population = int(self.measures['late_population'][cells].sum())
+        return round(int(self.measures['business_days_late_sum'][cells].sum()) / population) if population else 0
+
+    def summary(self, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                grupos: Optional[Sequence[str]] = None, lists: Optional[Sequence[str]] = None) -> ReportSummary:
+        """
+        ReportSummary do período e dos grupos selecionados.
+
+        Igual a generate_report_summary aplicado aos relatórios do período
+        filtrados pelos grupos (e listas).
+
+        Args:
+            start_date: Data de início (None = sem limite)
+            end_date: Data de fim (None = sem limite)
+            grupos: Grupos selecionados (NO_GROUP para tarefas sem grupo; None = todos)
+            lists: Restringe às listas com estes nomes (None = todas)
+
+        Returns:
+            Resumo do relatório
+        """
+        group_mask = self._group_mask(grupos)
+        cells = self._cell_mask(start_date, end_date, lists)
+        slots = self.cell_slots
+        labels = self.slot_label[slots]
+        selected = cells & ((group_mask >> labels) & 1).astype(bool)
+
+        overall = np.flatnonzero(selected & self.slot_overall_first[slots, group_mask])
+        status_counts = self._status_counts(overall)
+
+        with_tasks = overall[self.measures['tasks'][overall] > 0]
+        unique_collaborators = set()
+        for code in np.unique(self.slot_collaborator[slots[with_tasks]]).tolist():
+            unique_collaborators |= self.collaborator_names[code]
+
+        group_summaries = []
+        for label, grupo in enumerate(GROUP_LABELS):
+            group_cells = np.flatnonzero(selected & self.slot_group_first[slots] & (labels == label))
+            total = int(self.measures['tasks'][group_cells].sum())
+            if grupo == NO_GROUP and total == 0:
+                continue
+
+            counts = self._status_counts(group_cells)
+            responsaveis = [r.nome for r in GRUPOS_MARKETING[label].responsaveis] if grupo != NO_GROUP else []
+            group_summaries.append(GroupReportSummary(
+                grupo=grupo,
+                responsaveis=responsaveis,
+                total_tasks=total,
+                completed_tasks=counts.get('Concluída', 0),
+                in_progress_tasks=counts.get('Em Andamento', 0),
+                late_tasks=counts.get('Atrasada', 0),
+                blocked_tasks=counts.get('Bloqueada', 0),
+                on_time_deliveries=int(self.measures['on_time'][group_cells].sum()),
+                late_deliveries=int(self.measures['late_delivery'][group_cells].sum()),
+                average_business_days_late=self._average(group_cells)
+            ))
+
+        return ReportSummary(
+            total_tasks=int(self.measures['tasks'][overall].sum()),
+            completed_tasks=status_counts.get('Concluída', 0),
+            in_progress_tasks=status_counts.get('Em Andamento', 0),
+            late_tasks=status_counts.get('Atrasada', 0),
+            overdue_tasks=status_counts.get('Atrasada', 0),
+            blocked_tasks=status_counts.get('Bloqueada', 0),
+            total_collaborators=len(unique_collaborators),
+            group_summaries=group_summaries,
+            average_business_days_late=self._average(overall)
+        )
+
+    def rollup(self, by: Sequence[str], start_date: Optional[date] = None, end_date: Optional[date] = None,
+               grupos: Optional[Sequence[str]] = None, lists: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Medidas por linha de relatório agregadas pelas dimensões informadas.
+
+        Conta linhas de relatório (como a tabela de tarefas), sem deduplicar
+        por task_id.
+
+        Args:
+            by: Dimensões ('grupo', 'status', 'colaborador', 'lista', 'dia', 'semana')
+            start_date: Data de início (None = sem limite)
+            end_date: Data de fim (None = sem limite)
+            grupos: Grupos selecionados (None = todos)
+            lists: Listas selecionadas (None = todas)
+
+        Returns:
+            DataFrame com as dimensões e as colunas tasks, completed, late,
+            blocked e days_late_sum
+        """
+        unknown = set(by) - set(ROLLUP_DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Dimensões desconhecidas: {sorted(unknown)}")
+
+        cells = self._cell_mask(start_date, end_date, lists)
+        cells &= ((self._group_mask(grupos) >> self.slot_label[self.cell_slots]) & 1).astype(bool)
+        cells = np.flatnonzero(cells)
+        slots = self.cell_slots[cells]
+        status = np.array(self.statuses, dtype=object)[self.slot_status[slots]] if len(self.statuses) else np.array([], dtype=object)
+        tasks = self.measures['tasks'][cells]
+
+        days = np.datetime64(self.first_day, 'D') + self.cell_days[cells].astype('timedelta64[D]')
+        columns = {
+            'grupo': lambda: np.array(GROUP_LABELS, dtype=object)[self.slot_label[slots]],
+            'status': lambda: status,
+            'colaborador': lambda: np.array(self.collaborators, dtype=object)[self.slot_collaborator[slots]],
+            'lista': lambda: np.array(self.lists, dtype=object)[self.cell_lists[cells]],
+            'dia': lambda: days.astype(object),
+            'semana': lambda: (days - ((days.astype(np.int64) + 3) % 7).astype('timedelta64[D]')).astype(object)
+        }
+        frame = pd.DataFrame({dimension: columns[dimension]() for dimension in by})
+        frame['tasks'] = tasks
+        frame['completed'] = np.where(status == 'Concluída', tasks, 0)
+        frame['late'] = np.where(status == 'Atrasada', tasks, 0)
+        frame['blocked'] = np.where(status == 'Bloqueada', tasks, 0)
+        frame['days_late_sum'] = self.measures['days_late_sum'][cells]
+
+        if not by:
+            return frame[['tasks', 'completed', 'late', 'blocked', 'days_late_sum']].sum().to_frame().T
+        return frame.groupby(list(by), sort=False, as_index=False).sum()
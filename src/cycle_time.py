@@ -0,0 +1,236 @@
+"""
+Tempo de ciclo e tempo de permanência por etapa.
+
+Cada movimentação do log de ações abre um intervalo de permanência que dura
+até a próxima movimentação do mesmo card. Os intervalos são calculados com
+diferenças vetorizadas sobre as colunas ordenadas do ListTransitionIndex e
+agrupados por etapa de cada grupo de marketing (etapas_abertura e
+etapas_finalizacao), além do ciclo completo: da primeira entrada em uma etapa
+de abertura até a conclusão (entrada em FEITO/FEITOS).
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from .actions import ListTransitionIndex
+from .board_index import BoardIndex
+from .config import GRUPOS_MARKETING, GrupoMarketing
+
+MS_PER_DAY = 86_400_000
+
+# Etapa sintética: da primeira abertura até a conclusão
+FULL_CYCLE_STAGE = 'Ciclo completo'
+
+@dataclass
+class DwellIntervals:
+    """Intervalos de permanência em listas (colunas alinhadas)."""
+    cards: np.ndarray    # código do card no ListTransitionIndex
+    lists: np.ndarray    # código da lista
+    starts: np.ndarray   # entrada na lista (ms)
+    ends: np.ndarray     # saída da lista ou data de referência (ms)
+    ongoing: np.ndarray  # card ainda estava na lista na data de referência
+
+    @property
+    def durations(self) -> np.ndarray:
+        return self.ends - self.starts
+
+@dataclass
+class StageCycleTime:
+    """Percentis de permanência de um grupo em uma etapa."""
+    grupo: str
+    etapa: str
+    cards: int
+    intervals: int
+    p50_days: float
+    p90_days: float
+
+def _day_end_ms(day: date) -> int:
+    """Primeiro milissegundo (UTC) do dia seguinte."""
+    return int(np.datetime64(day + timedelta(days=1), 'ms').astype(np.int64))
+
+def dwell_intervals(transitions: ListTransitionIndex, as_of: Optional[date] = None) -> DwellIntervals:
+    """
+    Calcula todos os intervalos de permanência de uma vez.
+
+    Args:
+        transitions: Índice de movimentações
+        as_of: Data de referência - fecha o intervalo em aberto de cada card
+            nessa data e descarta movimentações posteriores (None = apenas
+            intervalos já encerrados)
+
+    Returns:
+        Intervalos de permanência
+    """
+    cards, times, lists = transitions.cards, transitions.times, transitions.lists
+
+    has_next = np.zeros(len(cards), dtype=bool)
+    has_next[:-1] = cards[1:] == cards[:-1]
+    next_times = np.zeros_like(times)
+    next_times[:-1] = times[1:]
+
+    if as_of is None:
+        keep = has_next
+        ends = next_times
+        closed = has_next
+    else:
+        limit = _day_end_ms(as_of)
+        closed = has_next & (next_times < limit)
+        ends = np.where(closed, next_times, limit)
+        keep = times < limit
+
+    return DwellIntervals(
+        cards=cards[keep],
+        lists=lists[keep],
+        starts=times[keep],
+        ends=ends[keep],
+        ongoing=~closed[keep]
+    )
+
+def index_lists(index: BoardIndex) -> List[Dict[str, Any]]:
+    """Listas do board no formato do Trello, a partir do BoardIndex."""
+    return [{'id': list_id, 'name': info.name} for list_id, info in index.lists_by_id.items()]
+
+def _sorted_quantile(sorted_values: np.ndarray, q: float) -> float:
+    """Quantil com interpolação linear sobre um array já ordenado."""
+    position = (len(sorted_values) - 1) * q
+    lower = int(np.floor(position))
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return float(sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower))
+
+def group_stages(grupo: GrupoMarketing) -> List[str]:
+    """Etapas de um grupo na ordem do fluxo (abertura e finalização)."""
+    stages = []
+    for etapa in grupo.etapas_abertura + grupo.etapas_finalizacao:
+        if etapa not in stages:
+            stages.append(etapa)
+    return stages
+
+def _stage_codes(transitions: ListTransitionIndex, stages: List[str], names: Dict[str, str]) -> np.ndarray:
+    """Etapa (índice em stages, -1 se nenhuma) de cada lista do índice."""
+    codes = np.full(len(transitions.list_ids), -1, dtype=np.int64)
+    for code, list_id in enumerate(transitions.list_ids):
+        list_name_upper = (names.get(list_id) or '').upper()
+        for stage, etapa in enumerate(stages):
+            if etapa in list_name_upper:
+                codes[code] = stage
+                break
+    return codes
+
+def _group_membership(transitions: ListTransitionIndex, index: BoardIndex) -> Dict[str, np.ndarray]:
+    """Máscara, por grupo, dos cards (códigos do índice de movimentações) do grupo."""
+    positions = {card.get('id'): position for position, card in enumerate(index.cards)}
+    membership = {grupo.name: np.zeros(len(transitions.card_ids), dtype=bool) for grupo in GRUPOS_MARKETING}
+
+    for code, card_id in enumerate(transitions.card_ids):
+        position = positions.get(card_id)
+        if position is None:
+            continue
+        for grupo_name in index.card_group_names(index.cards[position]):
+            if grupo_name in membership:
+                membership[grupo_name][code] = True
+    return membership
+
+def _summarize(grupo: str, etapa: str, cards: np.ndarray, durations: np.ndarray) -> StageCycleTime:
+    """Percentis de um conjunto de intervalos."""
+    sorted_days = np.sort(durations) / MS_PER_DAY
+    return StageCycleTime(
+        grupo=grupo,
+        etapa=etapa,
+        cards=int(np.unique(cards).size),
+        intervals=len(sorted_days),
+        p50_days=round(_sorted_quantile(sorted_days, 0.5), 1),
+        p90_days=round(_sorted_quantile(sorted_days, 0.9), 1)
+    )
+
+def stage_cycle_times(transitions: ListTransitionIndex, index: BoardIndex, as_of: date,
+                      start_date: Optional[date] = None, end_date: Optional[date] = None,
+                      include_ongoing: bool = False,
+                      lists: Optional[List[Dict[str, Any]]] = None) -> List[StageCycleTime]:
+    """
+    Percentis (p50/p90) de permanência por grupo e etapa.
+
+    Args:
+        transitions: Índice de movimentações
+        index: Índice do board (define o grupo de cada card)
+        as_of: Data de referência
+        start_date: Considera intervalos encerrados a partir desta data
+        end_date: Considera intervalos encerrados até esta data
+        include_ongoing: Inclui a permanência atual (ainda em aberto) dos cards
+        lists: Listas do board (complementam os nomes vistos nas ações)
+
+    Returns:
+        Lista de StageCycleTime, na ordem dos grupos e das etapas
+    """
+    if len(transitions) == 0:
+        return []
+
+    board_lists = lists if lists is not None else index_lists(index)
+    names = dict(transitions.list_names)
+    for lista in board_lists:
+        names.setdefault(lista['id'], lista['name'])
+
+    intervals = dwell_intervals(transitions, as_of)
+    in_period = np.ones(len(intervals.starts), dtype=bool)
+    if start_date is not None:
+        in_period &= intervals.ends >= int(np.datetime64(start_date, 'ms').astype(np.int64))
+    if end_date is not None:
+        in_period &= intervals.ends < _day_end_ms(end_date)
+    if not include_ongoing:
+        in_period &= ~intervals.ongoing
+
+    membership = _group_membership(transitions, index)
+    done_codes = transitions.done_list_codes(board_lists)
+    completion_rows = transitions.last_rows_in(done_codes) if done_codes else np.array([], dtype=np.int64)
+    completion_rows = completion_rows[transitions.times[completion_rows] < _day_end_ms(as_of)]
+
+    results = []
+    for grupo in GRUPOS_MARKETING:
+        stages = group_stages(grupo)
+        stage_of_list = _stage_codes(transitions, stages, names)
+
+        interval_stages = stage_of_list[intervals.lists]
+        mask = in_period & (interval_stages >= 0) & membership[grupo.name][intervals.cards]
+
+        # Ordena por (etapa, duração) e separa cada etapa com busca binária
+        keys = interval_stages[mask]
+        durations = intervals.durations[mask]
+        cards = intervals.cards[mask]
+        order = np.lexsort((durations, keys))
+        keys, durations, cards = keys[order], durations[order], cards[order]
+        bounds = np.searchsorted(keys, np.arange(len(stages) + 1))
+
+        for stage, etapa in enumerate(stages):
+            lo, hi = bounds[stage], bounds[stage + 1]
+            if hi > lo:
+                results.append(_summarize(grupo.name, etapa, cards[lo:hi], durations[lo:hi]))
+
+        # Ciclo completo: primeira abertura -> conclusão
+        opening_codes = np.flatnonzero(stage_of_list >= 0)
+        opening_codes = [code for code in opening_codes.tolist()
+                         if stages[stage_of_list[code]] in grupo.etapas_abertura]
+        if not opening_codes or len(completion_rows) == 0:
+            continue
+
+        first_rows = transitions.first_rows_in(opening_codes)
+        opened_at = np.full(len(transitions.card_ids), -1, dtype=np.int64)
+        opened_at[transitions.cards[first_rows]] = transitions.times[first_rows]
+
+        done_cards = transitions.cards[completion_rows]
+        done_at = transitions.times[completion_rows]
+        started = opened_at[done_cards]
+        cycle_mask = (started >= 0) & (done_at > started) & membership[grupo.name][done_cards]
+        if start_date is not None:
+            cycle_mask &= done_at >= int(np.datetime64(start_date, 'ms').astype(np.int64))
+        if end_date is not None:
+            cycle_mask &= done_at < _day_end_ms(end_date)
+
+        if cycle_mask.any():
+            results.append(_summarize(
+                grupo.name, FULL_CYCLE_STAGE,
+                done_cards[cycle_mask], done_at[cycle_mask] - started[cycle_mask]
+            ))
+
+    return results
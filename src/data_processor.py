@@ -2,14 +2,18 @@
 Processador de dados do Trello - Replica a lógica completa do sistema TypeScript.
 """
 
-import pandas as pd
+import numpy as np
 from datetime import datetime, date
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import logging
 from dataclasses import dataclass
 
+from .actions import ListTransitionIndex, is_done_list_name
+from .board_index import BoardIndex, card_created_at
+from .profiling import timed_stage
 from .config import (
     GRUPOS_MARKETING, CONTENT_CREATORS, LIST_STATUS_MAP, STATUS_COLORS,
+    COMPLETED_LIST_KEYWORDS, PROCESSING_ENGINE, NO_GROUP,
     get_grupo_por_responsavel, get_etapa_atual, is_finalizada_para_flavia, 
     is_feita, is_em_revisao, GrupoMarketing
 )
@@ -36,6 +40,7 @@ class TaskReport:
     finalizada_para_flavia: bool
     feita: bool
     em_revisao: bool
+    business_days_late: int = 0  # Atraso em dias úteis (sem feriados)
 
 @dataclass
 class CollaboratorReport:
@@ -50,6 +55,7 @@ class CollaboratorReport:
     completion_rate: float
     average_days_late: int
     tasks: List[TaskReport]
+    average_business_days_late: int = 0
 
 @dataclass
 class GroupReportSummary:
@@ -63,6 +69,7 @@ class GroupReportSummary:
     blocked_tasks: int
     on_time_deliveries: int
     late_deliveries: int
+    average_business_days_late: int = 0
 
 @dataclass
 class ReportSummary:
@@ -75,15 +82,50 @@ class ReportSummary:
     blocked_tasks: int
     total_collaborators: int
     group_summaries: List[GroupReportSummary]
+    average_business_days_late: int = 0
+
+REFERENCE_ENGINE = 'reference'
 
 class TrelloDataProcessor:
     """
     Processador de dados do Trello que replica a lógica completa do sistema TypeScript.
+    
+    Funciona como fachada para motores de processamento selecionáveis. O motor
+    'reference' é a implementação desta classe; outros motores (ver
+    src/engines.py) só devem ser ativados após o harness de paridade.
     """
     
-    def __init__(self):
-        """Inicializa o processador."""
+    def __init__(self, engine: str = PROCESSING_ENGINE, as_of: Optional[date] = None):
+        """
+        Inicializa o processador.
+        
+        Args:
+            engine: Nome do motor de processamento ('reference' por padrão)
+            as_of: Data de referência para atrasos (padrão: hoje, no momento de cada execução)
+        """
         self.logger = logging.getLogger(__name__)
+        self.engine_name = engine
+        self.as_of = as_of
+        self.engine = None
+        
+        if engine != REFERENCE_ENGINE:
+            from .engines import create_engine
+            self.engine = create_engine(engine, self)
+    
+    def get_reference_date(self, as_of: Optional[date] = None) -> date:
+        """
+        Resolve a data de referência usada nos cálculos de atraso.
+        
+        Com a data fixada, os relatórios passam a ser função pura de
+        (board, período, grupos, as_of).
+        
+        Args:
+            as_of: Data explícita (tem prioridade sobre a do processador)
+            
+        Returns:
+            Data de referência
+        """
+        return as_of or self.as_of or date.today()
     
     def validate_trello_data(self, data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -113,6 +155,7 @@ class TrelloDataProcessor:
             
         return len(errors) == 0, errors
     
+    @timed_stage('filtro por período', count_rows=True)
     def filter_cards_by_date_range(self, cards: List[Dict], start_date: date, end_date: date, lists: List[Dict] = None) -> List[Dict]:
         """
         Filtra cards por período de data com lógica inteligente.
@@ -138,8 +181,7 @@ class TrelloDataProcessor:
         if lists:
             for lista in lists:
                 list_name_upper = lista['name'].upper().strip()
-                completed_keywords = ['FEITO', 'FEITOS', 'CONCLUÍ', 'FINALIZADO', 'COMPLETO', 'DONE', 'FINISHED']
-                if any(keyword in list_name_upper for keyword in completed_keywords):
+                if any(keyword in list_name_upper for keyword in COMPLETED_LIST_KEYWORDS):
                     completed_list_ids.add(lista['id'])
                     logger.info(f"📋 Lista identificada como CONCLUÍDA: {lista['name']}")
         
@@ -211,7 +253,8 @@ class TrelloDataProcessor:
         
         return filtered_cards
     
-    def get_task_status(self, card: Dict, lists: List[Dict], members: List[Dict]) -> str:
+    @timed_stage('classificação de status')
+    def get_task_status(self, card: Dict, lists: List[Dict], members: List[Dict], as_of: Optional[date] = None) -> str:
         """
         Obtém o status da tarefa baseado na lista.
         
@@ -219,6 +262,7 @@ class TrelloDataProcessor:
             card: Card do Trello
             lists: Listas do board
             members: Membros do board
+            as_of: Data de referência (padrão: get_reference_date())
             
         Returns:
             Status da tarefa
@@ -238,8 +282,7 @@ class TrelloDataProcessor:
         logger.info(f"🔍 Analisando status do card \"{card.get('name')}\" na lista \"{list_obj['name']}\"")
         
         # Verificação prioritária para listas de "concluído"
-        completed_keywords = ['FEITO', 'FEITOS', 'CONCLUÍ', 'FINALIZADO', 'COMPLETO', 'DONE', 'FINISHED']
-        is_completed = any(keyword in list_name_upper for keyword in completed_keywords)
+        is_completed = any(keyword in list_name_upper for keyword in COMPLETED_LIST_KEYWORDS)
         
         if is_completed:
             logger.info(f"✅ TAREFA CONCLUÍDA detectada: \"{card.get('name')}\" na lista \"{list_obj['name']}\"")
@@ -259,7 +302,7 @@ class TrelloDataProcessor:
             
             # Verificar se está atrasada (exceto se concluída)
             if direct_status != 'Concluída' and card.get('due'):
-                if self._is_overdue(card):
+                if self._is_overdue(card, as_of):
                     logger.info(f"⚠️ Tarefa ATRASADA detectada: \"{card.get('name')}\" (prazo: {card.get('due')})")
                     return 'Atrasada'
                     
@@ -279,14 +322,39 @@ class TrelloDataProcessor:
             return 'Recorrente'
             
         # Verificar se está atrasada (padrão para tarefas em andamento)
-        if card.get('due') and self._is_overdue(card):
+        if card.get('due') and self._is_overdue(card, as_of):
             logger.info(f"⚠️ Tarefa ATRASADA detectada: \"{card.get('name')}\" (prazo: {card.get('due')})")
             return 'Atrasada'
             
         logger.info(f"📋 Status padrão EM ANDAMENTO: \"{card.get('name')}\" na lista \"{list_obj['name']}\"")
         return 'Em Andamento'
     
-    def get_task_status_for_collaborator(self, card: Dict, collaborator_username: str, lists: List[Dict]) -> str:
+    def get_card_statuses(self, data: Dict[str, Any], as_of: Optional[date] = None,
+                          index: Optional[BoardIndex] = None) -> Dict[str, str]:
+        """
+        Status de todos os cards do board (mesmas regras de get_task_status).
+
+        Usa as listas pré-classificadas do BoardIndex, sem buscas nem logs por
+        card, para comparações que percorrem o board inteiro.
+
+        Args:
+            data: Dados do Trello
+            as_of: Data de referência (padrão: get_reference_date())
+            index: Índice do board (evita reconstruir)
+
+        Returns:
+            Dict id do card -> status
+        """
+        as_of = self.get_reference_date(as_of)
+        index = index or BoardIndex.from_data(data)
+        return {
+            card.get('id', ''): index.card_status(position, as_of)
+            for position, card in enumerate(index.cards)
+        }
+    
+    @timed_stage('classificação de status')
+    def get_task_status_for_collaborator(self, card: Dict, collaborator_username: str, lists: List[Dict],
+                                         as_of: Optional[date] = None) -> str:
         """
         Obtém status específico para criadores de conteúdo.
         
@@ -294,6 +362,7 @@ class TrelloDataProcessor:
             card: Card do Trello
             collaborator_username: Username do colaborador
             lists: Listas do board
+            as_of: Data de referência (padrão: get_reference_date())
             
         Returns:
             Status específico para o colaborador
@@ -305,7 +374,7 @@ class TrelloDataProcessor:
             
         # Verificar se é um criador de conteúdo
         if collaborator_username not in CONTENT_CREATORS:
-            return self.get_task_status(card, lists, [])  # Usar lógica padrão
+            return self.get_task_status(card, lists, [], as_of)  # Usar lógica padrão
             
         # Encontrar a lista do card
         list_obj = next((l for l in lists if l['id'] == card.get('idList')), None)
@@ -321,7 +390,7 @@ class TrelloDataProcessor:
             logger.info(f"📝 CRIADOR DE CONTEÚDO - \"{collaborator_username}\": tarefa \"{card.get('name')}\" ainda EM ANDAMENTO (na lista de conteúdo)")
             
             # Verificar se está atrasada
-            if card.get('due') and self._is_overdue(card):
+            if card.get('due') and self._is_overdue(card, as_of):
                 logger.info(f"⚠️ CRIADOR DE CONTEÚDO - Tarefa ATRASADA: \"{card.get('name')}\" (prazo: {card.get('due')})")
                 return 'Atrasada'
                 
@@ -331,12 +400,13 @@ class TrelloDataProcessor:
             logger.info(f"✅ CRIADOR DE CONTEÚDO - \"{collaborator_username}\": tarefa \"{card.get('name')}\" CONCLUÍDA (saiu da lista de conteúdo)")
             return 'Concluída'
     
-    def calculate_days_late(self, card: Dict) -> int:
+    def calculate_days_late(self, card: Dict, as_of: Optional[date] = None) -> int:
         """
         Calcula dias de atraso de uma tarefa.
         
         Args:
             card: Card do Trello
+            as_of: Data de referência (padrão: get_reference_date())
             
         Returns:
             Número de dias de atraso
@@ -356,7 +426,7 @@ class TrelloDataProcessor:
             else:
                 due_date = datetime.fromisoformat(due_date_str).date()
                 
-            today = date.today()
+            today = self.get_reference_date(as_of)
             
             if today <= due_date:
                 return 0
@@ -370,7 +440,8 @@ class TrelloDataProcessor:
             logger.error(f"Erro ao calcular atraso do card \"{card.get('name')}\": {e}")
             return 0
     
-    def calculate_days_late_for_collaborator(self, card: Dict, collaborator_username: str, lists: List[Dict]) -> int:
+    def calculate_days_late_for_collaborator(self, card: Dict, collaborator_username: str, lists: List[Dict],
+                                             as_of: Optional[date] = None) -> int:
         """
         Calcula dias de atraso específico para colaborador.
         
@@ -378,6 +449,7 @@ class TrelloDataProcessor:
             card: Card do Trello
             collaborator_username: Username do colaborador
             lists: Listas do board
+            as_of: Data de referência (padrão: get_reference_date())
             
         Returns:
             Número de dias de atraso específico para o colaborador
@@ -401,12 +473,12 @@ class TrelloDataProcessor:
                 return 0
                 
             # Se ainda está em "EM PROCESSO DE CONTEÚDO", calcular atraso normalmente
-            return self.calculate_days_late(card)
+            return self.calculate_days_late(card, as_of)
             
         # Para outros colaboradores, usar lógica padrão
-        return self.calculate_days_late(card)
+        return self.calculate_days_late(card, as_of)
     
-    def _is_overdue(self, card: Dict) -> bool:
+    def _is_overdue(self, card: Dict, as_of: Optional[date] = None) -> bool:
         """Verifica se um card está atrasado."""
         if not card.get('due'):
             return False
@@ -418,7 +490,7 @@ class TrelloDataProcessor:
             else:
                 due_date = datetime.fromisoformat(due_date_str).date()
                 
-            return date.today() > due_date
+            return self.get_reference_date(as_of) > due_date
             
         except (ValueError, TypeError):
             return False
@@ -441,7 +513,10 @@ class TrelloDataProcessor:
         member = next((m for m in members if m['id'] == id_members[0]), None)
         return member['fullName'] if member else 'Não atribuído'
     
-    def generate_task_reports(self, data: Dict[str, Any], start_date: date, end_date: date) -> List[TaskReport]:
+    def generate_task_reports(self, data: Dict[str, Any], start_date: date, end_date: date,
+                              as_of: Optional[date] = None,
+                              transitions: Optional[ListTransitionIndex] = None,
+                              card_cache: Optional[Any] = None) -> List[TaskReport]:
         """
         Gera relatórios de tarefas com lógica corrigida para evitar duplicações.
         
@@ -449,10 +524,29 @@ class TrelloDataProcessor:
             data: Dados do Trello
             start_date: Data de início
             end_date: Data de fim
+            as_of: Data de referência para atrasos (resolvida uma única vez por execução)
+            transitions: Índice de movimentações já construído (ex.:
+                ListTransitionIndex.from_file/from_data); sem ele, tarefas concluídas
+                usam a última atividade no lugar da data de conclusão
+            card_cache: CardReportCache - reclassifica apenas os cards cuja
+                impressão digital mudou (ver src/card_cache.py)
             
         Returns:
             Lista de relatórios de tarefas
         """
+        as_of = self.get_reference_date(as_of)
+        
+        if card_cache is not None:
+            from .card_cache import generate_cached_task_reports
+            return generate_cached_task_reports(
+                self, data, start_date, end_date, as_of, card_cache, transitions=transitions
+            )
+        
+        if self.engine is not None:
+            reports = self.engine.generate_task_reports(data, start_date, end_date, as_of)
+            self.finalize_task_reports(reports, data, as_of, transitions)
+            return reports
+        
         cards = data.get('cards', [])
         lists = data.get('lists', [])
         members = data.get('members', [])
@@ -463,130 +557,320 @@ class TrelloDataProcessor:
         logger.info('=== GERAÇÃO DE RELATÓRIOS DE TAREFAS ===')
         logger.info(f'Total de cards filtrados: {len(filtered_cards)}')
         
-        for card in filtered_cards:
-            list_obj = next((l for l in lists if l['id'] == card.get('idList')), None)
-            list_name = list_obj['name'] if list_obj else 'Lista não encontrada'
+        # Data de criação decodificada dos IDs de todos os cards de uma vez
+        created_dates = card_created_at(filtered_cards)
+        
+        for card, created_at in zip(filtered_cards, created_dates):
+            reports.extend(self.card_task_reports(card, lists, members, created_at, as_of))
+        
+        self.finalize_task_reports(reports, data, as_of, transitions)
+        
+        logger.info(f"=== TOTAL DE REPORTS GERADOS: {len(reports)} ===")
+        
+        # Debug: mostrar breakdown de reports por grupo
+        reports_por_grupo = {}
+        for report in reports:
+            grupo = report.grupo or NO_GROUP
+            reports_por_grupo[grupo] = reports_por_grupo.get(grupo, 0) + 1
             
-            id_members = card.get('idMembers', [])
+        logger.info('📊 Breakdown de reports por grupo:')
+        for grupo, count in reports_por_grupo.items():
+            logger.info(f"  {grupo}: {count} reports")
             
-            if not id_members:
-                # Card sem colaboradores atribuídos
-                task_status = self.get_task_status(card, lists, members)
-                due_date_str = self._format_due_date(card.get('due'))
-                
-                reports.append(TaskReport(
-                    task_id=card.get('id', ''),
-                    collaborator_name='Não atribuído',
-                    task_name=card.get('name', ''),
-                    list_name=list_name,
-                    due_date=due_date_str,
-                    created_at=card.get('dateLastActivity', ''),
-                    completed_at=card.get('dateLastActivity', '') if task_status == 'Concluída' else None,
-                    status=task_status,
-                    days_late=self.calculate_days_late(card),
-                    observations=card.get('desc', '') or list_name,
-                    grupo=None,
-                    etapa_atual=get_etapa_atual(list_name),
-                    finalizada_para_flavia=False,
-                    feita=False,
-                    em_revisao=is_em_revisao(list_name)
-                ))
-                
-                logger.info(f"✅ Adicionado card sem atribuição: \"{card.get('name')}\"")
-            else:
-                # Card com colaboradores - LÓGICA CORRIGIDA
-                card_members = [m for m in members if m['id'] in id_members]
-                
-                # Mapear membros por grupo para evitar duplicações
-                grupos_encontrados = set()
-                membros_sem_grupo = []
-                
-                # Primeiro, identificar todos os grupos únicos dos membros
-                for member in card_members:
-                    grupo = get_grupo_por_responsavel(member['username'])
-                    if grupo:
-                        grupos_encontrados.add(grupo.name)
-                    else:
-                        membros_sem_grupo.append(member)
-                
-                # Criar UMA entrada por grupo (não por membro do grupo)
-                for nome_grupo in grupos_encontrados:
-                    grupo = next((g for g in GRUPOS_MARKETING if g.name == nome_grupo), None)
-                    if not grupo:
-                        continue
-                        
-                    # Pegar todos os membros deste grupo que estão no card
-                    membros_do_grupo = [m for m in card_members 
-                                      if get_grupo_por_responsavel(m['username']) and 
-                                         get_grupo_por_responsavel(m['username']).name == nome_grupo]
-                    
-                    collaborator_names = ', '.join(m['fullName'] for m in membros_do_grupo)
-                    primeiro_membro = membros_do_grupo[0] if membros_do_grupo else None
+        return reports
+
+    def card_task_reports(self, card: Dict, lists: List[Dict], members: List[Dict], created_at: str,
+                          as_of: date) -> List[TaskReport]:
+        """
+        Gera os relatórios de um único card pelo motor de referência.
+        
+        Args:
+            card: Card do Trello
+            lists: Listas do board
+            members: Membros do board
+            created_at: Data de criação do card (ISO, ver card_created_at)
+            as_of: Data de referência (já resolvida)
+            
+        Returns:
+            Uma entrada por grupo e uma por membro sem grupo (ou uma "Não atribuído")
+        """
+        reports = []
+        list_obj = next((l for l in lists if l['id'] == card.get('idList')), None)
+        list_name = list_obj['name'] if list_obj else 'Lista não encontrada'
+        
+        id_members = card.get('idMembers', [])
+        
+        if not id_members:
+            # Card sem colaboradores atribuídos
+            task_status = self.get_task_status(card, lists, members, as_of)
+            due_date_str = self._format_due_date(card.get('due'))
+            
+            reports.append(TaskReport(
+                task_id=card.get('id', ''),
+                collaborator_name='Não atribuído',
+                task_name=card.get('name', ''),
+                list_name=list_name,
+                due_date=due_date_str,
+                created_at=created_at,
+                completed_at=card.get('dateLastActivity', '') if task_status == 'Concluída' else None,
+                status=task_status,
+                days_late=self.calculate_days_late(card, as_of),
+                observations=card.get('desc', '') or list_name,
+                grupo=None,
+                etapa_atual=get_etapa_atual(list_name),
+                finalizada_para_flavia=False,
+                feita=False,
+                em_revisao=is_em_revisao(list_name)
+            ))
+            
+            logger.info(f"✅ Adicionado card sem atribuição: \"{card.get('name')}\"")
+        else:
+            # Card com colaboradores - LÓGICA CORRIGIDA
+            card_members = [m for m in members if m['id'] in id_members]
+            
+            # Mapear membros por grupo para evitar duplicações
+            grupos_encontrados = set()
+            membros_sem_grupo = []
+            
+            # Primeiro, identificar todos os grupos únicos dos membros
+            for member in card_members:
+                grupo = get_grupo_por_responsavel(member['username'])
+                if grupo:
+                    grupos_encontrados.add(grupo.name)
+                else:
+                    membros_sem_grupo.append(member)
+            
+            # Criar UMA entrada por grupo (não por membro do grupo)
+            for nome_grupo in grupos_encontrados:
+                grupo = next((g for g in GRUPOS_MARKETING if g.name == nome_grupo), None)
+                if not grupo:
+                    continue
                     
-                    if primeiro_membro:
-                        task_status = self.get_task_status_for_collaborator(card, primeiro_membro['username'], lists)
-                        days_late = self.calculate_days_late_for_collaborator(card, primeiro_membro['username'], lists)
-                        due_date_str = self._format_due_date(card.get('due'))
-                        
-                        reports.append(TaskReport(
-                            task_id=card.get('id', ''),
-                            collaborator_name=collaborator_names,
-                            task_name=card.get('name', ''),
-                            list_name=list_name,
-                            due_date=due_date_str,
-                            created_at=card.get('dateLastActivity', ''),
-                            completed_at=card.get('dateLastActivity', '') if task_status == 'Concluída' else None,
-                            status=task_status,
-                            days_late=days_late,
-                            observations=card.get('desc', '') or list_name,
-                            grupo=grupo.name,
-                            etapa_atual=get_etapa_atual(list_name),
-                            finalizada_para_flavia=is_finalizada_para_flavia(list_name, grupo),
-                            feita=is_feita(list_name, grupo),
-                            em_revisao=is_em_revisao(list_name)
-                        ))
-                        
-                        logger.info(f"✅ Adicionado card para {grupo.name}: \"{card.get('name')}\" - Colaboradores: {collaborator_names}")
+                # Pegar todos os membros deste grupo que estão no card
+                membros_do_grupo = [m for m in card_members 
+                                  if get_grupo_por_responsavel(m['username']) and 
+                                     get_grupo_por_responsavel(m['username']).name == nome_grupo]
                 
-                # Criar entradas individuais para membros sem grupo
-                for member in membros_sem_grupo:
-                    task_status = self.get_task_status_for_collaborator(card, member['username'], lists)
-                    days_late = self.calculate_days_late_for_collaborator(card, member['username'], lists)
+                collaborator_names = ', '.join(m['fullName'] for m in membros_do_grupo)
+                primeiro_membro = membros_do_grupo[0] if membros_do_grupo else None
+                
+                if primeiro_membro:
+                    task_status = self.get_task_status_for_collaborator(card, primeiro_membro['username'], lists, as_of)
+                    days_late = self.calculate_days_late_for_collaborator(card, primeiro_membro['username'], lists, as_of)
                     due_date_str = self._format_due_date(card.get('due'))
                     
                     reports.append(TaskReport(
                         task_id=card.get('id', ''),
-                        collaborator_name=member['fullName'],
+                        collaborator_name=collaborator_names,
                         task_name=card.get('name', ''),
                         list_name=list_name,
                         due_date=due_date_str,
-                        created_at=card.get('dateLastActivity', ''),
+                        created_at=created_at,
                         completed_at=card.get('dateLastActivity', '') if task_status == 'Concluída' else None,
                         status=task_status,
                         days_late=days_late,
                         observations=card.get('desc', '') or list_name,
-                        grupo=None,
+                        grupo=grupo.name,
                         etapa_atual=get_etapa_atual(list_name),
-                        finalizada_para_flavia=False,
-                        feita=False,
+                        finalizada_para_flavia=is_finalizada_para_flavia(list_name, grupo),
+                        feita=is_feita(list_name, grupo),
                         em_revisao=is_em_revisao(list_name)
                     ))
                     
-                    logger.info(f"✅ Adicionado card para membro sem grupo: \"{card.get('name')}\" - Colaborador: {member['fullName']}")
+                    logger.info(f"✅ Adicionado card para {grupo.name}: \"{card.get('name')}\" - Colaboradores: {collaborator_names}")
+            
+            # Criar entradas individuais para membros sem grupo
+            for member in membros_sem_grupo:
+                task_status = self.get_task_status_for_collaborator(card, member['username'], lists, as_of)
+                days_late = self.calculate_days_late_for_collaborator(card, member['username'], lists, as_of)
+                due_date_str = self._format_due_date(card.get('due'))
+                
+                reports.append(TaskReport(
+                    task_id=card.get('id', ''),
+                    collaborator_name=member['fullName'],
+                    task_name=card.get('name', ''),
+                    list_name=list_name,
+                    due_date=due_date_str,
+                    created_at=created_at,
+                    completed_at=card.get('dateLastActivity', '') if task_status == 'Concluída' else None,
+                    status=task_status,
+                    days_late=days_late,
+                    observations=card.get('desc', '') or list_name,
+                    grupo=None,
+                    etapa_atual=get_etapa_atual(list_name),
+                    finalizada_para_flavia=False,
+                    feita=False,
+                    em_revisao=is_em_revisao(list_name)
+                ))
+                
+                logger.info(f"✅ Adicionado card para membro sem grupo: \"{card.get('name')}\" - Colaborador: {member['fullName']}")
         
-        logger.info(f"=== TOTAL DE REPORTS GERADOS: {len(reports)} ===")
+        return reports
+    
+    def card_reports(self, data: Dict[str, Any], index: BoardIndex, position: int, as_of: date) -> List[TaskReport]:
+        """
+        Gera os relatórios de um card do índice pelo motor configurado.
         
-        # Debug: mostrar breakdown de reports por grupo
-        reports_por_grupo = {}
-        for report in reports:
-            grupo = report.grupo or 'Sem Grupo'
-            reports_por_grupo[grupo] = reports_por_grupo.get(grupo, 0) + 1
+        Usado no processamento card a card (cache por card, períodos múltiplos,
+        board ao vivo); sem as etapas finais (finalize_task_reports).
+        
+        Args:
+            data: Dados do Trello
+            index: Índice do board
+            position: Posição do card em index.cards
+            as_of: Data de referência (já resolvida)
             
-        logger.info('📊 Breakdown de reports por grupo:')
-        for grupo, count in reports_por_grupo.items():
-            logger.info(f"  {grupo}: {count} reports")
+        Returns:
+            Relatórios do card
+        """
+        if self.engine is not None:
+            return self.engine.card_reports(index, position, as_of)
+        return self.card_task_reports(
+            index.cards[position], data.get('lists', []), data.get('members', []),
+            index.created_at_iso[position], as_of
+        )
+    
+    def generate_board_reports(self, data: Dict[str, Any], index: Optional[BoardIndex] = None,
+                               as_of: Optional[date] = None,
+                               transitions: Optional[ListTransitionIndex] = None,
+                               card_cache: Optional[Any] = None) -> Tuple[List[TaskReport], List[date]]:
+        """
+        Gera os relatórios do board inteiro e o dia de cada um.
+        
+        O período cobre todas as datas do filtro de período dos cards, então
+        qualquer período menor é um recorte destes relatórios pelo dia (base do
+        cubo, dos rollups, do histórico e do watcher).
+        
+        Args:
+            data: Dados do Trello
+            index: Índice do board (evita reconstruir)
+            as_of: Data de referência para atrasos
+            transitions: Índice de movimentações (ver generate_task_reports)
+            card_cache: CardReportCache (ver generate_task_reports)
             
-        return reports
+        Returns:
+            (relatórios de tarefas, dia do filtro de período de cada relatório)
+        """
+        index = index or BoardIndex.from_data(data)
+        period_dates = [d for d in index.period_dates if d is not None]
+        if not period_dates:
+            return [], []
+        
+        task_reports = self.generate_task_reports(
+            data, min(period_dates), max(period_dates), as_of=as_of,
+            transitions=transitions, card_cache=card_cache
+        )
+        day_by_card = {card.get('id', ''): day for card, day in zip(index.cards, index.period_dates)}
+        return task_reports, [day_by_card[t.task_id] for t in task_reports]
+    
+    def generate_window_reports(self, data: Dict[str, Any], windows: List[Tuple[date, date]],
+                                as_of: Optional[date] = None,
+                                transitions: Optional[ListTransitionIndex] = None,
+                                include_collaborators: bool = False,
+                                task_filter: Optional[Callable[[TaskReport], bool]] = None) -> List[Any]:
+        """
+        Gera relatórios e resumos de vários períodos em uma única passada pelo board.
+        
+        Equivale a chamar generate_task_reports/generate_report_summary para cada
+        período, mas cada card é classificado uma única vez (ver src/windows.py).
+        
+        Args:
+            data: Dados do Trello
+            windows: Lista de (data de início, data de fim)
+            as_of: Data de referência para atrasos
+            transitions: Índice de movimentações (ver generate_task_reports)
+            include_collaborators: Também gera os relatórios por colaborador
+            task_filter: Filtro aplicado aos relatórios antes dos resumos
+            
+        Returns:
+            Lista de WindowReport, um por período
+        """
+        from .windows import generate_window_reports
+        
+        return generate_window_reports(
+            self, data, windows, as_of=as_of, transitions=transitions,
+            include_collaborators=include_collaborators, task_filter=task_filter
+        )
+    
+    def finalize_task_reports(self, task_reports: List[TaskReport], data: Dict[str, Any], as_of: date,
+                              transitions: Optional[ListTransitionIndex] = None) -> None:
+        """
+        Etapas comuns a todos os motores, aplicadas sobre os relatórios já gerados.
+        
+        Args:
+            task_reports: Lista de relatórios de tarefas (alterada no lugar)
+            data: Dados do Trello
+            as_of: Data de referência usada no cálculo de days_late
+            transitions: Índice de movimentações (None: sem datas de conclusão;
+                o índice nunca é montado aqui a partir de data['actions'])
+        """
+        end_dates = np.datetime64(as_of, 'D')
+        if transitions is not None:
+            completions = transitions.completion_times(data.get('lists', []))
+            end_dates = self.apply_completion_dates(task_reports, completions, as_of)
+        
+        self.apply_business_days_late(task_reports, end_dates)
+    
+    @timed_stage('datas de conclusão')
+    def apply_completion_dates(self, task_reports: List[TaskReport], completions: Dict[str, datetime],
+                               as_of: date) -> np.ndarray:
+        """
+        Substitui a última atividade pela data real de conclusão (entrada em FEITO/FEITOS).
+        
+        O atraso de tarefas concluídas passa a ser medido até a conclusão, e não
+        até a data de referência, o que separa entregas no prazo das atrasadas.
+        
+        Args:
+            task_reports: Lista de relatórios de tarefas (alterada no lugar)
+            completions: Data de conclusão por card (ListTransitionIndex.completion_times)
+            as_of: Data de referência usada no cálculo de days_late
+            
+        Returns:
+            Data final do atraso de cada relatório (datetime64[D])
+        """
+        end_dates = np.full(len(task_reports), np.datetime64(as_of, 'D'))
+        
+        for position, task in enumerate(task_reports):
+            if task.status != 'Concluída' or not is_done_list_name(task.list_name):
+                continue
+            
+            completed = completions.get(task.task_id)
+            if completed is None or completed.date() > as_of:
+                continue
+            
+            completed_date = completed.date()
+            task.completed_at = completed.strftime('%Y-%m-%dT%H:%M:%S.') + f'{completed.microsecond // 1000:03d}Z'
+            if task.days_late > 0:
+                due_date = date.fromordinal(as_of.toordinal() - task.days_late)
+                task.days_late = max(0, (completed_date - due_date).days)
+            end_dates[position] = np.datetime64(completed_date, 'D')
+        
+        return end_dates
+    
+    @timed_stage('dias úteis de atraso')
+    def apply_business_days_late(self, task_reports: List[TaskReport], end_dates: Any) -> None:
+        """
+        Preenche business_days_late de todos os relatórios em uma única operação vetorizada.
+        
+        Args:
+            task_reports: Lista de relatórios de tarefas (alterada no lugar)
+            end_dates: Data final do atraso - a data de referência ou um array por relatório
+        """
+        from .business_days import business_days_late
+        
+        if not task_reports:
+            return
+        
+        days_late = np.fromiter((t.days_late for t in task_reports), dtype=np.int64, count=len(task_reports))
+        business_days = business_days_late(days_late, end_dates)
+        
+        for task, value in zip(task_reports, business_days.tolist()):
+            task.business_days_late = value
+    
+    def _average_business_days_late(self, tasks: List[TaskReport]) -> int:
+        """Média de atraso em dias úteis das tarefas realmente atrasadas (não concluídas)."""
+        late_days = [t.business_days_late for t in tasks if t.days_late > 0 and t.status in ['Atrasada', 'Em Andamento']]
+        return round(sum(late_days) / len(late_days)) if late_days else 0
     
     def generate_report_summary(self, task_reports: List[TaskReport]) -> ReportSummary:
         """
@@ -598,6 +882,9 @@ class TrelloDataProcessor:
         Returns:
             Resumo do relatório
         """
+        if self.engine is not None:
+            return self.engine.generate_report_summary(task_reports)
+        
         logger.info('=== GERAÇÃO DE RESUMO DO RELATÓRIO ===')
         logger.info(f'Total de task reports para resumo: {len(task_reports)}')
         
@@ -664,7 +951,8 @@ class TrelloDataProcessor:
                 late_tasks=late,
                 blocked_tasks=blocked,
                 on_time_deliveries=on_time,
-                late_deliveries=late_deliv
+                late_deliveries=late_deliv,
+                average_business_days_late=self._average_business_days_late(unique_group_tasks)
             ))
         
         # Adicionar grupo "Sem Grupo" se houver tarefas sem grupo
@@ -689,7 +977,7 @@ class TrelloDataProcessor:
             logger.info(f"📊 Sem Grupo: {len(unique_sem_grupo_tasks)} tarefas únicas ({completed} concluídas, {in_progress} em andamento, {late} atrasadas)")
             
             group_summaries.append(GroupReportSummary(
-                grupo='Sem Grupo',
+                grupo=NO_GROUP,
                 responsaveis=[],
                 total_tasks=len(unique_sem_grupo_tasks),
                 completed_tasks=completed,
@@ -697,7 +985,8 @@ class TrelloDataProcessor:
                 late_tasks=late,
                 blocked_tasks=blocked,
                 on_time_deliveries=on_time,
-                late_deliveries=late_deliv
+                late_deliveries=late_deliv,
+                average_business_days_late=self._average_business_days_late(unique_sem_grupo_tasks)
             ))
         
         logger.info('==============================')
@@ -710,7 +999,8 @@ class TrelloDataProcessor:
             overdue_tasks=overdue_tasks,
             blocked_tasks=blocked_tasks,
             total_collaborators=total_collaborators,
-            group_summaries=group_summaries
+            group_summaries=group_summaries,
+            average_business_days_late=self._average_business_days_late(unique_tasks)
         )
     
     def generate_collaborator_reports(self, task_reports: List[TaskReport]) -> List[CollaboratorReport]:
@@ -723,6 +1013,9 @@ class TrelloDataProcessor:
         Returns:
             Lista de relatórios de colaboradores
         """
+        if self.engine is not None:
+            return self.engine.generate_collaborator_reports(task_reports)
+        
         collaborator_map = {}
         
         logger.info('=== GERAÇÃO DE RELATÓRIOS DE COLABORADORES ===')
@@ -757,7 +1050,8 @@ class TrelloDataProcessor:
                         etapa_atual=task.etapa_atual,
                         finalizada_para_flavia=task.finalizada_para_flavia,
                         feita=task.feita,
-                        em_revisao=task.em_revisao
+                        em_revisao=task.em_revisao,
+                        business_days_late=task.business_days_late
                     )
                     collaborator_map[nome].append(task_copy)
             else:
@@ -813,7 +1107,8 @@ class TrelloDataProcessor:
                 blocked_tasks=blocked_tasks,
                 completion_rate=completion_rate,
                 average_days_late=round(average_days_late),
-                tasks=sorted_tasks
+                tasks=sorted_tasks,
+                average_business_days_late=self._average_business_days_late(unique_tasks)
             ))
         
         # Ordenar por taxa de conclusão
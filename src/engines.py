@@ -0,0 +1,349 @@
+"""
+Motores de processamento alternativos para o TrelloDataProcessor.
+
+O motor 'reference' é a própria implementação do TrelloDataProcessor. Os
+motores registrados aqui precisam produzir exatamente os mesmos relatórios;
+use o harness de paridade (src/parity.py) antes de ativá-los em config.py.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import replace
+from datetime import date
+from typing import Dict, List, Any, Optional, Type
+import logging
+
+from .config import GRUPOS_MARKETING, NO_GROUP, CONTENT_CREATORS, get_etapa_atual, is_finalizada_para_flavia, is_feita, is_em_revisao
+from .board_index import BoardIndex, ListInfo
+from .profiling import timed_stage
+from .data_processor import (
+    TaskReport, CollaboratorReport, GroupReportSummary, ReportSummary, REFERENCE_ENGINE
+)
+
+logger = logging.getLogger(__name__)
+
+ENGINES: Dict[str, Type['ProcessingEngine']] = {}
+
+def register_engine(engine_cls: Type['ProcessingEngine']) -> Type['ProcessingEngine']:
+    """Registra um motor de processamento pelo seu nome."""
+    ENGINES[engine_cls.name] = engine_cls
+    return engine_cls
+
+def available_engines() -> List[str]:
+    """Lista os motores disponíveis, começando pelo de referência."""
+    return [REFERENCE_ENGINE] + sorted(ENGINES)
+
+def create_engine(name: str, processor) -> 'ProcessingEngine':
+    """
+    Instancia um motor registrado.
+
+    Args:
+        name: Nome do motor
+        processor: TrelloDataProcessor que usa o motor
+
+    Returns:
+        Motor de processamento
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Motor de processamento desconhecido: '{name}'. Disponíveis: {', '.join(available_engines())}")
+    return ENGINES[name](processor)
+
+class ProcessingEngine(ABC):
+    """Interface dos motores de processamento."""
+
+    name = ''
+
+    def __init__(self, processor):
+        """
+        Inicializa o motor.
+
+        Args:
+            processor: TrelloDataProcessor que usa o motor
+        """
+        self.processor = processor
+
+    @abstractmethod
+    def generate_task_reports(self, data: Dict[str, Any], start_date: date, end_date: date,
+                              as_of: date) -> List[TaskReport]:
+        """Gera os relatórios de tarefas do período (iguais aos do motor de referência)."""
+
+    @abstractmethod
+    def card_reports(self, index: BoardIndex, position: int, as_of: date) -> List[TaskReport]:
+        """Gera os relatórios de um único card do índice (sem as etapas finais)."""
+
+    @abstractmethod
+    def generate_report_summary(self, task_reports: List[TaskReport]) -> ReportSummary:
+        """Gera o resumo geral e por grupo dos relatórios de tarefas."""
+
+    @abstractmethod
+    def generate_collaborator_reports(self, task_reports: List[TaskReport]) -> List[CollaboratorReport]:
+        """Gera os relatórios por colaborador a partir dos relatórios de tarefas."""
+
+@register_engine
+class IndexedEngine(ProcessingEngine):
+    """
+    Motor indexado: resolve listas, membros, grupos e datas uma única vez por
+    board (BoardIndex) e calcula os resumos em uma única passada.
+    """
+
+    name = 'indexed'
+
+    def generate_task_reports(self, data: Dict[str, Any], start_date: date, end_date: date,
+                              as_of: date) -> List[TaskReport]:
+        """
+        Gera relatórios de tarefas idênticos aos do motor de referência.
+
+        Args:
+            data: Dados do Trello
+            start_date: Data de início
+            end_date: Data de fim
+            as_of: Data de referência para atrasos
+
+        Returns:
+            Lista de relatórios de tarefas
+        """
+        index = BoardIndex.from_data(data)
+        reports = []
+
+        for position in index.cards_in_period(start_date, end_date):
+            reports.extend(self.card_reports(index, position, as_of))
+
+        logger.info(f"Motor indexado: {len(reports)} reports gerados")
+        return reports
+
+    @timed_stage('classificação de status', count_rows=True)
+    def card_reports(self, index: BoardIndex, position: int, as_of: date) -> List[TaskReport]:
+        """Gera os relatórios de um único card (uma entrada por grupo ou membro sem grupo)."""
+        card = index.cards[position]
+        list_info = index.list_info(card.get('idList'))
+        list_name = list_info.name
+
+        due_date = index.due_dates[position]
+        has_due = bool(card.get('due'))
+        closed = card.get('closed', False)
+        overdue = has_due and due_date is not None and as_of > due_date
+        days_late = (as_of - due_date).days if overdue and not closed else 0
+
+        base = dict(
+            task_id=card.get('id', ''),
+            task_name=card.get('name', ''),
+            list_name=list_name,
+            due_date=self.processor._format_due_date(card.get('due')),
+            created_at=index.created_at_iso[position],
+            observations=card.get('desc', '') or list_name,
+            etapa_atual=get_etapa_atual(list_name),
+            em_revisao=is_em_revisao(list_name)
+        )
+
+        def build(collaborator_name, status, late, grupo=None):
+            return TaskReport(
+                collaborator_name=collaborator_name,
+                completed_at=card.get('dateLastActivity', '') if status == 'Concluída' else None,
+                status=status,
+                days_late=late,
+                grupo=grupo.name if grupo else None,
+                finalizada_para_flavia=is_finalizada_para_flavia(list_name, grupo),
+                feita=is_feita(list_name, grupo),
+                **base
+            )
+
+        if not card.get('idMembers', []):
+            status = self._status(list_info, closed, overdue)
+            return [build('Não atribuído', status, days_late)]
+
+        card_members = index.card_members(card)
+
+        grupos_encontrados = set()
+        membros_sem_grupo = []
+        for member in card_members:
+            grupo = index.grupo_por_responsavel(member['username'])
+            if grupo:
+                grupos_encontrados.add(grupo.name)
+            else:
+                membros_sem_grupo.append(member)
+
+        reports = []
+        for nome_grupo in grupos_encontrados:
+            grupo = next((g for g in GRUPOS_MARKETING if g.name == nome_grupo), None)
+            if not grupo:
+                continue
+
+            membros_do_grupo = [m for m in card_members
+                                if index.grupo_por_responsavel(m['username']) is not None and
+                                   index.grupo_por_responsavel(m['username']).name == nome_grupo]
+            username = membros_do_grupo[0]['username']
+            reports.append(build(
+                ', '.join(m['fullName'] for m in membros_do_grupo),
+                self._status_for_collaborator(list_info, username, closed, overdue),
+                self._days_late_for_collaborator(list_info, username, has_due, closed, days_late),
+                grupo
+            ))
+
+        for member in membros_sem_grupo:
+            reports.append(build(
+                member['fullName'],
+                self._status_for_collaborator(list_info, member['username'], closed, overdue),
+                self._days_late_for_collaborator(list_info, member['username'], has_due, closed, days_late)
+            ))
+
+        return reports
+
+    @staticmethod
+    def _status(list_info: ListInfo, closed: bool, overdue: bool) -> str:
+        """Equivalente a TrelloDataProcessor.get_task_status."""
+        if closed:
+            return 'Concluída'
+        if list_info.can_be_late and overdue:
+            return 'Atrasada'
+        return list_info.status
+
+    def _status_for_collaborator(self, list_info: ListInfo, username: str, closed: bool, overdue: bool) -> str:
+        """Equivalente a TrelloDataProcessor.get_task_status_for_collaborator."""
+        if closed:
+            return 'Concluída'
+        if username not in CONTENT_CREATORS:
+            return self._status(list_info, closed, overdue)
+        if not list_info.found:
+            return 'Em Andamento'
+        if list_info.is_content_list:
+            return 'Atrasada' if overdue else 'Em Andamento'
+        return 'Concluída'
+
+    @staticmethod
+    def _days_late_for_collaborator(list_info: ListInfo, username: str, has_due: bool, closed: bool, days_late: int) -> int:
+        """Equivalente a TrelloDataProcessor.calculate_days_late_for_collaborator."""
+        if not has_due or closed:
+            return 0
+        if username in CONTENT_CREATORS and not list_info.is_content_list:
+            return 0
+        return days_late
+
+    def generate_report_summary(self, task_reports: List[TaskReport]) -> ReportSummary:
+        """
+        Gera o resumo do relatório em uma única passada pelos task reports.
+
+        Args:
+            task_reports: Lista de relatórios de tarefas
+
+        Returns:
+            Resumo do relatório
+        """
+        unique_tasks: Dict[str, TaskReport] = {}
+        tasks_by_group: Dict[Optional[str], Dict[str, TaskReport]] = {}
+
+        for task in task_reports:
+            unique_tasks.setdefault(task.task_id, task)
+            tasks_by_group.setdefault(task.grupo or None, {}).setdefault(task.task_id, task)
+
+        status_counts = self._count_statuses(unique_tasks.values())
+
+        unique_collaborators = set()
+        for task in unique_tasks.values():
+            if ',' in task.collaborator_name:
+                unique_collaborators.update(name.strip() for name in task.collaborator_name.split(','))
+            else:
+                unique_collaborators.add(task.collaborator_name)
+
+        group_summaries = []
+        for grupo_obj in GRUPOS_MARKETING:
+            group_summaries.append(self._group_summary(
+                grupo_obj.name,
+                [r.nome for r in grupo_obj.responsaveis],
+                tasks_by_group.get(grupo_obj.name, {}).values()
+            ))
+
+        if None in tasks_by_group:
+            group_summaries.append(self._group_summary(NO_GROUP, [], tasks_by_group[None].values()))
+
+        return ReportSummary(
+            total_tasks=len(unique_tasks),
+            completed_tasks=status_counts.get('Concluída', 0),
+            in_progress_tasks=status_counts.get('Em Andamento', 0),
+            late_tasks=status_counts.get('Atrasada', 0),
+            overdue_tasks=status_counts.get('Atrasada', 0),
+            blocked_tasks=status_counts.get('Bloqueada', 0),
+            total_collaborators=len(unique_collaborators),
+            group_summaries=group_summaries,
+            average_business_days_late=self.processor._average_business_days_late(list(unique_tasks.values()))
+        )
+
+    @staticmethod
+    def _count_statuses(tasks) -> Dict[str, int]:
+        """Conta tarefas por status."""
+        counts: Dict[str, int] = {}
+        for task in tasks:
+            counts[task.status] = counts.get(task.status, 0) + 1
+        return counts
+
+    def _group_summary(self, grupo: str, responsaveis: List[str], tasks) -> GroupReportSummary:
+        """Monta o resumo de um grupo a partir das suas tarefas únicas."""
+        tasks = list(tasks)
+        status_counts = self._count_statuses(tasks)
+        completed_with_due = [t for t in tasks if t.status == 'Concluída' and t.due_date != 'Não definida']
+
+        return GroupReportSummary(
+            grupo=grupo,
+            responsaveis=responsaveis,
+            total_tasks=len(tasks),
+            completed_tasks=status_counts.get('Concluída', 0),
+            in_progress_tasks=status_counts.get('Em Andamento', 0),
+            late_tasks=status_counts.get('Atrasada', 0),
+            blocked_tasks=status_counts.get('Bloqueada', 0),
+            on_time_deliveries=len([t for t in completed_with_due if t.days_late == 0]),
+            late_deliveries=len([t for t in completed_with_due if t.days_late > 0]),
+            average_business_days_late=self.processor._average_business_days_late(tasks)
+        )
+
+    def generate_collaborator_reports(self, task_reports: List[TaskReport]) -> List[CollaboratorReport]:
+        """
+        Gera relatórios por colaborador com a mesma deduplicação da referência.
+
+        Args:
+            task_reports: Lista de relatórios de tarefas
+
+        Returns:
+            Lista de relatórios de colaboradores
+        """
+        unique_by_collaborator: Dict[str, Dict[str, TaskReport]] = {}
+
+        for task in task_reports:
+            if ',' in task.collaborator_name:
+                for nome in (nome.strip() for nome in task.collaborator_name.split(',')):
+                    tasks = unique_by_collaborator.setdefault(nome, {})
+                    key = f"{task.task_name}-{task.grupo or 'no-group'}"
+                    if key not in tasks:
+                        tasks[key] = replace(task, collaborator_name=nome)
+            else:
+                tasks = unique_by_collaborator.setdefault(task.collaborator_name, {})
+                tasks.setdefault(f"{task.task_name}-{task.grupo or 'no-group'}", task)
+
+        reports = []
+        for collaborator_name, tasks_map in unique_by_collaborator.items():
+            unique_tasks = list(tasks_map.values())
+            status_counts = self._count_statuses(unique_tasks)
+
+            total_tasks = len(unique_tasks)
+            completed_tasks = status_counts.get('Concluída', 0)
+            completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+
+            late_days = [t.days_late for t in unique_tasks if t.days_late > 0 and t.status in ['Atrasada', 'Em Andamento']]
+            average_days_late = (sum(late_days) / len(late_days)) if late_days else 0
+
+            reports.append(CollaboratorReport(
+                collaborator_name=collaborator_name,
+                total_tasks=total_tasks,
+                completed_tasks=completed_tasks,
+                in_progress_tasks=status_counts.get('Em Andamento', 0),
+                pending_tasks=total_tasks - completed_tasks,
+                late_tasks=status_counts.get('Atrasada', 0),
+                blocked_tasks=status_counts.get('Bloqueada', 0),
+                completion_rate=completion_rate,
+                average_days_late=round(average_days_late),
+                tasks=sorted(unique_tasks, key=lambda t: (
+                    0 if t.status == 'Atrasada' else 1 if t.status == 'Concluída' else 2,
+                    t.task_name
+                )),
+                average_business_days_late=self.processor._average_business_days_late(unique_tasks)
+            ))
+
+        reports.sort(key=lambda r: r.completion_rate, reverse=True)
+        return reports
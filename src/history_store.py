@@ -0,0 +1,322 @@
+"""
+Histórico persistente (SQLite) de boards processados.
+
+Cada carga de um board vira um snapshot: listas, membros e cards
+normalizados e as linhas de relatório de tarefas do board inteiro, já
+calculadas para a data do snapshot. Consultas por período usam índices em
+(board, data do snapshot, prazo, status, grupo), sem reprocessar exports
+antigos.
+"""
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import fields
+from datetime import date, datetime
+from typing import Dict, List, Any, Optional, Sequence
+
+import pandas as pd
+
+from .board_index import BoardIndex, parse_trello_date
+from .config import HISTORY_DB_PATH, NO_GROUP
+from .data_processor import TrelloDataProcessor, TaskReport
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    board_id TEXT NOT NULL,
+    board_name TEXT,
+    snapshot_date TEXT NOT NULL,
+    as_of TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    saved_at TEXT NOT NULL,
+    UNIQUE (board_id, snapshot_date)
+);
+
+CREATE TABLE IF NOT EXISTS lists (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    list_id TEXT NOT NULL,
+    name TEXT,
+    closed INTEGER NOT NULL,
+    status TEXT,
+    PRIMARY KEY (snapshot_id, list_id)
+);
+
+CREATE TABLE IF NOT EXISTS members (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    member_id TEXT NOT NULL,
+    username TEXT,
+    full_name TEXT,
+    PRIMARY KEY (snapshot_id, member_id)
+);
+
+CREATE TABLE IF NOT EXISTS cards (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    board_id TEXT NOT NULL,
+    snapshot_date TEXT NOT NULL,
+    card_id TEXT NOT NULL,
+    name TEXT,
+    list_id TEXT,
+    member_ids TEXT,
+    due TEXT,
+    closed INTEGER NOT NULL,
+    date_last_activity TEXT,
+    status TEXT,
+    PRIMARY KEY (snapshot_id, card_id)
+);
+
+CREATE TABLE IF NOT EXISTS task_rows (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    board_id TEXT NOT NULL,
+    snapshot_date TEXT NOT NULL,
+    row_number INTEGER NOT NULL,
+    due TEXT,
+    task_id TEXT NOT NULL,
+    collaborator_name TEXT,
+    task_name TEXT,
+    list_name TEXT,
+    due_date TEXT,
+    created_at TEXT,
+    completed_at TEXT,
+    status TEXT,
+    days_late INTEGER,
+    observations TEXT,
+    grupo TEXT,
+    etapa_atual TEXT,
+    finalizada_para_flavia INTEGER,
+    feita INTEGER,
+    em_revisao INTEGER,
+    business_days_late INTEGER,
+    PRIMARY KEY (snapshot_id, row_number)
+);
+
+CREATE INDEX IF NOT EXISTS idx_task_rows_lookup ON task_rows (board_id, snapshot_date, due, status, grupo);
+CREATE INDEX IF NOT EXISTS idx_cards_lookup ON cards (board_id, snapshot_date, due, status);
+"""
+
+# Colunas de TaskReport, na ordem da tabela task_rows
+TASK_COLUMNS = [f.name for f in fields(TaskReport)]
+
+def board_id_of(data: Dict[str, Any]) -> str:
+    """Identificador do board (id do export; nome quando ausente)."""
+    return data.get('id') or data.get('name') or 'board'
+
+def board_content_hash(data: Dict[str, Any]) -> str:
+    """Hash do conteúdo relevante do export (listas, membros e cards)."""
+    digest = hashlib.sha256()
+    for key in ('lists', 'members', 'cards'):
+        digest.update(json.dumps(data.get(key, []), sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()
+
+def _iso(value: Optional[date]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+class HistoryStore:
+    """Histórico de snapshots de boards em um arquivo SQLite."""
+
+    def __init__(self, path: str = HISTORY_DB_PATH):
+        """
+        Abre (ou cria) o banco de histórico.
+
+        Args:
+            path: Caminho do arquivo SQLite (':memory:' para um banco temporário)
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('PRAGMA foreign_keys = ON')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self) -> 'HistoryStore':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def save_snapshot(self, data: Dict[str, Any], processor: Optional[TrelloDataProcessor] = None,
+                      snapshot_date: Optional[date] = None, as_of: Optional[date] = None,
+                      transitions=None, index: Optional[BoardIndex] = None) -> int:
+        """
+        Grava um snapshot do board (substitui o snapshot do mesmo dia).
+
+        As linhas de tarefa cobrem o board inteiro e são calculadas na data
+        de referência do snapshot. Se o snapshot do dia já existe com o mesmo
+        conteúdo e data de referência, nada é regravado.
+
+        Args:
+            data: Dados do Trello
+            processor: TrelloDataProcessor usado para gerar as linhas de tarefa
+            snapshot_date: Data do snapshot (padrão: data de referência)
+            as_of: Data de referência para status e atrasos
+            transitions: Índice de movimentações (ver generate_task_reports)
+            index: Índice do board (evita reconstruir)
+
+        Returns:
+            ID do snapshot
+        """
+        processor = processor or TrelloDataProcessor()
+        as_of = processor.get_reference_date(as_of)
+        snapshot_date = snapshot_date or as_of
+        board_id = board_id_of(data)
+        content_hash = board_content_hash(data)
+
+        existing = self.connection.execute(
+            'SELECT id, content_hash, as_of FROM snapshots WHERE board_id = ? AND snapshot_date = ?',
+            (board_id, snapshot_date.isoformat())
+        ).fetchone()
+        if existing and existing[1] == content_hash and existing[2] == as_of.isoformat():
+            return existing[0]
+
+        index = index or BoardIndex.from_data(data)
+        task_reports, _ = processor.generate_board_reports(data, index, as_of=as_of, transitions=transitions)
+
+        with self.connection:
+            if existing:
+                self.connection.execute('DELETE FROM snapshots WHERE id = ?', (existing[0],))
+
+            snapshot_id = self.connection.execute(
+                'INSERT INTO snapshots (board_id, board_name, snapshot_date, as_of, content_hash, saved_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (board_id, data.get('name'), snapshot_date.isoformat(), as_of.isoformat(),
+                 content_hash, datetime.now().isoformat(timespec='seconds'))
+            ).lastrowid
+
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO lists VALUES (?, ?, ?, ?, ?)',
+                [(snapshot_id, lista.get('id'), lista.get('name'), int(bool(lista.get('closed', False))),
+                  index.list_info(lista.get('id')).status)
+                 for lista in data.get('lists', []) if lista.get('id')]
+            )
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO members VALUES (?, ?, ?, ?)',
+                [(snapshot_id, member.get('id'), member.get('username'), member.get('fullName'))
+                 for member in data.get('members', []) if member.get('id')]
+            )
+
+            card_rows = []
+            due_by_card = {}
+            for card in index.cards:
+                due = _iso(parse_trello_date(card.get('due')))
+                due_by_card[card.get('id', '')] = due
+                card_rows.append((
+                    snapshot_id, board_id, snapshot_date.isoformat(), card.get('id', ''), card.get('name'),
+                    card.get('idList'), ','.join(card.get('idMembers', [])), due,
+                    int(bool(card.get('closed', False))), card.get('dateLastActivity'),
+                    index.list_info(card.get('idList')).status
+                ))
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO cards VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', card_rows
+            )
+
+            placeholders = ', '.join('?' * (5 + len(TASK_COLUMNS)))
+            self.connection.executemany(
+                f'INSERT INTO task_rows VALUES ({placeholders})',
+                [(snapshot_id, board_id, snapshot_date.isoformat(), row_number, due_by_card.get(report.task_id))
+                 + tuple(getattr(report, column) for column in TASK_COLUMNS)
+                 for row_number, report in enumerate(task_reports)]
+            )
+
+        return snapshot_id
+
+    def snapshots(self, board_id: Optional[str] = None) -> pd.DataFrame:
+        """Snapshots gravados (de um board ou de todos), do mais antigo ao mais recente."""
+        query = ('SELECT s.id, s.board_id, s.board_name, s.snapshot_date, s.as_of, s.saved_at, '
+                 '(SELECT COUNT(*) FROM cards c WHERE c.snapshot_id = s.id) AS cards, '
+                 '(SELECT COUNT(*) FROM task_rows t WHERE t.snapshot_id = s.id) AS task_rows '
+                 'FROM snapshots s')
+        params: List[Any] = []
+        if board_id is not None:
+            query += ' WHERE s.board_id = ?'
+            params.append(board_id)
+        return pd.read_sql_query(query + ' ORDER BY s.board_id, s.snapshot_date', self.connection, params=params)
+
+    def _task_filter(self, board_id: str, start_date: Optional[date], end_date: Optional[date],
+                     status: Optional[Sequence[str]], grupos: Optional[Sequence[str]],
+                     due_from: Optional[date], due_to: Optional[date]):
+        """Cláusula WHERE (na ordem do índice) e parâmetros de uma consulta de linhas de tarefa."""
+        clauses, params = ['board_id = ?'], [board_id]
+        for column, operator, value in [
+            ('snapshot_date', '>=', start_date), ('snapshot_date', '<=', end_date),
+            ('due', '>=', due_from), ('due', '<=', due_to)
+        ]:
+            if value is not None:
+                clauses.append(f'{column} {operator} ?')
+                params.append(value.isoformat())
+        for column, values in [('status', status), ('grupo', grupos)]:
+            if values is None:
+                continue
+            values = list(values)
+            condition = f"{column} IN ({', '.join('?' * len(values))})" if values else '0'
+            if column == 'grupo' and NO_GROUP in values:
+                condition = f'({condition} OR grupo IS NULL)'
+            clauses.append(condition)
+            params.extend(values)
+        return ' AND '.join(clauses), params
+
+    def task_rows(self, board_id: str, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                  status: Optional[Sequence[str]] = None, grupos: Optional[Sequence[str]] = None,
+                  due_from: Optional[date] = None, due_to: Optional[date] = None) -> pd.DataFrame:
+        """
+        Linhas de tarefa dos snapshots de um board no período.
+
+        Args:
+            board_id: Board (ver board_id_of)
+            start_date: Primeiro dia de snapshot (inclusivo)
+            end_date: Último dia de snapshot (inclusivo)
+            status: Restringe a estes status
+            grupos: Restringe a estes grupos (NO_GROUP para tarefas sem grupo)
+            due_from: Prazo a partir desta data
+            due_to: Prazo até esta data
+
+        Returns:
+            DataFrame com snapshot_date, due e as colunas de TaskReport
+        """
+        where, params = self._task_filter(board_id, start_date, end_date, status, grupos, due_from, due_to)
+        return pd.read_sql_query(
+            f"SELECT snapshot_id, snapshot_date, due, {', '.join(TASK_COLUMNS)} FROM task_rows "
+            f'WHERE {where} ORDER BY snapshot_date, row_number',
+            self.connection, params=params
+        )
+
+    def status_counts(self, board_id: str, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                      grupos: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Tarefas únicas por status em cada snapshot do período.
+
+        Como em generate_report_summary, cada tarefa conta uma vez, pelo
+        status da sua primeira linha entre os grupos selecionados.
+
+        Returns:
+            DataFrame com uma linha por data de snapshot e uma coluna por status
+        """
+        where, params = self._task_filter(board_id, start_date, end_date, None, grupos, None, None)
+        counts = pd.read_sql_query(
+            'SELECT snapshot_date, status, COUNT(*) AS tasks FROM ('
+            '    SELECT snapshot_date, status, ROW_NUMBER() OVER ('
+            '        PARTITION BY snapshot_id, task_id ORDER BY row_number'
+            f'    ) AS occurrence FROM task_rows WHERE {where}'
+            ') WHERE occurrence = 1 GROUP BY snapshot_date, status',
+            self.connection, params=params
+        )
+        if counts.empty:
+            return pd.DataFrame()
+        frame = counts.pivot(index='snapshot_date', columns='status', values='tasks').fillna(0).astype(int)
+        frame.columns.name = None
+        return frame
+
+    def load_task_reports(self, snapshot_id: int) -> List[TaskReport]:
+        """Linhas de tarefa de um snapshot como TaskReport, na ordem original."""
+        rows = self.connection.execute(
+            f"SELECT {', '.join(TASK_COLUMNS)} FROM task_rows WHERE snapshot_id = ? ORDER BY row_number",
+            (snapshot_id,)
+        ).fetchall()
+        boolean_columns = {'finalizada_para_flavia', 'feita', 'em_revisao'}
+        return [
+            TaskReport(**{
+                column: bool(value) if column in boolean_columns else value
+                for column, value in zip(TASK_COLUMNS, row)
+            })
+            for row in rows
+        ]
@@ -0,0 +1,232 @@
+"""
+Modelo residente de um board, atualizado evento a evento.
+
+O LiveBoardModel parte de um board carregado (export, API ou sincronização)
+e aplica as ações recebidas por webhook com as mesmas regras da
+sincronização incremental (sync.BoardModel). Para cada card afetado, as
+linhas de relatório são recalculadas pelo motor do processador com as mesmas
+etapas finais do processador, e o resumo (aggregates.SummaryAggregate) e
+os contadores por colaborador recebem -1 da contribuição antiga e +1 da
+nova - sem reprocessar o board. Os contadores cobrem o board inteiro (cards
+não arquivados), como os relatórios usados pelo cubo.
+"""
+
+import threading
+from collections import Counter
+from dataclasses import asdict
+from datetime import date, datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from .actions import CARD_CREATION_ACTIONS, ListTransitionIndex, is_done_list_name
+from .aggregates import CardSummary, SummaryAggregate, card_summary
+from .board_index import BoardIndex, card_created_at, make_list_info, parse_trello_date
+from .config import TASK_STATUSES
+from .data_processor import ReportSummary, TaskReport, TrelloDataProcessor
+from .sync import CARD_REMOVAL_ACTIONS, BoardModel
+
+def parse_action_date(value: str) -> datetime:
+    """Converte a data de uma ação ('2024-06-01T10:00:00.000Z') em datetime UTC."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def collaborator_contribution(rows: List[TaskReport]) -> Tuple[Tuple[str, str], ...]:
+    """Status do card para cada colaborador (a primeira linha em que o colaborador aparece)."""
+    collaborators: Dict[str, str] = {}
+    for row in rows:
+        for name in row.collaborator_name.split(','):
+            collaborators.setdefault(name.strip(), row.status)
+    return tuple(collaborators.items())
+
+class LiveBoardModel:
+    """Board em memória com contadores mantidos incrementalmente."""
+
+    def __init__(self, data: Dict[str, Any], processor: Optional[TrelloDataProcessor] = None,
+                 as_of: Optional[date] = None, transitions: Optional[ListTransitionIndex] = None):
+        """
+        Args:
+            data: Dados do Trello (copiados; o original não é alterado)
+            processor: Processador (regras e motor de processamento)
+            as_of: Data de referência fixa (padrão: hoje, reavaliada na virada do dia)
+            transitions: Índice de movimentações (padrão: montado a partir de data['actions'])
+        """
+        self.processor = processor or TrelloDataProcessor()
+        self.fixed_as_of = as_of
+        self.as_of = self.processor.get_reference_date(as_of)
+
+        if transitions is None:
+            transitions = ListTransitionIndex.from_data(data)
+        self.completions = transitions.completion_times(data.get('lists', [])) if transitions is not None else {}
+
+        # Cópias rasas: BoardModel altera cards e listas no lugar
+        self.board = BoardModel(dict(
+            data,
+            cards=[dict(card) for card in data.get('cards', [])],
+            lists=[dict(lista) for lista in data.get('lists', [])],
+            members=list(data.get('members', [])),
+            actions=[]
+        ))
+        # O índice tem a própria lista de cards (posições estáveis) e compartilha os dicts
+        self.index = BoardIndex.from_data(dict(self.board.data, cards=list(self.board.data['cards'])))
+        self.positions = {card.get('id', ''): position for position, card in enumerate(self.index.cards)}
+        # Listas e membros (só crescem) usados na classificação, sem remontar os cards do board
+        self.rules_data = {'lists': self.board.data['lists'], 'members': self.board.data['members']}
+
+        self.events = 0
+        self._lock = threading.RLock()
+        self._rebuild()
+
+    def _rebuild(self):
+        """Recalcula todas as contribuições (carga inicial e virada do dia)."""
+        self.aggregate = SummaryAggregate()
+        self.collaborator_counts: Dict[str, Counter] = {}
+        self.contributions: Dict[str, Tuple[CardSummary, Tuple]] = {}
+        for card_id, position in self.positions.items():
+            self._update_card(card_id, position)
+
+    def _refresh_date(self):
+        if self.fixed_as_of is None and date.today() != self.as_of:
+            self.as_of = date.today()
+            self._rebuild()
+
+    def card_rows(self, position: int) -> List[TaskReport]:
+        """Linhas de relatório do card (iguais às do processador para o board inteiro)."""
+        if self.index.period_dates[position] is None:
+            return []
+        rows = self.processor.card_reports(self.rules_data, self.index, position, self.as_of)
+        end_dates = self.processor.apply_completion_dates(rows, self.completions, self.as_of)
+        self.processor.apply_business_days_late(rows, end_dates)
+        return rows
+
+    def _count_collaborators(self, collaborators: Tuple, sign: int):
+        for name, status in collaborators:
+            counter = self.collaborator_counts.setdefault(name, Counter())
+            counter[status] += sign
+            if counter[status] == 0:
+                del counter[status]
+                if not counter:
+                    del self.collaborator_counts[name]
+
+    def _update_card(self, card_id: str, position: Optional[int]):
+        """Troca a contribuição antiga do card pela atual."""
+        before, collaborators = self.contributions.pop(card_id, (None, ()))
+        self._count_collaborators(collaborators, -1)
+        if position is None:
+            self.aggregate.apply(before, None)
+            return
+
+        card = self.index.cards[position]
+        due_date = parse_trello_date(card.get('due'))
+        self.index.due_dates[position] = due_date
+        self.index.period_dates[position] = BoardIndex._period_date(card, self.index.lists_by_id, due_date)
+        # Cards sem ObjectId usam a última atividade como data de criação
+        self.index.created_at_iso[position] = card_created_at([card])[0]
+
+        rows = self.card_rows(position)
+        after = card_summary(rows)
+        self.aggregate.apply(before, after)
+        if after is not None:
+            self.contributions[card_id] = (after, collaborator_contribution(rows))
+            self._count_collaborators(self.contributions[card_id][1], +1)
+
+    def _add_card(self, card: Dict[str, Any]) -> int:
+        self.board.put_card(card)
+        self.index.cards.append(card)
+        self.index.due_dates.append(None)
+        self.index.period_dates.append(None)
+        self.index.created_at_iso.append('')
+        self.positions[card['id']] = len(self.index.cards) - 1
+        return self.positions[card['id']]
+
+    def apply_action(self, action: Dict[str, Any]) -> Optional[str]:
+        """
+        Aplica uma ação do Trello (payload['action'] de um webhook).
+
+        Cards novos são criados a partir dos dados da ação (nome, lista e
+        prazo); campos ausentes nela chegam nas próximas atualizações.
+
+        Args:
+            action: Ação do Trello
+
+        Returns:
+            Id do card afetado (None se a ação não afeta cards)
+        """
+        with self._lock:
+            self._refresh_date()
+            self.events += 1
+            members_before = len(self.index.members)
+            card_id, needs_card = self.board.apply(action)
+            data = action.get('data') or {}
+
+            for position in range(members_before, len(self.index.members)):
+                self.index.member_positions.setdefault(self.index.members[position]['id'], []).append(position)
+
+            if action.get('type') in ('createList', 'updateList'):
+                lista = self.board.lists.get((data.get('list') or {}).get('id'))
+                if lista is not None:
+                    self.index.lists_by_id[lista['id']] = make_list_info(lista)
+                    for other_id, position in self.positions.items():
+                        if self.index.cards[position].get('idList') == lista['id']:
+                            self._update_card(other_id, position)
+                return None
+
+            if card_id is None:
+                return None
+
+            target = data.get('listAfter') or (data.get('list') if action.get('type') in CARD_CREATION_ACTIONS else None)
+            if target and is_done_list_name(target.get('name')) and action.get('date'):
+                completed = parse_action_date(action['date'])
+                if card_id not in self.completions or completed >= self.completions[card_id]:
+                    self.completions[card_id] = completed
+
+            if action.get('type') in CARD_REMOVAL_ACTIONS:
+                self._update_card(card_id, None)
+                self.positions.pop(card_id, None)
+                return card_id
+
+            if needs_card and card_id not in self.positions:
+                card_data = data.get('card') or {}
+                self._add_card({
+                    'id': card_id,
+                    'name': card_data.get('name', ''),
+                    'desc': card_data.get('desc', ''),
+                    'idList': card_data.get('idList') or (data.get('list') or {}).get('id'),
+                    'idMembers': list(card_data.get('idMembers', [])),
+                    'due': card_data.get('due'),
+                    'closed': card_data.get('closed', False),
+                    'dateLastActivity': action.get('date')
+                })
+
+            self._update_card(card_id, self.positions[card_id])
+            return card_id
+
+    def task_reports(self) -> List[TaskReport]:
+        """Linhas de relatório atuais do board inteiro (recalculadas; para conferência)."""
+        with self._lock:
+            return [row for position in self.positions.values() for row in self.card_rows(position)]
+
+    def summary(self) -> ReportSummary:
+        """ReportSummary atual do board inteiro, sem recálculo."""
+        with self._lock:
+            self._refresh_date()
+            return self.aggregate.summary()
+
+    def verify(self) -> List[str]:
+        """Confere o resumo incremental contra o recálculo completo (campos divergentes)."""
+        with self._lock:
+            return self.aggregate.mismatches(self.task_reports(), self.processor)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Contadores atuais (cópia), para o dashboard ou para /summary."""
+        def by_status(counter: Counter) -> Dict[str, int]:
+            return {status: counter[status] for status in TASK_STATUSES if counter[status]}
+
+        with self._lock:
+            self._refresh_date()
+            return {
+                'as_of': self.as_of.isoformat(),
+                'events': self.events,
+                'tasks': self.aggregate.totals['total'],
+                'status': by_status(self.aggregate.totals),
+                'groups': {grupo: by_status(counts) for grupo, counts in self.aggregate.groups.items()},
+                'collaborators': {name: dict(counts) for name, counts in self.collaborator_counts.items()},
+                'summary': asdict(self.aggregate.summary())
+            }
@@ -0,0 +1,274 @@
+"""
+Contabilidade de memória das sessões e dos processamentos.
+
+deep_sizeof estima o tamanho de um objeto somando tudo o que ele alcança
+(dicts, listas, dataclasses, arrays numpy, DataFrames); objetos alcançados
+por mais de um caminho entram uma vez. artifact_sizes aplica a estimativa a
+cada artefato do estado de uma sessão e separa o que é exclusivo de cada um
+do que ele compartilha com artefatos anteriores (ex.: TaskReports que os
+relatórios de colaboradores reaproveitam de task_reports).
+
+O registro do processo (MemoryRegistry) guarda referências fracas aos
+artefatos de cada sessão (SessionArtifacts, atualizado a cada execução sem
+medir nada) - sessões encerradas somem sozinhas - e o pico do tracemalloc
+dos processamentos recentes. A medição das sessões é feita sob demanda, no
+painel de administração, pois percorre os boards inteiros. O tracemalloc só é ligado durante um
+processamento quando a medição está ativa (MEMORY_TRACE_RUNS ou o painel de
+administração) e um processamento medido por vez; sem ela, track_run não
+custa nada.
+"""
+
+import sys
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Deque, Dict, Iterator, List, Mapping, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from .config import MEMORY_TRACE_RUNS, MEMORY_RUN_HISTORY
+
+# Artefatos medidos primeiro: o que eles compartilham com caches derivados
+# (board_reports, índices) fica na conta deles
+PRIMARY_ARTIFACTS = ['trello_data', 'task_reports', 'collaborator_reports', 'report_summary']
+
+# Objetos que não pertencem ao artefato (código, tipos e módulos)
+_SKIPPED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+def deep_sizeof(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """
+    Tamanho estimado de um objeto e de tudo o que ele alcança, em bytes.
+
+    Args:
+        obj: Objeto
+        seen: Ids já contados (compartilhe entre chamadas para não contar duas vezes)
+
+    Returns:
+        Bytes
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SKIPPED_TYPES):
+            continue
+        seen.add(id(current))
+
+        if isinstance(current, (pd.DataFrame, pd.Series, pd.Index)):
+            total += int(np.sum(current.memory_usage(deep=True)))
+            continue
+        if isinstance(current, np.ndarray):
+            total += sys.getsizeof(current) + (current.nbytes if current.base is None else 0)
+            if current.dtype == object:
+                stack.extend(current.ravel().tolist())
+            continue
+
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        elif isinstance(current, (str, bytes, bytearray, int, float, bool, complex)) or current is None:
+            continue
+        else:
+            if hasattr(current, '__dict__'):
+                stack.append(vars(current))
+            for cls in type(current).__mro__:
+                for slot in getattr(cls, '__slots__', ()):
+                    if hasattr(current, slot):
+                        stack.append(getattr(current, slot))
+    return total
+
+class SessionArtifacts:
+    """
+    Artefatos atuais de uma sessão, vistos pelo registro do processo.
+
+    Fica guardado no estado da própria sessão; o registro só tem uma
+    referência fraca, então a sessão encerrada sai do registro sozinha.
+    """
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.board_name = ''
+        self.cards = 0
+        self.artifacts: Dict[str, Any] = {}
+        self.updated_at = datetime.now()
+
+    def update(self, artifacts: Mapping[str, Any], board_name: str = '', cards: int = 0):
+        """Troca as referências aos artefatos (barato: não mede nada)."""
+        self.artifacts = dict(artifacts)
+        self.board_name = board_name
+        self.cards = cards
+        self.updated_at = datetime.now()
+
+@dataclass
+class ArtifactSize:
+    """Tamanho de um artefato da sessão."""
+    name: str
+    bytes: int
+    exclusive_bytes: int
+
+def artifact_sizes(state: Mapping[str, Any], names: Optional[List[str]] = None,
+                   counted: Optional[Set[int]] = None, own: bool = True) -> List[ArtifactSize]:
+    """
+    Tamanho de cada artefato do estado de uma sessão.
+
+    Args:
+        state: Estado da sessão (st.session_state ou dict)
+        names: Chaves medidas, nesta ordem (padrão: PRIMARY_ARTIFACTS e depois as demais)
+        counted: Ids já contados (ex.: em outras sessões); é atualizado
+        own: Mede também o tamanho de cada artefato isolado (uma passada a mais)
+
+    Returns:
+        Artefatos do maior para o menor; exclusive_bytes desconta o que já foi
+        contado nos artefatos anteriores da ordem, então a soma dele é o total
+        da sessão (sem own, bytes = exclusive_bytes)
+    """
+    if names is None:
+        names = [name for name in PRIMARY_ARTIFACTS if name in state]
+        names += [name for name in state.keys() if name not in PRIMARY_ARTIFACTS]
+    else:
+        names = [name for name in names if name in state]
+    counted = set() if counted is None else counted
+    sizes = []
+    for name in names:
+        value = state[name]
+        exclusive = deep_sizeof(value, counted)
+        sizes.append(ArtifactSize(name, deep_sizeof(value) if own else exclusive, exclusive))
+    return sorted(sizes, key=lambda size: size.bytes, reverse=True)
+
+@dataclass
+class SessionMemory:
+    """Medição de memória de uma sessão."""
+    session_id: str
+    board_name: str
+    cards: int
+    artifacts: List[ArtifactSize]
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def measure(cls, session: SessionArtifacts, counted: Optional[Set[int]] = None,
+                own: bool = True) -> 'SessionMemory':
+        return cls(session.session_id, session.board_name, session.cards,
+                   artifact_sizes(session.artifacts, counted=counted, own=own), session.updated_at)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(artifact.exclusive_bytes for artifact in self.artifacts)
+
+@dataclass
+class RunMemory:
+    """Pico de memória de um processamento (tracemalloc)."""
+    session_id: str
+    board_name: str
+    cards: int
+    peak_bytes: int
+    seconds: float
+    finished_at: datetime = field(default_factory=datetime.now)
+
+class MemoryRegistry:
+    """Relatórios de memória das sessões e processamentos do processo."""
+
+    def __init__(self, trace_runs: bool = MEMORY_TRACE_RUNS, run_history: int = MEMORY_RUN_HISTORY):
+        self.trace_runs = trace_runs
+        self.runs: Deque[RunMemory] = deque(maxlen=run_history)
+        self._sessions: Dict[str, weakref.ref] = {}
+        self._lock = threading.Lock()
+        self._trace_lock = threading.Lock()
+
+    def register_session(self, session: SessionArtifacts):
+        """Acompanha uma sessão enquanto ela existir."""
+        with self._lock:
+            self._sessions[session.session_id] = weakref.ref(session)
+
+    def sessions(self) -> List[SessionArtifacts]:
+        """Sessões ativas."""
+        with self._lock:
+            alive = {session_id: ref() for session_id, ref in self._sessions.items()}
+            for session_id, session in alive.items():
+                if session is None:
+                    del self._sessions[session_id]
+        return [session for session in alive.values() if session is not None]
+
+    def measure_sessions(self) -> List[SessionMemory]:
+        """
+        Mede as sessões ativas, da que mais consome para a que menos consome.
+
+        Objetos compartilhados entre sessões entram apenas na primeira, então
+        a soma dos totais estima a memória ocupada pelo conjunto.
+        """
+        counted: Set[int] = set()
+        reports = [SessionMemory.measure(session, counted, own=False) for session in self.sessions()]
+        return sorted(reports, key=lambda report: report.total_bytes, reverse=True)
+
+    @contextmanager
+    def track_run(self, session_id: str, board_name: str, cards: int) -> Iterator[Optional[RunMemory]]:
+        """
+        Mede o pico de memória alocada durante o bloco.
+
+        Sem a medição ativa, ou com outro processamento sendo medido (o
+        tracemalloc é global), o bloco roda sem medição.
+        """
+        if not self.trace_runs or not self._trace_lock.acquire(blocking=False):
+            yield None
+            return
+
+        started_tracing = not tracemalloc.is_tracing()
+        try:
+            if started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            started = time.perf_counter()
+            run = RunMemory(session_id, board_name, cards, 0, 0.0)
+            try:
+                yield run
+            finally:
+                run.peak_bytes = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+                run.seconds = time.perf_counter() - started
+                run.finished_at = datetime.now()
+                self.runs.appendleft(run)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            self._trace_lock.release()
+
+_registry: Optional[MemoryRegistry] = None
+_registry_lock = threading.Lock()
+
+def memory_registry() -> MemoryRegistry:
+    """Registro do processo (compartilhado entre as sessões do app)."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MemoryRegistry()
+        return _registry
+
+def process_peak_rss() -> Optional[int]:
+    """Pico de memória residente do processo em bytes (None fora de sistemas Unix)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KiB; macOS, em bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def format_bytes(value: Optional[float]) -> str:
+    """Formata bytes em B, KB, MB ou GB."""
+    if value is None:
+        return '-'
+    for unit in ('B', 'KB', 'MB'):
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.2f} GB"
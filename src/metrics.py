@@ -0,0 +1,320 @@
+"""
+Métricas do processamento no formato texto do Prometheus.
+
+Contadores e histogramas de boards processados, cards por segundo, latência
+por etapa (a partir do RunProfile de src/profiling.py), acerto do cache de
+cards e tamanho dos uploads. O registro do processo (REGISTRY) é exposto em
+GET /metrics por um servidor local (MetricsServer) ou gravado em um arquivo
+.prom para o textfile collector do node_exporter (write_textfile).
+
+Implementação própria e pequena, apenas com a biblioteca padrão: o formato
+de exposição é texto simples e o app não depende do prometheus_client.
+"""
+
+import math
+import os
+import threading
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple
+
+from .config import METRICS_HOST, METRICS_PORT
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Limites dos histogramas
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+THROUGHPUT_BUCKETS = (100, 500, 1_000, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000)
+SIZE_BUCKETS = (64 * 1024, 256 * 1024, 1024 ** 2, 4 * 1024 ** 2, 16 * 1024 ** 2, 64 * 1024 ** 2, 256 * 1024 ** 2)
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+class _Metric(ABC):
+    """Base das métricas: nome, ajuda, rótulos e valores por combinação de rótulos."""
+
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: rótulos esperados {self.labelnames}, recebidos {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """Linhas de amostra da métrica (chamado com o lock adquirido)."""
+
+    def render(self) -> str:
+        header = [f'# HELP {self.name} {_escape(self.documentation)}', f'# TYPE {self.name} {self.kind}']
+        with self._lock:
+            return '\n'.join(header + self.samples())
+
+class Counter(_Metric):
+    """Contador (só cresce)."""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError(f"{self.name}: contadores não diminuem")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set_total(self, value: float, **labels):
+        """Copia o total de um contador mantido em outro lugar (ex.: acertos do cache)."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[str]:
+        return [
+            f'{self.name}{_labels(self.labelnames, key)} {_format_value(value)}'
+            for key, value in sorted(self._values.items())
+        ]
+
+class Gauge(Counter):
+    """Valor instantâneo."""
+
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        self.set_total(value, **labels)
+
+class Histogram(_Metric):
+    """Histograma com limites fixos (contagens cumulativas, soma e total)."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total, count) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f'{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_labels(self.labelnames, key)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_labels(self.labelnames, key)} {count}')
+        return lines
+
+class MetricsRegistry:
+    """Conjunto de métricas exportadas juntas."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], None]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, key: str, collector: Callable[[], None]):
+        """Função chamada antes de cada exportação (atualiza métricas lidas de outros objetos)."""
+        with self._lock:
+            self._collectors[key] = collector
+
+    def render(self) -> str:
+        """Todas as métricas no formato texto do Prometheus."""
+        with self._lock:
+            collectors = list(self._collectors.values())
+            metrics = list(self._metrics.values())
+        for collector in collectors:
+            collector()
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+REGISTRY = MetricsRegistry()
+
+BOARDS_PROCESSED = REGISTRY.counter(
+    'trelliq_boards_processed_total', 'Processamentos de board concluídos', ['source']
+)
+CARDS_PROCESSED = REGISTRY.counter(
+    'trelliq_cards_processed_total', 'Cards nos boards processados', ['source']
+)
+PROCESSING_SECONDS = REGISTRY.histogram(
+    'trelliq_processing_seconds', 'Duração do processamento de um board', ['source'], LATENCY_BUCKETS
+)
+CARDS_PER_SECOND = REGISTRY.histogram(
+    'trelliq_processing_cards_per_second', 'Vazão de cada processamento (cards por segundo)', ['source'],
+    THROUGHPUT_BUCKETS
+)
+STAGE_SECONDS = REGISTRY.histogram(
+    'trelliq_stage_seconds', 'Duração de cada etapa em uma execução', ['stage'], LATENCY_BUCKETS
+)
+UPLOAD_BYTES = REGISTRY.histogram(
+    'trelliq_upload_bytes', 'Tamanho dos exports JSON enviados ao app', [], SIZE_BUCKETS
+)
+CARD_CACHE_REQUESTS = REGISTRY.counter(
+    'trelliq_card_cache_requests_total', 'Consultas ao cache de relatórios por card', ['result']
+)
+CARD_CACHE_HIT_RATIO = REGISTRY.gauge(
+    'trelliq_card_cache_hit_ratio', 'Fração das consultas ao cache de cards atendidas pelo cache'
+)
+CARD_CACHE_ENTRIES = REGISTRY.gauge(
+    'trelliq_card_cache_entries', 'Cards guardados no cache de relatórios'
+)
+
+def record_board(source: str, cards: int, seconds: float):
+    """Registra um processamento de board concluído."""
+    BOARDS_PROCESSED.inc(source=source)
+    CARDS_PROCESSED.inc(cards, source=source)
+    PROCESSING_SECONDS.observe(seconds, source=source)
+    if seconds > 0:
+        CARDS_PER_SECOND.observe(cards / seconds, source=source)
+
+def observe_profile(profile):
+    """Registra a duração de cada etapa de um RunProfile."""
+    for timing in profile.stages.values():
+        STAGE_SECONDS.observe(timing.ms / 1000, stage=timing.name)
+
+def observe_upload(size: int):
+    UPLOAD_BYTES.observe(size)
+
+def watch_card_cache(cache, registry: MetricsRegistry = REGISTRY):
+    """Exporta os acertos do cache de cards (lidos a cada exportação)."""
+    def collect():
+        CARD_CACHE_REQUESTS.set_total(cache.hits, result='hit')
+        CARD_CACHE_REQUESTS.set_total(cache.misses, result='miss')
+        total = cache.hits + cache.misses
+        CARD_CACHE_HIT_RATIO.set(cache.hits / total if total else 0)
+        CARD_CACHE_ENTRIES.set(len(cache))
+    registry.add_collector('card_cache', collect)
+
+def write_textfile(path: str, registry: MetricsRegistry = REGISTRY):
+    """Grava as métricas em um arquivo .prom (troca atômica, como pede o textfile collector)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f'{path}.tmp-{os.getpid()}'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(registry.render())
+    os.replace(temp_path, path)
+
+class MetricsServer:
+    """Servidor HTTP local que expõe GET /metrics."""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = METRICS_HOST,
+                 port: int = METRICS_PORT or 0):
+        """
+        Args:
+            registry: Métricas exportadas
+            host: Endereço de escuta
+            port: Porta (0 escolhe uma livre)
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/metrics'
+
+    def _handler(self):
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> 'MetricsServer':
+        """Sobe o servidor em uma thread em segundo plano."""
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'MetricsServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+_shared_server: Optional[MetricsServer] = None
+_shared_lock = threading.Lock()
+
+def start_shared_metrics_server(port: int = METRICS_PORT, host: str = METRICS_HOST) -> MetricsServer:
+    """Sobe o servidor de métricas do processo (uma vez; chamadas seguintes devolvem o mesmo)."""
+    global _shared_server
+    with _shared_lock:
+        if _shared_server is None:
+            _shared_server = MetricsServer(REGISTRY, host=host, port=port).start()
+        return _shared_server
@@ -0,0 +1,235 @@
+"""
+Harness de paridade entre motores de processamento.
+
+Executa um motor candidato e o motor de referência sobre o mesmo board,
+compara campo a campo todos os TaskReport, CollaboratorReport e ReportSummary
+e mede o ganho de velocidade. Um motor só deve ser ativado em config.py
+depois de passar aqui em boards gerados e reais.
+"""
+
+import logging
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Tuple
+
+from .actions import ListTransitionIndex
+from .config import GRUPOS_MARKETING, LIST_STATUS_MAP
+from .data_processor import TrelloDataProcessor, REFERENCE_ENGINE
+
+@dataclass
+class FieldMismatch:
+    """Divergência de um campo entre referência e candidato."""
+    path: str
+    reference: Any
+    candidate: Any
+
+@dataclass
+class ParityReport:
+    """Resultado da comparação de um motor com a referência."""
+    engine: str
+    board_name: str
+    task_reports: int
+    reference_seconds: float
+    candidate_seconds: float
+    mismatches: List[FieldMismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Indica se o candidato reproduziu exatamente a referência."""
+        return not self.mismatches
+
+    @property
+    def speedup(self) -> float:
+        """Quantas vezes o candidato foi mais rápido que a referência."""
+        if self.candidate_seconds <= 0:
+            return float('inf')
+        return self.reference_seconds / self.candidate_seconds
+
+def diff_values(path: str, reference: Any, candidate: Any, mismatches: List[FieldMismatch]) -> None:
+    """
+    Compara recursivamente dois valores (dataclasses, listas, dicts ou escalares).
+
+    Args:
+        path: Caminho do valor (ex.: 'task_reports[3].status')
+        reference: Valor produzido pela referência
+        candidate: Valor produzido pelo candidato
+        mismatches: Lista onde as divergências são acumuladas
+    """
+    if is_dataclass(reference) and is_dataclass(candidate) and type(reference) is type(candidate):
+        for f in fields(reference):
+            diff_values(f"{path}.{f.name}", getattr(reference, f.name), getattr(candidate, f.name), mismatches)
+    elif isinstance(reference, list) and isinstance(candidate, list):
+        if len(reference) != len(candidate):
+            mismatches.append(FieldMismatch(f"{path}.__len__", len(reference), len(candidate)))
+        for i, (ref_item, cand_item) in enumerate(zip(reference, candidate)):
+            diff_values(f"{path}[{i}]", ref_item, cand_item, mismatches)
+    elif isinstance(reference, dict) and isinstance(candidate, dict):
+        for key in sorted(set(reference) | set(candidate), key=str):
+            diff_values(f"{path}[{key!r}]", reference.get(key), candidate.get(key), mismatches)
+    elif type(reference) is not type(candidate) or reference != candidate:
+        mismatches.append(FieldMismatch(path, reference, candidate))
+
+@contextmanager
+def _quiet_logging():
+    """Silencia os logs por card durante as execuções cronometradas."""
+    logging.disable(logging.WARNING)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+def _run_engine(engine: str, data: Dict[str, Any], start_date: date, end_date: date,
+                as_of: date, transitions: Optional[ListTransitionIndex]) -> Tuple[Dict[str, Any], float]:
+    """Executa o pipeline completo de um motor e mede o tempo."""
+    processor = TrelloDataProcessor(engine=engine, as_of=as_of)
+
+    started = time.perf_counter()
+    task_reports = processor.generate_task_reports(data, start_date, end_date, transitions=transitions)
+    results = {
+        'task_reports': task_reports,
+        'report_summary': processor.generate_report_summary(task_reports),
+        'collaborator_reports': processor.generate_collaborator_reports(task_reports)
+    }
+    elapsed = time.perf_counter() - started
+
+    return results, elapsed
+
+def run_parity(data: Dict[str, Any], start_date: date, end_date: date, engine: str,
+               board_name: Optional[str] = None, repeat: int = 1,
+               as_of: Optional[date] = None,
+               transitions: Optional[ListTransitionIndex] = None) -> ParityReport:
+    """
+    Compara um motor com a referência em um board.
+
+    Args:
+        data: Dados do Trello
+        start_date: Data de início
+        end_date: Data de fim
+        engine: Nome do motor candidato
+        board_name: Nome exibido no relatório (padrão: campo 'name' do board)
+        repeat: Número de execuções; o tempo considerado é o melhor
+        as_of: Data de referência compartilhada pelos dois motores (padrão: hoje)
+        transitions: Índice de movimentações compartilhado pelas execuções (padrão:
+            montado uma vez a partir de data['actions'], fora do tempo medido)
+
+    Returns:
+        Relatório de paridade
+    """
+    as_of = as_of or date.today()
+    if transitions is None:
+        transitions = ListTransitionIndex.from_data(data)
+    reference_seconds = candidate_seconds = float('inf')
+
+    with _quiet_logging():
+        for _ in range(max(1, repeat)):
+            reference, elapsed = _run_engine(REFERENCE_ENGINE, data, start_date, end_date, as_of, transitions)
+            reference_seconds = min(reference_seconds, elapsed)
+            candidate, elapsed = _run_engine(engine, data, start_date, end_date, as_of, transitions)
+            candidate_seconds = min(candidate_seconds, elapsed)
+
+    mismatches: List[FieldMismatch] = []
+    for key in ('task_reports', 'report_summary', 'collaborator_reports'):
+        diff_values(key, reference[key], candidate[key], mismatches)
+
+    return ParityReport(
+        engine=engine,
+        board_name=board_name or data.get('name', 'Board sem nome'),
+        task_reports=len(reference['task_reports']),
+        reference_seconds=reference_seconds,
+        candidate_seconds=candidate_seconds,
+        mismatches=mismatches
+    )
+
+def generate_board(n_cards: int = 500, seed: int = 0, reference_date: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Gera um board sintético que exercita todos os ramos de classificação.
+
+    Args:
+        n_cards: Número de cards
+        seed: Semente do gerador aleatório
+        reference_date: Data em torno da qual prazos e atividades são sorteados
+
+    Returns:
+        Dados no formato do JSON exportado pelo Trello
+    """
+    rng = random.Random(seed)
+    reference_date = reference_date or date.today()
+
+    list_names = list(LIST_STATUS_MAP) + [
+        'AGUARDANDO RETORNO DE TERCEIROS', 'Tarefas Bloqueadas', 'Planejamento Q1',
+        'Recorrentes Semanais', 'Backlog', 'Concluído', 'em processo de revisão final'
+    ]
+    lists = [{'id': f'list{i}', 'name': name, 'closed': False} for i, name in enumerate(list_names)]
+
+    members = []
+    for grupo in GRUPOS_MARKETING:
+        for responsavel in grupo.responsaveis:
+            members.append({
+                'id': f'member-{responsavel.username}',
+                'username': responsavel.username,
+                'fullName': responsavel.nome
+            })
+    for i in range(6):
+        members.append({'id': f'member-extra{i}', 'username': f'extra{i}', 'fullName': f'Colaborador Extra {i}'})
+
+    def iso(day: date) -> str:
+        moment = datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc) + timedelta(hours=rng.randint(0, 23))
+        return moment.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+    cards = []
+    for i in range(n_cards):
+        n_members = rng.choices([0, 1, 2, 3], weights=[2, 5, 3, 1])[0]
+        due = iso(reference_date + timedelta(days=rng.randint(-60, 30))) if rng.random() < 0.75 else None
+        created = datetime.combine(reference_date, datetime.min.time(), tzinfo=timezone.utc) - timedelta(days=rng.randint(0, 180))
+        # IDs no formato ObjectId: 8 dígitos hex com o instante de criação + sufixo único
+        card_id = f'{int(created.timestamp()):08x}{i:016x}' if rng.random() < 0.95 else f'card{i}'
+
+        cards.append({
+            'id': card_id,
+            'name': f'Tarefa {i % (n_cards // 2 or 1)}',
+            'desc': rng.choice(['', '', 'Descrição da tarefa']),
+            'idList': rng.choice(lists)['id'] if rng.random() < 0.97 else 'lista-removida',
+            'idMembers': [m['id'] for m in rng.sample(members, n_members)],
+            'due': due,
+            'dateLastActivity': iso(reference_date - timedelta(days=rng.randint(0, 90))) if rng.random() < 0.98 else None,
+            'closed': rng.random() < 0.05
+        })
+
+    # Log de movimentações: criação em uma lista qualquer e movimentos até a lista atual
+    actions = []
+    lists_by_id = {lista['id']: lista for lista in lists}
+    for card in cards:
+        if card['idList'] not in lists_by_id or rng.random() < 0.1:
+            continue
+        last_moment = datetime.combine(reference_date, datetime.min.time(), tzinfo=timezone.utc)
+        moment = last_moment - timedelta(days=rng.randint(30, 120))
+        path = [rng.choice(lists) for _ in range(rng.randint(0, 3))] + [lists_by_id[card['idList']]]
+        actions.append({
+            'type': 'createCard',
+            'date': moment.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            'data': {'card': {'id': card['id'], 'name': card['name']}, 'list': {'id': path[0]['id'], 'name': path[0]['name']}}
+        })
+        for before, after in zip(path, path[1:]):
+            moment = min(moment + timedelta(days=rng.randint(0, 20), hours=rng.randint(0, 23)), last_moment)
+            actions.append({
+                'type': 'updateCard',
+                'date': moment.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+                'data': {
+                    'card': {'id': card['id'], 'name': card['name'], 'idList': after['id']},
+                    'listBefore': {'id': before['id'], 'name': before['name']},
+                    'listAfter': {'id': after['id'], 'name': after['name']}
+                }
+            })
+    # O Trello exporta as ações da mais recente para a mais antiga
+    actions.sort(key=lambda action: action['date'], reverse=True)
+
+    return {
+        'name': f'Board sintético ({n_cards} cards, seed {seed})',
+        'cards': cards,
+        'lists': lists,
+        'members': members,
+        'actions': actions
+    }
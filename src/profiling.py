@@ -0,0 +1,254 @@
+"""
+Tempos por etapa de uma execução (decodificação, validação, filtro,
+classificação, relatórios, resumos, DataFrames e gráficos).
+
+Uma execução é medida dentro de profile_run(); as etapas são marcadas com
+stage() ou com o decorador timed_stage() nas funções do processador. Fora de
+profile_run() as marcações não registram nada (apenas uma consulta à
+ContextVar), então o processamento sem interface não paga pela medição.
+
+Etapas chamadas várias vezes (ex.: a classificação, uma vez por card) são
+acumuladas em um único registro, com o número de chamadas.
+
+Para boards patológicos, capture_cprofile roda uma chamada sob o cProfile e
+devolve o arquivo .pstats e a tabela das funções com maior tempo acumulado.
+O cProfile só é ativado nessa chamada; sem ela não há custo algum.
+"""
+
+import cProfile
+import csv
+import io
+import json
+import marshal
+import pstats
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
+
+from .config import CPROFILE_TOP_N
+
+@dataclass
+class StageTiming:
+    """Tempo acumulado de uma etapa."""
+    name: str
+    ms: float = 0.0
+    calls: int = 0
+    rows: Optional[int] = None
+    depth: int = 0
+
+    def add_rows(self, rows: int):
+        self.rows = (self.rows or 0) + rows
+
+class _Stage:
+    """Medição de uma chamada da etapa (context manager leve, usado por card)."""
+
+    __slots__ = ('profile', 'timing', 'started', 'nested')
+
+    def __init__(self, profile: 'RunProfile', timing: StageTiming):
+        self.profile = profile
+        self.timing = timing
+
+    def __enter__(self) -> StageTiming:
+        # Chamada dentro da mesma etapa (ex.: status por colaborador -> status do card) não é contada de novo
+        self.nested = self.timing.name in self.profile._open
+        if not self.nested:
+            self.profile._open.add(self.timing.name)
+            self.profile._depth += 1
+            self.started = time.perf_counter()
+        return self.timing
+
+    def __exit__(self, *exc):
+        if self.nested:
+            return
+        self.timing.ms += (time.perf_counter() - self.started) * 1000
+        self.timing.calls += 1
+        self.profile._depth -= 1
+        self.profile._open.discard(self.timing.name)
+
+class RunProfile:
+    """Etapas medidas em uma execução, na ordem em que começaram."""
+
+    def __init__(self, label: str = ''):
+        self.label = label
+        self.started_at = datetime.now()
+        self.stages: Dict[str, StageTiming] = {}
+        self._depth = 0
+        self._open = set()
+        self._started = time.perf_counter()
+        self.total_ms = 0.0
+
+    def stage(self, name: str, rows: Optional[int] = None) -> _Stage:
+        """Mede uma chamada da etapa (acumula com as anteriores de mesmo nome)."""
+        timing = self.stages.get(name)
+        if timing is None:
+            timing = self.stages[name] = StageTiming(name, depth=self._depth)
+        if rows is not None:
+            timing.add_rows(rows)
+        return _Stage(self, timing)
+
+    def finish(self):
+        self.total_ms = (time.perf_counter() - self._started) * 1000
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Etapas como dicionários (tabela do painel)."""
+        return [asdict(timing) for timing in self.stages.values()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'label': self.label,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'total_ms': round(self.total_ms, 3),
+            'stages': [dict(row, ms=round(row['ms'], 3)) for row in self.rows()]
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+_active: ContextVar[Optional[RunProfile]] = ContextVar('trelliq_run_profile', default=None)
+
+def current_profile() -> Optional[RunProfile]:
+    """Execução sendo medida no contexto atual (None fora de profile_run)."""
+    return _active.get()
+
+@contextmanager
+def profile_run(label: str = '') -> Iterator[RunProfile]:
+    """Mede as etapas marcadas durante o bloco."""
+    profile = RunProfile(label)
+    token = _active.set(profile)
+    try:
+        yield profile
+    finally:
+        _active.reset(token)
+        profile.finish()
+
+class _NoStage:
+    """Marcação fora de profile_run: não mede nada."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc):
+        pass
+
+_NO_STAGE = _NoStage()
+
+def stage(name: str, rows: Optional[int] = None):
+    """
+    Marca uma etapa da execução atual.
+
+    Uso: `with stage('resumo') as timing: ...`; timing é None fora de
+    profile_run (use `if timing: timing.add_rows(n)` para contar linhas
+    calculadas durante a etapa).
+    """
+    profile = _active.get()
+    if profile is None:
+        return _NO_STAGE
+    return profile.stage(name, rows)
+
+def timed_stage(name: str, count_rows: bool = False) -> Callable:
+    """
+    Decorador que mede cada chamada da função como a etapa `name`.
+
+    Args:
+        name: Nome da etapa
+        count_rows: Soma len(resultado) às linhas da etapa
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = _active.get()
+            if profile is None:
+                return func(*args, **kwargs)
+            with profile.stage(name) as timing:
+                result = func(*args, **kwargs)
+                if count_rows:
+                    timing.add_rows(len(result))
+            return result
+        return wrapper
+    return decorator
+
+@dataclass
+class CProfileCapture:
+    """Perfil cProfile de uma chamada."""
+    label: str
+    seconds: float
+    calls: int
+    pstats_data: bytes
+    top: List[Dict[str, Any]]
+
+    def write_pstats(self, path: str):
+        """Grava o arquivo .pstats (abre com pstats.Stats(path) ou snakeviz)."""
+        with open(path, 'wb') as f:
+            f.write(self.pstats_data)
+
+    def top_csv(self) -> str:
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=list(self.top[0]) if self.top else ['function'])
+        writer.writeheader()
+        writer.writerows(self.top)
+        return output.getvalue()
+
+    def format_top(self) -> str:
+        """Tabela das funções em texto (saída da CLI)."""
+        lines = [f"{'cumtime ms':>11} {'tottime ms':>11} {'chamadas':>10}  função"]
+        lines += [
+            f"{row['cumtime_ms']:>11.1f} {row['tottime_ms']:>11.1f} {row['calls']:>10}  {row['function']}"
+            for row in self.top
+        ]
+        return '\n'.join(lines)
+
+def top_functions(stats: pstats.Stats, limit: int = CPROFILE_TOP_N) -> List[Dict[str, Any]]:
+    """
+    Funções com maior tempo acumulado.
+
+    Args:
+        stats: Estatísticas do cProfile
+        limit: Número de funções
+
+    Returns:
+        Linhas com function, calls, primitive_calls, tottime_ms, cumtime_ms e percall_ms
+    """
+    entries = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        {
+            'function': pstats.func_std_string(func),
+            'calls': calls,
+            'primitive_calls': primitive_calls,
+            'tottime_ms': round(tottime * 1000, 3),
+            'cumtime_ms': round(cumtime * 1000, 3),
+            'percall_ms': round(cumtime * 1000 / calls, 4) if calls else 0.0
+        }
+        for func, (primitive_calls, calls, tottime, cumtime, _) in entries
+    ]
+
+def capture_cprofile(func: Callable, *args, label: str = '', top: int = CPROFILE_TOP_N,
+                     **kwargs) -> Tuple[Any, CProfileCapture]:
+    """
+    Executa func(*args, **kwargs) sob o cProfile.
+
+    Args:
+        func: Função a perfilar
+        label: Descrição da execução
+        top: Número de funções na tabela
+
+    Returns:
+        (resultado de func, CProfileCapture)
+    """
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    result = profiler.runcall(func, *args, **kwargs)
+    seconds = time.perf_counter() - started
+
+    stats = pstats.Stats(profiler)
+    return result, CProfileCapture(
+        label=label,
+        seconds=seconds,
+        calls=stats.total_calls,
+        # Mesmo formato de pstats.Stats.dump_stats
+        pstats_data=marshal.dumps(stats.stats),
+        top=top_functions(stats, top)
+    )
@@ -0,0 +1,219 @@
+"""
+Rollups diários pré-agregados para a Análise Temporal.
+
+Os relatórios de tarefas do board inteiro são gerados uma única vez por carga
+(e data de referência) e contados por dia e por (grupo, status, colaborador).
+As contagens ficam acumuladas (somas de prefixo), de modo que qualquer
+período ou agregação por dia/semana/mês custa apenas algumas subtrações,
+independente do tamanho do board.
+
+O dia de cada tarefa é a mesma data usada pelo filtro de período dos
+relatórios, então contar um período no rollup equivale a gerar os relatórios
+desse período.
+"""
+
+from datetime import date, timedelta
+from typing import List, Any, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .config import NO_GROUP, ROLLUP_GRANULARITIES, ROLLUP_GRANULARITY
+
+# Nomes das dimensões consultáveis
+DIMENSIONS = ['grupo', 'status', 'colaborador']
+
+class PrefixCounts:
+    """Contagens diárias por chave, guardadas como somas acumuladas."""
+
+    def __init__(self, keys: pd.DataFrame, key_codes: np.ndarray, day_offsets: np.ndarray, n_days: int):
+        """
+        Materializa as somas de prefixo.
+
+        Args:
+            keys: Uma linha por chave (colunas = dimensões)
+            key_codes: Chave de cada registro
+            day_offsets: Dia de cada registro (dias desde o primeiro dia)
+            n_days: Número de dias cobertos
+        """
+        self.keys = keys.reset_index(drop=True)
+        flat = np.bincount(key_codes * n_days + day_offsets, minlength=len(keys) * n_days)
+        self.cumulative = np.zeros((len(keys), n_days + 1), dtype=np.int64)
+        np.cumsum(flat.reshape(len(keys), n_days), axis=1, out=self.cumulative[:, 1:])
+
+    def window_counts(self, boundaries: np.ndarray) -> np.ndarray:
+        """
+        Contagens entre fronteiras consecutivas de dias.
+
+        Args:
+            boundaries: Offsets de dia crescentes (n_buckets + 1)
+
+        Returns:
+            Matriz (chaves x buckets)
+        """
+        return np.diff(self.cumulative[:, boundaries], axis=1)
+
+class RollupStore:
+    """
+    Contagens diárias de tarefas por (grupo, status) e por colaborador.
+
+    Mantém duas tabelas: uma por linha de relatório de tarefa e outra por
+    colaborador individual (nomes separados por vírgula, como em
+    generate_collaborator_reports), para que totais por grupo/status não
+    contem a mesma tarefa uma vez por colaborador.
+    """
+
+    def __init__(self, first_day: date, n_days: int, tasks: PrefixCounts, collaborators: PrefixCounts,
+                 as_of: Optional[date] = None):
+        self.first_day = first_day
+        self.n_days = n_days
+        self.tasks = tasks
+        self.collaborators = collaborators
+        self.as_of = as_of
+
+    @classmethod
+    def from_reports(cls, task_reports: List[Any], report_days: Sequence[date],
+                     as_of: Optional[date] = None) -> 'RollupStore':
+        """
+        Constrói o rollup a partir de relatórios já gerados.
+
+        Args:
+            task_reports: Relatórios de tarefas
+            report_days: Dia de cada relatório
+            as_of: Data de referência usada nos relatórios
+
+        Returns:
+            Rollup materializado
+        """
+        if task_reports:
+            days = np.array(report_days, dtype='datetime64[D]')
+            first = days.min()
+            offsets = (days - first).astype(np.int64)
+            first_day, n_days = first.astype(date), int(offsets.max()) + 1
+        else:
+            offsets = np.array([], dtype=np.int64)
+            first_day, n_days = as_of or date.today(), 1
+
+        task_rows = pd.DataFrame({
+            'grupo': [t.grupo or NO_GROUP for t in task_reports],
+            'status': [t.status for t in task_reports],
+            'day': offsets
+        })
+
+        collaborator_rows = task_rows.assign(
+            colaborador=[[nome.strip() for nome in t.collaborator_name.split(',')] for t in task_reports]
+        ).explode('colaborador')
+
+        return cls(
+            first_day=first_day,
+            n_days=n_days,
+            tasks=_prefix_counts(task_rows, ['grupo', 'status'], n_days),
+            collaborators=_prefix_counts(collaborator_rows, DIMENSIONS, n_days),
+            as_of=as_of
+        )
+
+    @property
+    def last_day(self) -> date:
+        return self.first_day + timedelta(days=self.n_days - 1)
+
+    def _offset(self, day: date) -> int:
+        """Offset de um dia, limitado ao intervalo coberto (0..n_days)."""
+        return min(max((day - self.first_day).days, 0), self.n_days)
+
+    def bucket_starts(self, start_date: date, end_date: date, granularity: str = ROLLUP_GRANULARITY) -> List[date]:
+        """
+        Início de cada bucket do período (o primeiro é o próprio start_date).
+
+        Args:
+            start_date: Data de início
+            end_date: Data de fim
+            granularity: 'day', 'week' (semanas começando na segunda) ou 'month'
+
+        Returns:
+            Lista de datas de início dos buckets
+        """
+        if granularity not in ROLLUP_GRANULARITIES:
+            raise ValueError(f"Granularidade desconhecida: '{granularity}'")
+
+        unit = {'day': 'D', 'week': 'W', 'month': 'M'}[granularity]
+        days = np.arange(np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D') + 1)
+        if unit == 'W':
+            # datetime64[W] começa na quinta-feira (1970-01-01); desloca para segunda
+            starts = days - ((days.astype(np.int64) + 3) % 7).astype('timedelta64[D]')
+        else:
+            starts = days.astype(f'datetime64[{unit}]').astype('datetime64[D]')
+        starts = np.maximum(np.unique(starts), np.datetime64(start_date, 'D'))
+        return [d.astype(date) for d in starts]
+
+    def _table(self, by: Sequence[str]) -> PrefixCounts:
+        unknown = set(by) - set(DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Dimensões desconhecidas: {sorted(unknown)}")
+        return self.collaborators if 'colaborador' in by else self.tasks
+
+    def series(self, start_date: date, end_date: date, by: Sequence[str] = ('status',),
+               granularity: str = ROLLUP_GRANULARITY, grupos: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Contagens por bucket de tempo no período.
+
+        Args:
+            start_date: Data de início (inclusiva)
+            end_date: Data de fim (inclusiva)
+            by: Dimensões das colunas ('grupo', 'status', 'colaborador')
+            granularity: 'day', 'week' ou 'month'
+            grupos: Restringe a estes grupos (NO_GROUP para tarefas sem grupo)
+
+        Returns:
+            DataFrame com uma linha por bucket (índice = início do bucket) e
+            uma coluna por combinação das dimensões
+        """
+        by = list(by)
+        table = self._table(by)
+        starts = self.bucket_starts(start_date, end_date, granularity)
+        boundaries = np.array([self._offset(d) for d in starts] + [self._offset(end_date + timedelta(days=1))])
+
+        counts = table.window_counts(boundaries)
+        keys = table.keys
+        if grupos is not None:
+            selected = keys['grupo'].isin(list(grupos)).to_numpy()
+            keys, counts = keys[selected], counts[selected]
+
+        if not by:
+            raise ValueError("Informe ao menos uma dimensão")
+        grouped = pd.DataFrame(counts, index=pd.MultiIndex.from_frame(keys[by])).groupby(level=list(range(len(by)))).sum()
+        frame = grouped.T
+        frame.index = pd.Index(starts, name='periodo')
+        return frame
+
+    def totals(self, start_date: date, end_date: date, by: Sequence[str] = ('grupo', 'status'),
+               grupos: Optional[Sequence[str]] = None) -> pd.Series:
+        """
+        Totais do período agregados pelas dimensões informadas.
+
+        Args:
+            start_date: Data de início (inclusiva)
+            end_date: Data de fim (inclusiva)
+            by: Dimensões do agrupamento
+            grupos: Restringe a estes grupos
+
+        Returns:
+            Série de contagens indexada pelas dimensões
+        """
+        by = list(by)
+        table = self._table(by)
+        boundaries = np.array([self._offset(start_date), self._offset(end_date + timedelta(days=1))])
+        counts = table.window_counts(boundaries)[:, 0]
+
+        frame = table.keys.assign(count=counts)
+        if grupos is not None:
+            frame = frame[frame['grupo'].isin(list(grupos))]
+        return frame.groupby(by)['count'].sum()
+
+def _prefix_counts(rows: pd.DataFrame, dimensions: List[str], n_days: int) -> PrefixCounts:
+    """Internaliza as chaves das linhas e monta a tabela de somas de prefixo."""
+    if rows.empty:
+        keys = pd.DataFrame(columns=dimensions)
+        return PrefixCounts(keys, np.array([], dtype=np.int64), np.array([], dtype=np.int64), n_days)
+
+    key_codes, keys = pd.MultiIndex.from_frame(rows[dimensions]).factorize()
+    return PrefixCounts(pd.DataFrame(list(keys), columns=dimensions), key_codes, rows['day'].to_numpy(dtype=np.int64), n_days)
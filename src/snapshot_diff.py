@@ -0,0 +1,134 @@
+"""
+Diferenças entre dois exports do mesmo board (ex.: semana passada x esta).
+
+Os cards dos dois exports são cruzados por id em um hash join. Cada card
+tem uma impressão digital por campo (lista, status, prazo e responsáveis);
+só os campos cujas impressões diferem geram mudanças, e o custo total é
+linear no tamanho dos boards. O status é o do TrelloDataProcessor
+(Concluída, Atrasada, Bloqueada...), calculado na data de referência de
+cada export.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Any, Optional, Tuple
+
+import pandas as pd
+
+from .board_index import BoardIndex
+from .data_processor import TrelloDataProcessor
+
+# Tipos de mudança, na ordem em que são reportados
+CHANGE_KINDS = ['adicionado', 'removido', 'movido', 'status', 'prazo', 'responsaveis']
+
+# Campos comparados (tipo de mudança -> posição na impressão digital)
+FIELD_KINDS = ['movido', 'status', 'prazo', 'responsaveis']
+
+@dataclass
+class CardChange:
+    """Uma mudança de um card entre os dois exports."""
+    card_id: str
+    card_name: str
+    kind: str
+    before: Optional[str]
+    after: Optional[str]
+
+@dataclass
+class SnapshotDiff:
+    """Resultado da comparação de dois exports."""
+    previous_as_of: date
+    current_as_of: date
+    changes: List[CardChange] = field(default_factory=list)
+    unchanged_cards: int = 0
+
+    def counts(self) -> Dict[str, int]:
+        """Número de mudanças por tipo (todos os tipos, mesmo sem mudanças)."""
+        counts = {kind: 0 for kind in CHANGE_KINDS}
+        for change in self.changes:
+            counts[change.kind] += 1
+        return counts
+
+    def by_kind(self, kind: str) -> List[CardChange]:
+        return [change for change in self.changes if change.kind == kind]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Mudanças em formato tabular (card_id, card_name, kind, before, after)."""
+        return pd.DataFrame(
+            [(c.card_id, c.card_name, c.kind, c.before, c.after) for c in self.changes],
+            columns=['card_id', 'card_name', 'kind', 'before', 'after']
+        )
+
+def card_fields(data: Dict[str, Any], processor: TrelloDataProcessor,
+                as_of: date) -> Dict[str, Tuple[str, Tuple[Optional[str], ...]]]:
+    """
+    Campos comparáveis de cada card de um export.
+
+    Args:
+        data: Dados do Trello
+        processor: Processador (regras de status)
+        as_of: Data de referência do export
+
+    Returns:
+        Dict id do card -> (nome, (lista, status, prazo, responsáveis))
+    """
+    index = BoardIndex.from_data(data)
+    statuses = processor.get_card_statuses(data, as_of, index=index)
+
+    fields = {}
+    for position, card in enumerate(index.cards):
+        card_id = card.get('id', '')
+        due = index.due_dates[position]
+        members = ', '.join(member['fullName'] for member in index.card_members(card))
+        fields[card_id] = (card.get('name', ''), (
+            index.list_info(card.get('idList')).name,
+            statuses[card_id],
+            due.isoformat() if due is not None else None,
+            members or None
+        ))
+    return fields
+
+def diff_snapshots(previous: Dict[str, Any], current: Dict[str, Any],
+                   processor: Optional[TrelloDataProcessor] = None,
+                   previous_as_of: Optional[date] = None,
+                   current_as_of: Optional[date] = None) -> SnapshotDiff:
+    """
+    Compara dois exports do mesmo board.
+
+    Args:
+        previous: Export anterior
+        current: Export atual
+        processor: Processador (regras de status e data de referência padrão)
+        previous_as_of: Data de referência do export anterior
+        current_as_of: Data de referência do export atual
+
+    Returns:
+        SnapshotDiff com as mudanças na ordem dos cards (removidos por último)
+    """
+    processor = processor or TrelloDataProcessor()
+    previous_as_of = processor.get_reference_date(previous_as_of)
+    current_as_of = processor.get_reference_date(current_as_of)
+
+    before = card_fields(previous, processor, previous_as_of)
+    after = card_fields(current, processor, current_as_of)
+    before_hashes = {card_id: hash(values) for card_id, (_, values) in before.items()}
+
+    diff = SnapshotDiff(previous_as_of=previous_as_of, current_as_of=current_as_of)
+    for card_id, (name, values) in after.items():
+        previous_hash = before_hashes.get(card_id)
+        if previous_hash is None:
+            diff.changes.append(CardChange(card_id, name, 'adicionado', None, values[0]))
+            continue
+        if previous_hash == hash(values) and before[card_id][1] == values:
+            diff.unchanged_cards += 1
+            continue
+
+        old_values = before[card_id][1]
+        for kind, old, new in zip(FIELD_KINDS, old_values, values):
+            if old != new:
+                diff.changes.append(CardChange(card_id, name, kind, old, new))
+
+    for card_id, (name, values) in before.items():
+        if card_id not in after:
+            diff.changes.append(CardChange(card_id, name, 'removido', values[0], None))
+
+    return diff
@@ -0,0 +1,335 @@
+"""
+Sincronização incremental de boards pela API do Trello.
+
+A primeira sincronização busca o board inteiro (TrelloClient.fetch_board_data)
+e guarda o modelo em cache junto com um cursor: o id da ação mais recente.
+As seguintes pedem apenas as ações posteriores ao cursor (`since`) e as
+aplicam ao modelo - movimentações, membros, prazos, arquivamento, cards
+criados (buscados individualmente em /cards/{id}) e removidos.
+
+Em disco, o modelo é um snapshot mais um journal com os lotes aplicados
+depois dele; o snapshot só é regravado quando o journal passa de
+SYNC_COMPACT_ACTIONS ações. Assim o custo da sincronização acompanha o
+volume de mudanças, não o tamanho do board; os relatórios que dependem
+dela, gerados com o cache por card (card_cache), reclassificam apenas os
+cards alterados.
+"""
+
+import asyncio
+import os
+import pickle
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from .config import SYNC_STATE_DIR, SYNC_COMPACT_ACTIONS
+from .trello_api import ACTION_TYPES, TrelloAPIError, TrelloClient
+
+# Ações acompanhadas na sincronização (as do export mais alterações de listas)
+SYNC_ACTION_TYPES = ACTION_TYPES + ['createList', 'updateList']
+
+# Ações que trazem um card para o board (o card completo é buscado à parte)
+CARD_ARRIVAL_ACTIONS = {'createCard', 'copyCard', 'moveCardToBoard', 'convertToCardFromCheckItem', 'emailCard'}
+
+# Ações que tiram um card do board
+CARD_REMOVAL_ACTIONS = {'deleteCard', 'moveCardFromBoard'}
+
+@dataclass
+class SyncCursor:
+    """Posição da última sincronização: ação mais recente aplicada (ou instante da busca completa)."""
+    action_id: Optional[str] = None
+    synced_at: Optional[str] = None
+
+    @property
+    def since(self) -> Optional[str]:
+        return self.action_id or self.synced_at
+
+@dataclass
+class SyncResult:
+    """Resumo de uma sincronização."""
+    board_id: str
+    full: bool
+    actions: int
+    changed_cards: List[str] = field(default_factory=list)
+    removed_cards: List[str] = field(default_factory=list)
+    requests: int = 0
+    seconds: float = 0.0
+
+class BoardModel:
+    """
+    Board em cache (formato do export) com acesso a cards, listas e membros por id.
+
+    Os cards ficam em um dict por id (na ordem do board) e as ações novas em
+    lotes; aplicar um lote custa o tamanho do lote. As listas de cards e de
+    ações do export só são remontadas quando `data` é lido depois de uma
+    remoção de card ou de ações novas.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+        data.setdefault('actions', [])
+        self.cards = {card['id']: card for card in data['cards']}
+        self.lists = {lista['id']: lista for lista in data['lists']}
+        self.members = {member['id']: member for member in data['members']}
+        self._cards_removed = False
+        self._action_batches: List[List[Dict[str, Any]]] = []
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Board no formato do export (ações da mais recente para a mais antiga)."""
+        if self._cards_removed:
+            self._data['cards'] = list(self.cards.values())
+            self._cards_removed = False
+        if self._action_batches:
+            self._data['actions'] = [
+                action for batch in reversed(self._action_batches) for action in batch
+            ] + self._data['actions']
+            self._action_batches = []
+        return self._data
+
+    def add_actions(self, actions: List[Dict[str, Any]]):
+        """Registra um lote de ações aplicadas (da mais recente para a mais antiga, como na API)."""
+        if actions:
+            self._action_batches.append(actions)
+
+    def apply(self, action: Dict[str, Any]) -> Tuple[Optional[str], bool]:
+        """
+        Aplica uma ação ao modelo.
+
+        Args:
+            action: Ação do Trello
+
+        Returns:
+            (id do card afetado ou None, True se o card completo precisa ser buscado)
+        """
+        action_type = action.get('type')
+        data = action.get('data') or {}
+
+        if action_type in ('createList', 'updateList'):
+            lista = data.get('list') or {}
+            if lista.get('id') in self.lists:
+                self.lists[lista['id']].update(lista)
+            elif lista.get('id'):
+                self.lists[lista['id']] = dict(lista)
+                self._data['lists'].append(self.lists[lista['id']])
+            return None, False
+
+        card_id = (data.get('card') or {}).get('id')
+        if card_id is None:
+            return None, False
+
+        if action_type in CARD_REMOVAL_ACTIONS:
+            if self.cards.pop(card_id, None) is not None:
+                self._cards_removed = True
+            return card_id, False
+
+        card = self.cards.get(card_id)
+        if action_type in CARD_ARRIVAL_ACTIONS or card is None:
+            return card_id, True
+
+        if action_type == 'updateCard':
+            # data.old traz os campos alterados; data.card, os valores novos
+            for name in (data.get('old') or {}):
+                card[name] = data['card'].get(name)
+            if 'listAfter' in data:
+                card['idList'] = data['listAfter']['id']
+        elif action_type in ('addMemberToCard', 'removeMemberFromCard'):
+            member_id = data.get('idMember')
+            members = [m for m in card.get('idMembers', []) if m != member_id]
+            if action_type == 'addMemberToCard':
+                members.append(member_id)
+                member = action.get('member')
+                if member and member_id not in self.members:
+                    self.members[member_id] = {
+                        'id': member_id, 'username': member.get('username', ''), 'fullName': member.get('fullName', '')
+                    }
+                    self._data['members'].append(self.members[member_id])
+            card['idMembers'] = members
+
+        if action.get('date') and action['date'] > (card.get('dateLastActivity') or ''):
+            card['dateLastActivity'] = action['date']
+        return card_id, False
+
+    def put_card(self, card: Dict[str, Any]):
+        """Insere ou substitui um card buscado da API."""
+        current = self.cards.get(card['id'])
+        if current is not None:
+            current.clear()
+            current.update(card)
+        else:
+            self.cards[card['id']] = card
+            if not self._cards_removed:
+                self._data['cards'].append(card)
+
+class BoardSync:
+    """Sincronização de um board com modelo e cursor persistidos em disco."""
+
+    def __init__(self, board_id: str, state_dir: str = SYNC_STATE_DIR):
+        """
+        Args:
+            board_id: Id do board
+            state_dir: Pasta do estado ('' mantém o estado apenas em memória)
+        """
+        self.board_id = board_id
+        self.path = os.path.join(state_dir, f'{board_id}.pkl') if state_dir else None
+        self.journal_path = os.path.join(state_dir, f'{board_id}.journal') if state_dir else None
+        self.model: Optional[BoardModel] = None
+        self.cursor = SyncCursor()
+        self.journal_actions = 0
+
+        if self.path and os.path.exists(self.path):
+            with open(self.path, 'rb') as f:
+                data, self.cursor = pickle.load(f)
+            self.model = BoardModel(data)
+            self._replay_journal()
+
+    @property
+    def data(self) -> Optional[Dict[str, Any]]:
+        return self.model.data if self.model is not None else None
+
+    def _replay_journal(self):
+        """Reaplica os lotes gravados depois do snapshot (um lote incompleto no fim é ignorado)."""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'rb') as f:
+            while True:
+                try:
+                    actions, cards, cursor = pickle.load(f)
+                except (EOFError, pickle.UnpicklingError):
+                    break
+                self._apply_batch(actions, cards)
+                self.cursor = cursor
+                self.journal_actions += len(actions)
+
+    def save(self):
+        """Grava o snapshot do modelo e esvazia o journal."""
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f'{self.path}.tmp-{os.getpid()}'
+        with open(temp_path, 'wb') as f:
+            pickle.dump((self.model.data, self.cursor), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.path)
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.journal_actions = 0
+
+    def _append_journal(self, actions: List[Dict[str, Any]], cards: List[Dict[str, Any]]):
+        """Acrescenta um lote ao journal, compactando no snapshot quando ele cresce demais."""
+        if not self.path:
+            return
+        self.journal_actions += len(actions)
+        if self.journal_actions > SYNC_COMPACT_ACTIONS:
+            self.save()
+            return
+        with open(self.journal_path, 'ab') as f:
+            pickle.dump((actions, cards, self.cursor), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _apply_batch(self, actions: List[Dict[str, Any]],
+                     cards: List[Dict[str, Any]]) -> Tuple[Dict[str, None], Set[str], Set[str]]:
+        """
+        Aplica um lote de ações (da mais recente para a mais antiga, como na API).
+
+        Returns:
+            (cards afetados em ordem, cards removidos, cards a buscar)
+        """
+        changed: Dict[str, None] = {}
+        removed: Set[str] = set()
+        missing: Set[str] = set()
+        for action in reversed(actions):
+            card_id, needs_fetch = self.model.apply(action)
+            if card_id is None:
+                continue
+            changed[card_id] = None
+            if action.get('type') in CARD_REMOVAL_ACTIONS:
+                removed.add(card_id)
+                missing.discard(card_id)
+            elif needs_fetch:
+                removed.discard(card_id)
+                missing.add(card_id)
+
+        for card in cards:
+            self.model.put_card(card)
+        self.model.add_actions(actions)
+        return changed, removed, missing
+
+    async def sync(self, client: TrelloClient, full: bool = False) -> SyncResult:
+        """
+        Sincroniza o modelo com a API.
+
+        Args:
+            client: Cliente da API
+            full: Ignora o cursor e busca o board inteiro
+
+        Returns:
+            SyncResult (changed_cards traz os cards criados ou alterados)
+        """
+        started = time.perf_counter()
+        requests = client.requests
+
+        if full or self.model is None or self.cursor.since is None:
+            synced_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+            self.model = BoardModel(await client.fetch_board_data(self.board_id))
+            actions = self.model.data['actions']
+            self.cursor = SyncCursor(actions[0].get('id') if actions else None, synced_at)
+            result = SyncResult(self.board_id, full=True, actions=len(actions), changed_cards=list(self.model.cards))
+        else:
+            actions = await client.paginate(
+                f'/boards/{self.board_id}/actions', filter=','.join(SYNC_ACTION_TYPES), since=self.cursor.since
+            )
+            changed, removed, missing = self._apply_batch(actions, [])
+            cards = [
+                card for card in await asyncio.gather(*(self._fetch_card(client, card_id) for card_id in missing))
+                if card is not None
+            ]
+            self._apply_batch([], cards)
+
+            if actions:
+                self.cursor = SyncCursor(actions[0].get('id'), actions[0].get('date'))
+                self._append_journal(actions, cards)
+            result = SyncResult(
+                self.board_id, full=False, actions=len(actions),
+                changed_cards=[card_id for card_id in changed if card_id in self.model.cards],
+                removed_cards=sorted(removed)
+            )
+
+        if result.full:
+            self.save()
+        result.requests = client.requests - requests
+        result.seconds = time.perf_counter() - started
+        return result
+
+    @staticmethod
+    async def _fetch_card(client: TrelloClient, card_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return await client.get(f'/cards/{card_id}')
+        except TrelloAPIError as e:
+            if e.status == 404:
+                return None
+            raise
+
+def sync_board(board_id: str, key: str = '', token: str = '', state_dir: str = SYNC_STATE_DIR,
+               full: bool = False, board_sync: Optional[BoardSync] = None,
+               **client_options) -> Tuple[BoardSync, SyncResult]:
+    """
+    Versão síncrona de BoardSync.sync (CLI e app).
+
+    Args:
+        board_id: Id do board
+        key: Chave da API
+        token: Token do usuário
+        state_dir: Pasta do estado
+        full: Força a busca completa
+        board_sync: Sincronização já carregada (evita reler o estado do disco)
+        **client_options: Opções do TrelloClient
+
+    Returns:
+        (BoardSync, SyncResult)
+    """
+    board_sync = board_sync or BoardSync(board_id, state_dir)
+
+    async def run() -> SyncResult:
+        async with TrelloClient(key, token, **client_options) as client:
+            return await board_sync.sync(client, full=full)
+    return board_sync, asyncio.run(run())
@@ -0,0 +1,81 @@
+"""
+Tabelas para exibição e links de download (CSV e Excel) a partir de DataFrames.
+"""
+
+import pandas as pd
+from typing import Dict
+import base64
+import io
+
+def create_download_link(df: pd.DataFrame, filename: str, link_text: str = "📥 Download") -> str:
+    """
+    Cria link de download para DataFrame como CSV.
+    
+    Args:
+        df: DataFrame para download
+        filename: Nome do arquivo
+        link_text: Texto do link
+        
+    Returns:
+        HTML do link de download
+    """
+    csv = df.to_csv(index=False)
+    b64 = base64.b64encode(csv.encode()).decode()
+    href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">{link_text}</a>'
+    return href
+
+def format_dataframe_for_display(df: pd.DataFrame, max_rows: int = 100) -> pd.DataFrame:
+    """
+    Formata DataFrame para exibição no Streamlit.
+    
+    Args:
+        df: DataFrame original
+        max_rows: Número máximo de linhas a exibir
+        
+    Returns:
+        DataFrame formatado
+    """
+    if df.empty:
+        return df
+    
+    # Limita número de linhas
+    df_display = df.head(max_rows).copy()
+    
+    # Formata colunas de data
+    date_columns = ['created_date', 'due_date']
+    for col in date_columns:
+        if col in df_display.columns:
+            df_display[col] = pd.to_datetime(df_display[col]).dt.strftime('%d/%m/%Y')
+    
+    # Formata listas como strings
+    list_columns = ['members', 'task_names', 'top_status']
+    for col in list_columns:
+        if col in df_display.columns:
+            df_display[col] = df_display[col].apply(
+                lambda x: ', '.join(x) if isinstance(x, list) else str(x)
+            )
+    
+    return df_display
+
+def download_excel_link(df_dict: Dict[str, pd.DataFrame], filename: str) -> str:
+    """
+    Cria link de download para arquivo Excel.
+    
+    Args:
+        df_dict: Dicionário com DataFrames para cada aba
+        filename: Nome do arquivo
+        
+    Returns:
+        String com link de download base64
+    """
+    output = io.BytesIO()
+    
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        for sheet_name, df in df_dict.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    
+    output.seek(0)
+    b64 = base64.b64encode(output.read()).decode()
+    
+    href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="{filename}">📥 Download Excel</a>'
+    return href
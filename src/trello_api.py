@@ -0,0 +1,313 @@
+"""
+Busca de boards direto da API REST do Trello (sem export manual).
+
+Cliente asyncio HTTP/1.1 apenas com a biblioteca padrão: conexões keep-alive
+reaproveitadas em um pool limitado, limitador de taxa (token bucket, nos
+limites de requisições por token do Trello), novas tentativas com backoff
+em 429/5xx/falhas de conexão e paginação das ações pelo cursor `before`.
+Cards, listas, membros e ações são buscados em paralelo e montados no mesmo
+formato do JSON exportado, já com BoardIndex e ListTransitionIndex.
+
+As respostas podem ser gravadas (TrelloClient(record=...)) e reproduzidas
+nos testes pelo ReplayServer de trello_replay.py.
+"""
+
+import asyncio
+import gzip
+import json
+import ssl
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from .actions import ListTransitionIndex
+from .board_index import BoardIndex
+from .config import (
+    TRELLO_API_URL, TRELLO_MAX_CONNECTIONS, TRELLO_RATE_LIMIT, TRELLO_RATE_PERIOD,
+    TRELLO_MAX_RETRIES, TRELLO_PAGE_SIZE
+)
+
+# Tipos de ação buscados: movimentações (índice de transições) e alterações de card
+ACTION_TYPES = [
+    'createCard', 'copyCard', 'moveCardToBoard', 'convertToCardFromCheckItem', 'emailCard',
+    'updateCard', 'addMemberToCard', 'removeMemberFromCard', 'deleteCard', 'moveCardFromBoard'
+]
+
+# Parâmetros de autenticação (fora da chave das respostas gravadas)
+AUTH_PARAMS = {'key', 'token'}
+
+class TrelloAPIError(Exception):
+    """Resposta de erro da API do Trello (ou tentativas esgotadas)."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f'HTTP {status}: {message}')
+        self.status = status
+
+def request_key(path: str, params: Dict[str, Any]) -> str:
+    """Chave de uma requisição (caminho + parâmetros ordenados, sem credenciais)."""
+    query = sorted((k, str(v)) for k, v in params.items() if k not in AUTH_PARAMS)
+    return f'{path}?{urlencode(query)}' if query else path
+
+class RateLimiter:
+    """Token bucket: no máximo `requests` requisições a cada `period` segundos."""
+
+    def __init__(self, requests: int = TRELLO_RATE_LIMIT, period: float = TRELLO_RATE_PERIOD):
+        self.capacity = requests
+        self.rate = requests / period
+        self.tokens = float(requests)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+@dataclass
+class FetchedBoard:
+    """Board buscado da API, pronto para o processador."""
+    data: Dict[str, Any]
+    index: BoardIndex
+    transitions: Optional[ListTransitionIndex]
+    requests: int
+    seconds: float
+
+class TrelloClient:
+    """Cliente assíncrono da API REST do Trello."""
+
+    def __init__(self, key: str = '', token: str = '', base_url: str = TRELLO_API_URL,
+                 max_connections: int = TRELLO_MAX_CONNECTIONS, max_retries: int = TRELLO_MAX_RETRIES,
+                 rate_limiter: Optional[RateLimiter] = None, backoff: float = 0.5,
+                 page_size: int = TRELLO_PAGE_SIZE, record: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            key: Chave da API
+            token: Token do usuário
+            base_url: URL base (ex.: a de um ReplayServer nos testes)
+            max_connections: Conexões simultâneas no pool
+            max_retries: Novas tentativas por requisição
+            rate_limiter: Limitador de taxa (padrão: limites do Trello)
+            backoff: Espera inicial entre tentativas (dobra a cada falha)
+            page_size: Itens por página nos recursos paginados
+            record: Dict que recebe as respostas (chave -> corpo), para replay
+        """
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        default_port = 443 if parts.scheme == 'https' else 80
+        self.port = parts.port or default_port
+        # A porta entra no Host quando não é a padrão do esquema (replay local, proxy)
+        self.host_header = self.host if self.port == default_port else f'{self.host}:{self.port}'
+        self.base_path = parts.path.rstrip('/')
+        self.auth = {'key': key, 'token': token} if key or token else {}
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.page_size = page_size
+        self.record = record
+        self.requests = 0
+        self.retries = 0
+        self.connections_opened = 0
+
+        self._max_connections = max_connections
+        self._rate_limiter = rate_limiter
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def __aenter__(self) -> 'TrelloClient':
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        """Fecha as conexões ociosas do pool."""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _open(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        self.connections_opened += 1
+        ssl_context = ssl.create_default_context() if self.scheme == 'https' else None
+        return await asyncio.open_connection(self.host, self.port, ssl=ssl_context)
+
+    async def _exchange(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                        target: str) -> Tuple[int, Dict[str, str], bytes, bool]:
+        """Envia um GET e lê a resposta (Content-Length, chunked ou até o fim da conexão)."""
+        writer.write((
+            f'GET {target} HTTP/1.1\r\n'
+            f'Host: {self.host_header}\r\n'
+            'Accept: application/json\r\n'
+            'Accept-Encoding: gzip\r\n'
+            'Connection: keep-alive\r\n\r\n'
+        ).encode('latin-1'))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('conexão encerrada pelo servidor')
+        version, status = status_line.decode('latin-1').split(None, 2)[:2]
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        else:
+            body = await reader.read()
+            keep_alive = False
+
+        if headers.get('content-encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return int(status), headers, body, keep_alive
+
+    async def _send(self, target: str) -> Tuple[int, Dict[str, str], bytes]:
+        """Executa a requisição em uma conexão do pool."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_connections)
+
+        async with self._slots:
+            reused = bool(self._idle)
+            reader, writer = self._idle.pop() if reused else await self._open()
+            try:
+                status, headers, body, keep_alive = await self._exchange(reader, writer, target)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if not reused:
+                    raise
+                # Conexão keep-alive encerrada pelo servidor enquanto ociosa: tenta uma nova
+                reader, writer = await self._open()
+                try:
+                    status, headers, body, keep_alive = await self._exchange(reader, writer, target)
+                except BaseException:
+                    writer.close()
+                    raise
+            except BaseException:
+                writer.close()
+                raise
+
+            if keep_alive:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+            return status, headers, body
+
+    async def get(self, path: str, **params) -> Any:
+        """
+        GET na API com novas tentativas e limite de taxa.
+
+        Args:
+            path: Caminho relativo à URL base (ex.: '/boards/ID/cards')
+            **params: Parâmetros de consulta
+
+        Returns:
+            Corpo JSON decodificado
+        """
+        target = f'{self.base_path}{path}?{urlencode({**params, **self.auth})}'
+        delay = self.backoff
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.retries += 1
+                await asyncio.sleep(delay)
+                delay *= 2
+            if self._rate_limiter is None:
+                self._rate_limiter = RateLimiter()
+            await self._rate_limiter.acquire()
+
+            self.requests += 1
+            try:
+                status, headers, body = await self._send(target)
+            except (OSError, asyncio.IncompleteReadError) as e:
+                error = TrelloAPIError(0, str(e) or type(e).__name__)
+                continue
+
+            if status == 200:
+                payload = json.loads(body)
+                if self.record is not None:
+                    self.record[request_key(path, params)] = payload
+                return payload
+            error = TrelloAPIError(status, body.decode('utf-8', 'replace')[:200])
+            if status != 429 and status < 500:
+                raise error
+            if 'retry-after' in headers:
+                delay = max(delay, float(headers['retry-after']))
+
+        raise error
+
+    async def paginate(self, path: str, **params) -> List[Dict[str, Any]]:
+        """
+        Busca todas as páginas de um recurso ordenado do mais recente ao mais antigo.
+
+        Cada página pede os itens anteriores (`before`) ao último item da página
+        anterior, até vir uma página incompleta.
+        """
+        items = []
+        before = None
+        while True:
+            page_params = dict(params, limit=self.page_size)
+            if before is not None:
+                page_params['before'] = before
+            page = await self.get(path, **page_params)
+            items.extend(page)
+            if len(page) < self.page_size:
+                return items
+            before = page[-1].get('id') or page[-1]['date']
+
+    async def fetch_board_data(self, board_id: str) -> Dict[str, Any]:
+        """Dados do board no formato do JSON exportado (board, cards, listas, membros e ações)."""
+        board, cards, lists, members, actions = await asyncio.gather(
+            self.get(f'/boards/{board_id}', fields='id,name,desc,url,dateLastActivity'),
+            self.get(f'/boards/{board_id}/cards', filter='all'),
+            self.get(f'/boards/{board_id}/lists', filter='all'),
+            self.get(f'/boards/{board_id}/members', fields='id,username,fullName'),
+            self.paginate(f'/boards/{board_id}/actions', filter=','.join(ACTION_TYPES))
+        )
+        return {**board, 'cards': cards, 'lists': lists, 'members': members, 'actions': actions}
+
+    async def fetch_board(self, board_id: str) -> FetchedBoard:
+        """Busca o board e monta os índices usados pelo processador."""
+        started = time.perf_counter()
+        requests = self.requests
+        data = await self.fetch_board_data(board_id)
+        return FetchedBoard(
+            data=data,
+            index=BoardIndex.from_data(data),
+            transitions=ListTransitionIndex.from_data(data),
+            requests=self.requests - requests,
+            seconds=time.perf_counter() - started
+        )
+
+def fetch_board(board_id: str, key: str = '', token: str = '', **client_options) -> FetchedBoard:
+    """Versão síncrona de TrelloClient.fetch_board (CLI e app)."""
+    async def run() -> FetchedBoard:
+        async with TrelloClient(key, token, **client_options) as client:
+            return await client.fetch_board(board_id)
+    return asyncio.run(run())
@@ -0,0 +1,280 @@
+"""
+Ingestão de exports deixados em uma pasta monitorada.
+
+O watcher varre a pasta periodicamente (polling, sem serviços externos) e
+considera um arquivo pronto quando tamanho e data de modificação ficam
+estáveis pelo intervalo de debounce - exports ainda sendo gravados são
+ignorados até terminarem. Arquivos prontos cujo conteúdo (hash) ou data de
+referência mudou são processados em um pool limitado de processos, e o
+resultado (dados do board e relatórios do board inteiro) é gravado na pasta
+de saída, de onde o app carrega sem reprocessar.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import date, datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from .config import WATCH_OUTPUT_DIR, WATCH_POLL_SECONDS, WATCH_DEBOUNCE_SECONDS, WATCH_WORKERS, METRICS_TEXTFILE
+from .metrics import record_board, write_textfile
+
+logger = logging.getLogger(__name__)
+
+# Índice dos boards processados na pasta de saída
+MANIFEST_NAME = 'manifest.json'
+
+@dataclass
+class ProcessedBoard:
+    """Entrada do manifesto de um export processado."""
+    source: str
+    content_hash: str
+    as_of: str
+    board_name: str
+    cards: int
+    task_reports: int
+    output: str
+    processed_at: str
+    seconds: float
+
+def file_content_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 do conteúdo de um arquivo (lido em blocos)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _write_atomic(path: str, payload: bytes):
+    """Grava em arquivo temporário e renomeia (leitores nunca veem arquivos parciais)."""
+    temp_path = f'{path}.tmp-{os.getpid()}'
+    with open(temp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(temp_path, path)
+
+def read_manifest(output_dir: str = WATCH_OUTPUT_DIR) -> Dict[str, ProcessedBoard]:
+    """Boards processados (nome do export -> entrada), vazio se não houver manifesto."""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            entries = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return {name: ProcessedBoard(**entry) for name, entry in entries.items()}
+
+def write_manifest(entries: Dict[str, ProcessedBoard], output_dir: str = WATCH_OUTPUT_DIR):
+    payload = json.dumps({name: asdict(entry) for name, entry in entries.items()}, ensure_ascii=False, indent=2)
+    _write_atomic(os.path.join(output_dir, MANIFEST_NAME), payload.encode('utf-8'))
+
+def load_processed_board(entry: ProcessedBoard, output_dir: str = WATCH_OUTPUT_DIR) -> Dict[str, Any]:
+    """
+    Carrega o resultado de um export processado.
+
+    Returns:
+        Dict com data, as_of, task_reports e report_days (ver process_export)
+    """
+    with open(os.path.join(output_dir, entry.output), 'rb') as f:
+        return pickle.load(f)
+
+def process_export(path: str, output_dir: str, content_hash: str, as_of: date,
+                   engine: Optional[str] = None) -> ProcessedBoard:
+    """
+    Processa um export e grava o resultado na pasta de saída.
+
+    Executado nos processos do pool: carrega o JSON, valida, monta o índice
+    de movimentações (lendo as ações do arquivo em fluxo) e gera os relatórios
+    do board inteiro (o mesmo conjunto que o app usa para o cubo e os rollups).
+
+    Args:
+        path: Arquivo JSON exportado do Trello
+        output_dir: Pasta de saída
+        content_hash: Hash do conteúdo (gravado no manifesto)
+        as_of: Data de referência
+        engine: Motor de processamento (padrão: PROCESSING_ENGINE)
+
+    Returns:
+        Entrada do manifesto
+    """
+    from .actions import ListTransitionIndex
+    from .config import PROCESSING_ENGINE
+    from .data_processor import TrelloDataProcessor
+
+    started = time.perf_counter()
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+
+    processor = TrelloDataProcessor(engine=engine or PROCESSING_ENGINE, as_of=as_of)
+    is_valid, errors = processor.validate_trello_data(data)
+    if not is_valid:
+        raise ValueError('; '.join(errors))
+
+    task_reports, report_days = processor.generate_board_reports(
+        data, transitions=ListTransitionIndex.from_file(path)
+    )
+
+    source = os.path.basename(path)
+    output = f'{os.path.splitext(source)[0]}.pkl'
+    result = {
+        'data': data,
+        'as_of': as_of,
+        'task_reports': task_reports,
+        'report_days': report_days
+    }
+    _write_atomic(os.path.join(output_dir, output), pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+
+    return ProcessedBoard(
+        source=source,
+        content_hash=content_hash,
+        as_of=as_of.isoformat(),
+        board_name=data.get('name', ''),
+        cards=len(data.get('cards', [])),
+        task_reports=len(task_reports),
+        output=output,
+        processed_at=datetime.now().isoformat(timespec='seconds'),
+        seconds=round(time.perf_counter() - started, 3)
+    )
+
+class DropFolderWatcher:
+    """Monitora uma pasta de exports e processa os novos ou alterados."""
+
+    def __init__(self, folder: str, output_dir: str = WATCH_OUTPUT_DIR, workers: int = WATCH_WORKERS,
+                 debounce: float = WATCH_DEBOUNCE_SECONDS, engine: Optional[str] = None,
+                 as_of: Optional[date] = None, metrics_textfile: str = METRICS_TEXTFILE):
+        """
+        Args:
+            folder: Pasta onde os exports (*.json) são deixados
+            output_dir: Pasta de saída (resultados e manifesto)
+            workers: Processos no pool
+            debounce: Segundos sem mudança de tamanho/data antes de processar
+            engine: Motor de processamento
+            as_of: Data de referência fixa (padrão: hoje, a cada varredura)
+            metrics_textfile: Arquivo .prom regravado após cada lote processado ('' desliga)
+        """
+        self.folder = folder
+        self.output_dir = output_dir
+        self.workers = workers
+        self.debounce = debounce
+        self.engine = engine
+        self.as_of = as_of
+        self.metrics_textfile = metrics_textfile
+        os.makedirs(output_dir, exist_ok=True)
+
+        self.manifest = read_manifest(output_dir)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._stats: Dict[str, Tuple[int, int, float]] = {}
+        self._pending: Dict[str, Tuple[Future, str, date]] = {}
+
+    def _pool_instance(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _stable_files(self, now: float) -> List[str]:
+        """Exports cujo tamanho e data de modificação não mudam há pelo menos `debounce` segundos."""
+        stable = []
+        seen = set()
+        for entry in os.scandir(self.folder):
+            if not entry.is_file() or not entry.name.endswith('.json'):
+                continue
+            seen.add(entry.name)
+            stat = entry.stat()
+            previous = self._stats.get(entry.name)
+            if previous is None or previous[:2] != (stat.st_size, stat.st_mtime_ns):
+                self._stats[entry.name] = (stat.st_size, stat.st_mtime_ns, now)
+                if self.debounce > 0:
+                    continue
+            elif now - previous[2] < self.debounce:
+                continue
+            stable.append(entry.name)
+
+        for name in set(self._stats) - seen:
+            del self._stats[name]
+        return stable
+
+    def scan(self, now: Optional[float] = None) -> List[str]:
+        """
+        Uma varredura: agenda os exports prontos e alterados.
+
+        Returns:
+            Nomes dos exports enviados ao pool
+        """
+        now = time.monotonic() if now is None else now
+        as_of = self.as_of or date.today()
+        submitted = []
+
+        for name in self._stable_files(now):
+            if name in self._pending:
+                continue
+            path = os.path.join(self.folder, name)
+            content_hash = file_content_hash(path)
+            processed = self.manifest.get(name)
+            if processed and processed.content_hash == content_hash and processed.as_of == as_of.isoformat():
+                continue
+
+            future = self._pool_instance().submit(
+                process_export, path, self.output_dir, content_hash, as_of, self.engine
+            )
+            self._pending[name] = (future, content_hash, as_of)
+            submitted.append(name)
+            logger.info(f"📥 Export agendado: {name}")
+        return submitted
+
+    def collect(self, wait: bool = False) -> List[ProcessedBoard]:
+        """
+        Registra no manifesto os exports já processados.
+
+        Args:
+            wait: Aguarda todos os pendentes
+
+        Returns:
+            Entradas gravadas nesta chamada
+        """
+        finished = []
+        for name, (future, _, _) in list(self._pending.items()):
+            if not wait and not future.done():
+                continue
+            del self._pending[name]
+            try:
+                entry = future.result()
+            except Exception as e:
+                logger.error(f"❌ Falha ao processar {name}: {e}")
+                continue
+            self.manifest[name] = entry
+            finished.append(entry)
+            record_board('watch', entry.cards, entry.seconds)
+            logger.info(f"✅ {name}: {entry.task_reports} relatórios em {entry.seconds:.2f} s")
+
+        if finished:
+            write_manifest(self.manifest, self.output_dir)
+            if self.metrics_textfile:
+                write_textfile(self.metrics_textfile)
+        return finished
+
+    def run(self, poll_interval: float = WATCH_POLL_SECONDS, once: bool = False):
+        """
+        Varre a pasta continuamente (ou uma única vez, aguardando o processamento).
+
+        Args:
+            poll_interval: Segundos entre varreduras
+            once: Processa o que estiver pronto agora e retorna
+        """
+        try:
+            if once:
+                self.scan()
+                self.collect(wait=True)
+                return
+            while True:
+                self.scan()
+                self.collect()
+                time.sleep(poll_interval)
+        finally:
+            self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
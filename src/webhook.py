@@ -0,0 +1,296 @@
+"""
+Receptor de webhooks do Trello e gerador de carga.
+
+WebhookReceiver é um servidor HTTP da biblioteca padrão que aceita os
+payloads dos webhooks (POST com {"action": ..., "model": ...}), aplica cada
+ação a um LiveBoardModel e expõe os contadores atuais em GET /summary. O
+HEAD de verificação do Trello é respondido com 200 e, com o segredo do app
+configurado, a assinatura X-Trello-Webhook é conferida.
+
+replay_events dispara eventos contra um receptor por várias conexões
+keep-alive em paralelo; synthetic_events gera eventos plausíveis de um
+board (movimentações, membros, prazos e arquivamento) para testes de carga.
+"""
+
+import base64
+import hashlib
+import hmac
+import http.client
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Any, Optional
+from urllib.parse import urlsplit
+
+from .config import WEBHOOK_HOST, WEBHOOK_PORT, WEBHOOK_PATH
+from .live_board import LiveBoardModel
+
+def webhook_signature(secret: str, body: bytes, callback_url: str) -> str:
+    """Assinatura do Trello: base64(HMAC-SHA1(segredo, corpo + URL de callback))."""
+    digest = hmac.new(secret.encode('utf-8'), body + callback_url.encode('utf-8'), hashlib.sha1).digest()
+    return base64.b64encode(digest).decode('ascii')
+
+class WebhookReceiver:
+    """Servidor HTTP que aplica os webhooks do Trello a um LiveBoardModel."""
+
+    def __init__(self, model: LiveBoardModel, host: str = WEBHOOK_HOST, port: int = WEBHOOK_PORT,
+                 path: str = WEBHOOK_PATH, secret: Optional[str] = None, callback_url: Optional[str] = None):
+        """
+        Args:
+            model: Modelo atualizado pelos eventos
+            host: Endereço de escuta
+            port: Porta (0 escolhe uma livre)
+            path: Caminho dos webhooks
+            secret: Segredo do app do Trello (confere X-Trello-Webhook)
+            callback_url: URL registrada no webhook (entra na assinatura)
+        """
+        self.model = model
+        self.host = host
+        self.port = port
+        self.path = path
+        self.secret = secret
+        self.callback_url = callback_url or ''
+        self.received = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}{self.path}'
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    def handle_payload(self, body: bytes, signature: Optional[str] = None) -> int:
+        """
+        Processa o corpo de um webhook.
+
+        Returns:
+            Status HTTP da resposta
+        """
+        if self.secret and not hmac.compare_digest(
+            signature or '', webhook_signature(self.secret, body, self.callback_url)
+        ):
+            with self._lock:
+                self.rejected += 1
+            return 401
+        try:
+            action = json.loads(body)['action']
+        except (ValueError, KeyError, TypeError):
+            with self._lock:
+                self.rejected += 1
+            return 400
+
+        self.model.apply_action(action)
+        with self._lock:
+            self.received += 1
+        return 200
+
+    def _handler(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _reply(self, status: int, payload: Any = None):
+                body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if body and self.command != 'HEAD':
+                    self.wfile.write(body)
+
+            def do_HEAD(self):
+                # Verificação feita pelo Trello ao registrar o webhook
+                self._reply(200)
+
+            def do_GET(self):
+                if urlsplit(self.path).path == '/summary':
+                    self._reply(200, receiver.model.snapshot())
+                else:
+                    self._reply(200 if urlsplit(self.path).path == receiver.path else 404)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                if urlsplit(self.path).path != receiver.path:
+                    self._reply(404)
+                    return
+                self._reply(receiver.handle_payload(body, self.headers.get('X-Trello-Webhook')))
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> 'WebhookReceiver':
+        """Sobe o servidor em uma thread em segundo plano."""
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'WebhookReceiver':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+_shared_receivers: Dict[int, WebhookReceiver] = {}
+_shared_lock = threading.Lock()
+
+def shared_receiver(port: int = WEBHOOK_PORT) -> Optional[WebhookReceiver]:
+    """Receptor em execução no processo nesta porta (compartilhado entre as sessões do app)."""
+    with _shared_lock:
+        return _shared_receivers.get(port)
+
+def start_shared_receiver(model: LiveBoardModel, port: int = WEBHOOK_PORT, **options) -> WebhookReceiver:
+    """Sobe (ou substitui) o receptor do processo nesta porta."""
+    with _shared_lock:
+        previous = _shared_receivers.pop(port, None)
+        if previous is not None:
+            previous.stop()
+        receiver = WebhookReceiver(model, port=port, **options).start()
+        _shared_receivers[port] = receiver
+        return receiver
+
+@dataclass
+class ReplayStats:
+    """Resultado de um disparo de eventos."""
+    events: int
+    errors: int
+    seconds: float
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.seconds if self.seconds else 0.0
+
+def replay_events(url: str, events: Iterable[Dict[str, Any]], connections: int = 8,
+                  secret: Optional[str] = None, callback_url: Optional[str] = None) -> ReplayStats:
+    """
+    Dispara ações contra um receptor, como payloads de webhook.
+
+    A ordem é preservada por card (cada card vai sempre para a mesma
+    conexão); cards diferentes são enviados em paralelo.
+
+    Args:
+        url: URL do receptor (ex.: WebhookReceiver.url)
+        events: Ações do Trello
+        connections: Conexões keep-alive em paralelo
+        secret: Segredo para assinar os payloads
+        callback_url: URL usada na assinatura (padrão: url)
+
+    Returns:
+        ReplayStats
+    """
+    parts = urlsplit(url)
+    lanes: List[List[bytes]] = [[] for _ in range(connections)]
+    for action in events:
+        card_id = ((action.get('data') or {}).get('card') or {}).get('id', '')
+        lanes[hash(card_id) % connections].append(json.dumps({'action': action}).encode('utf-8'))
+
+    def send(bodies: List[bytes]) -> int:
+        connection = http.client.HTTPConnection(parts.hostname, parts.port)
+        errors = 0
+        try:
+            for body in bodies:
+                headers = {'Content-Type': 'application/json'}
+                if secret:
+                    headers['X-Trello-Webhook'] = webhook_signature(secret, body, callback_url or url)
+                connection.request('POST', parts.path, body, headers)
+                response = connection.getresponse()
+                response.read()
+                errors += response.status != 200
+        finally:
+            connection.close()
+        return errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=connections) as pool:
+        errors = sum(pool.map(send, lanes))
+    return ReplayStats(
+        events=sum(len(lane) for lane in lanes),
+        errors=errors,
+        seconds=time.perf_counter() - started
+    )
+
+def synthetic_events(data: Dict[str, Any], count: int, seed: int = 0,
+                     start: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Gera ações plausíveis sobre os cards de um board.
+
+    O estado dos cards é acompanhado durante a geração, então cada ação é
+    consistente com as anteriores (listBefore, old, membros atuais).
+
+    Args:
+        data: Dados do Trello
+        count: Número de ações
+        seed: Semente do gerador aleatório
+        start: Instante da primeira ação (padrão: agora)
+
+    Returns:
+        Ações em ordem cronológica
+    """
+    rng = random.Random(seed)
+    moment = start or datetime.now(timezone.utc)
+    lists = data.get('lists', [])
+    member_ids = [member['id'] for member in data.get('members', [])]
+    cards = {card['id']: dict(card, idMembers=list(card.get('idMembers', []))) for card in data.get('cards', [])}
+    card_ids = list(cards)
+    lists_by_id = {lista['id']: lista for lista in lists}
+
+    events = []
+    for i in range(count):
+        moment += timedelta(seconds=rng.randint(1, 60))
+        card = cards[rng.choice(card_ids)]
+        kind = rng.choices(['move', 'member', 'due', 'closed'], weights=[5, 2, 2, 1])[0]
+        action = {'id': f'{int(moment.timestamp()):08x}{i:016x}', 'date': moment.strftime('%Y-%m-%dT%H:%M:%S.000Z')}
+
+        if kind == 'move' and lists:
+            after = rng.choice(lists)
+            before = lists_by_id.get(card['idList'], {'id': card['idList'], 'name': ''})
+            action.update(type='updateCard', data={
+                'card': {'id': card['id'], 'name': card.get('name', ''), 'idList': after['id']},
+                'old': {'idList': card['idList']},
+                'listBefore': {'id': before['id'], 'name': before['name']},
+                'listAfter': {'id': after['id'], 'name': after['name']}
+            })
+            card['idList'] = after['id']
+        elif kind == 'member' and member_ids:
+            member_id = rng.choice(member_ids)
+            removing = member_id in card['idMembers']
+            action.update(
+                type='removeMemberFromCard' if removing else 'addMemberToCard',
+                data={'card': {'id': card['id'], 'name': card.get('name', '')}, 'idMember': member_id}
+            )
+            card['idMembers'] = [m for m in card['idMembers'] if m != member_id] + ([] if removing else [member_id])
+        elif kind == 'due':
+            due = (moment + timedelta(days=rng.randint(-30, 30))).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+            action.update(type='updateCard', data={
+                'card': {'id': card['id'], 'name': card.get('name', ''), 'due': due},
+                'old': {'due': card.get('due')}
+            })
+            card['due'] = due
+        else:
+            closed = not card.get('closed', False)
+            action.update(type='updateCard', data={
+                'card': {'id': card['id'], 'name': card.get('name', ''), 'closed': closed},
+                'old': {'closed': not closed}
+            })
+            card['closed'] = closed
+        events.append(action)
+    return events
@@ -0,0 +1,110 @@
+"""
+Relatórios de vários períodos em uma única passada.
+
+Status e atrasos de um card dependem apenas do card e da data de referência;
+o período só decide quais cards entram no relatório. Por isso os cards são
+ordenados uma vez pela data de filtro, cada período é localizado com busca
+binária sobre essa ordem e os relatórios de cada card são gerados uma única
+vez, mesmo que ele caia em vários períodos.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .board_index import BoardIndex
+from .data_processor import TaskReport, CollaboratorReport, ReportSummary
+
+@dataclass
+class WindowReport:
+    """Relatórios de um período."""
+    start_date: date
+    end_date: date
+    task_reports: List[TaskReport]
+    summary: ReportSummary
+    collaborator_reports: Optional[List[CollaboratorReport]] = None
+
+def weekly_windows(end_date: date, weeks: int = 52) -> List[Tuple[date, date]]:
+    """
+    Períodos consecutivos de 7 dias terminando em end_date (do mais antigo ao mais recente).
+
+    Args:
+        end_date: Último dia do período mais recente
+        weeks: Número de semanas
+
+    Returns:
+        Lista de (início, fim)
+    """
+    return [
+        (end_date - timedelta(days=7 * week + 6), end_date - timedelta(days=7 * week))
+        for week in reversed(range(weeks))
+    ]
+
+def generate_window_reports(processor, data: Dict[str, Any], windows: Sequence[Tuple[date, date]],
+                            as_of: Optional[date] = None, transitions=None,
+                            include_collaborators: bool = False,
+                            index: Optional[BoardIndex] = None,
+                            task_filter: Optional[Callable[[TaskReport], bool]] = None) -> List[WindowReport]:
+    """
+    Gera os relatórios de todos os períodos de uma vez.
+
+    Os relatórios de cada período são iguais aos de
+    processor.generate_task_reports(data, início, fim, as_of) - inclusive na
+    ordem. Um card presente em vários períodos compartilha as mesmas
+    instâncias de TaskReport entre eles.
+
+    Args:
+        processor: TrelloDataProcessor (motor dos relatórios por card, resumos e etapas finais)
+        data: Dados do Trello
+        windows: Lista de (início, fim), datas inclusivas
+        as_of: Data de referência para atrasos
+        transitions: Índice de movimentações (ver generate_task_reports)
+        include_collaborators: Também gera os relatórios por colaborador
+        index: Índice do board (evita reconstruir)
+        task_filter: Filtro aplicado aos relatórios antes dos resumos (ex.: grupos selecionados)
+
+    Returns:
+        Um WindowReport por período, na ordem recebida
+    """
+    as_of = processor.get_reference_date(as_of)
+    index = index or BoardIndex.from_data(data)
+
+    # Cards ordenados pela data usada no filtro de período
+    dated = [(period_date.toordinal(), position)
+             for position, period_date in enumerate(index.period_dates) if period_date is not None]
+    dated.sort()
+    ordinals = np.array([ordinal for ordinal, _ in dated], dtype=np.int64)
+    sorted_positions = np.array([position for _, position in dated], dtype=np.int64)
+
+    window_positions = []
+    for start_date, end_date in windows:
+        lo = np.searchsorted(ordinals, start_date.toordinal(), side='left')
+        hi = np.searchsorted(ordinals, end_date.toordinal(), side='right')
+        # A ordem dos relatórios segue a ordem original dos cards no board
+        window_positions.append(np.sort(sorted_positions[lo:hi]))
+
+    # Relatórios de cada card gerados uma única vez
+    needed = np.unique(np.concatenate(window_positions)) if window_positions else np.array([], dtype=np.int64)
+    card_reports: Dict[int, List[TaskReport]] = {}
+    all_reports = []
+    for position in needed.tolist():
+        card_reports[position] = processor.card_reports(data, index, position, as_of)
+        all_reports.extend(card_reports[position])
+    processor.finalize_task_reports(all_reports, data, as_of, transitions)
+
+    results = []
+    for (start_date, end_date), positions in zip(windows, window_positions):
+        task_reports = [report for position in positions.tolist() for report in card_reports[position]]
+        if task_filter is not None:
+            task_reports = [report for report in task_reports if task_filter(report)]
+        results.append(WindowReport(
+            start_date=start_date,
+            end_date=end_date,
+            task_reports=task_reports,
+            summary=processor.generate_report_summary(task_reports),
+            collaborator_reports=processor.generate_collaborator_reports(task_reports) if include_collaborators else None
+        ))
+
+    return results
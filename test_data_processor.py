@@ -0,0 +1,679 @@
+#!/usr/bin/env python3
+from datetime import date
+
+import pytest
+
+from src.data_processor import TrelloDataProcessor
+from src.parity import generate_board
+
+def test_as_of_makes_reports_reproducible():
+    data = generate_board(200, seed=3, reference_date=date(2024, 6, 1))
+    as_of = date(2024, 6, 1)
+
+    first = TrelloDataProcessor(as_of=as_of).generate_task_reports(data, date(2024, 1, 1), date(2024, 12, 31))
+    second = TrelloDataProcessor().generate_task_reports(data, date(2024, 1, 1), date(2024, 12, 31), as_of=as_of)
+    assert first == second
+
+    later = TrelloDataProcessor().generate_task_reports(data, date(2024, 1, 1), date(2024, 12, 31), as_of=date(2024, 6, 11))
+    # Concluídas com data real de conclusão não acumulam atraso
+    late_before = {(r.task_id, r.collaborator_name): r.days_late for r in first if r.days_late > 0 and r.status != 'Concluída'}
+    late_after = {(r.task_id, r.collaborator_name): r.days_late for r in later}
+    assert late_before
+    assert all(late_after[key] == days + 10 for key, days in late_before.items())
+
+def test_business_days_late_skips_weekends_and_holidays():
+    from src.business_days import business_days_late
+    import numpy as np
+
+    # Segunda-feira 10/03/2025, logo após o Carnaval (03 e 04/03)
+    result = business_days_late(np.array([0, 1, 3, 7]), np.datetime64('2025-03-10'))
+    assert result.tolist() == [0, 1, 1, 4]
+
+    data = generate_board(200, seed=4, reference_date=date(2025, 3, 10))
+    reports = TrelloDataProcessor(as_of=date(2025, 3, 10)).generate_task_reports(data, date(2024, 1, 1), date(2025, 12, 31))
+    assert all(0 <= r.business_days_late <= r.days_late for r in reports)
+    assert any(0 < r.business_days_late < r.days_late for r in reports)
+
+def test_created_at_is_decoded_from_card_ids():
+    from src.board_index import BoardIndex, decode_object_id_timestamps
+    from src.aging import aging_histogram
+
+    stamps = decode_object_id_timestamps(['64a1b2c3d4e5f6789012345a', 'card1', None])
+    assert str(stamps[0]) == '2023-07-02T17:24:19'
+    assert all(str(s) == 'NaT' for s in stamps[1:])
+
+    data = generate_board(300, seed=5, reference_date=date(2025, 1, 1))
+    reports = TrelloDataProcessor(as_of=date(2025, 1, 1)).generate_task_reports(data, date(2024, 1, 1), date(2025, 12, 31))
+    cards = {card['id']: card for card in data['cards']}
+    for report in reports:
+        if report.task_id.startswith('card'):
+            assert report.created_at == cards[report.task_id]['dateLastActivity']
+        else:
+            assert report.created_at.endswith('.000Z') and report.created_at < '2025-01-02'
+
+    index = BoardIndex.from_data(data)
+    created = index.cards_created_between(date(2024, 12, 1), date(2024, 12, 31))
+    assert all('2024-12-01' <= str(index.created_at[p]) < '2025-01-01' for p in created)
+
+    histogram = aging_histogram(index, date(2025, 1, 1), by='grupo', start_date=date(2024, 12, 1))
+    assert histogram.columns[-1] == '> 90 dias'
+    assert histogram['> 90 dias'].sum() == 0
+
+def test_completion_dates_come_from_the_actions_log(tmp_path):
+    import json
+    from src.actions import ListTransitionIndex
+
+    data = generate_board(300, seed=6, reference_date=date(2024, 6, 1))
+    path = tmp_path / 'board.json'
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+    index = ListTransitionIndex.from_file(str(path))
+    assert len(index) == len(ListTransitionIndex.from_data(data)) > 0
+    card_id = data['actions'][-1]['data']['card']['id']
+    moments = [moment for moment, _ in index.transitions(card_id)]
+    assert moments == sorted(moments)
+
+    as_of = date(2024, 6, 1)
+    reports = TrelloDataProcessor(as_of=as_of).generate_task_reports(
+        data, date(2024, 1, 1), date(2024, 12, 31), transitions=index)
+    without_actions = TrelloDataProcessor(as_of=as_of).generate_task_reports(
+        {k: v for k, v in data.items() if k != 'actions'}, date(2024, 1, 1), date(2024, 12, 31))
+    completions = index.completion_times(data['lists'])
+
+    completed = 0
+    for report, baseline in zip(reports, without_actions):
+        if report.status == 'Concluída' and report.task_id in completions and 'FEITO' in report.list_name.upper():
+            completed += 1
+            assert report.completed_at.startswith(completions[report.task_id].strftime('%Y-%m-%dT%H:%M:%S'))
+            assert report.days_late <= baseline.days_late
+        else:
+            assert report == baseline
+    assert completed
+
+def test_transition_index_skips_malformed_action_dates():
+    from src.actions import ListTransitionIndex
+
+    data = generate_board(50, seed=6, reference_date=date(2024, 6, 1))
+    actions = [dict(action) for action in data['actions']]
+    expected = ListTransitionIndex.from_actions(actions)
+    broken = dict(actions[0], date='not-a-date')
+    index = ListTransitionIndex.from_actions([broken] + actions[1:])
+
+    card_id = broken['data']['card']['id']
+    assert len(index) == len(expected) - 1
+    assert len(index.transitions(card_id)) == len(expected.transitions(card_id)) - 1
+
+def test_stage_cycle_times_from_card_moves():
+    from src.actions import ListTransitionIndex
+    from src.board_index import BoardIndex
+    from src.cycle_time import stage_cycle_times, FULL_CYCLE_STAGE
+
+    lists = [{'id': 'conteudo', 'name': 'EM PROCESSO DE CONTEÚDO'},
+             {'id': 'montagem', 'name': 'EM PROCESSO DE MONTAGEM'},
+             {'id': 'feito', 'name': 'FEITO'}]
+    data = {
+        'lists': lists,
+        'members': [{'id': 'm1', 'username': 'jamillyfreitass', 'fullName': 'Jamily'}],
+        'cards': [{'id': f'c{i}', 'name': f'Tarefa {i}', 'idList': 'feito', 'idMembers': ['m1']} for i in range(2)],
+        'actions': []
+    }
+    for i, (to_montagem, to_feito) in enumerate([(4, 10), (2, 4)]):
+        path = [(1, lists[0]), (1 + to_montagem, lists[1]), (1 + to_feito, lists[2])]
+        for (day, target), previous in zip(path, [None] + [l for _, l in path]):
+            data['actions'].append({
+                'type': 'updateCard' if previous else 'createCard',
+                'date': f'2024-03-{day:02d}T12:00:00.000Z',
+                'data': {'card': {'id': f'c{i}'}, 'listAfter' if previous else 'list': target,
+                         **({'listBefore': previous} if previous else {})}
+            })
+
+    results = stage_cycle_times(ListTransitionIndex.from_data(data), BoardIndex.from_data(data), date(2024, 4, 1))
+    by_stage = {r.etapa: r for r in results if r.grupo == 'Grupo 1'}
+    assert by_stage['EM PROCESSO DE CONTEÚDO'].p50_days == 3.0
+    assert by_stage['EM PROCESSO DE MONTAGEM'].p90_days == 5.6
+    assert by_stage[FULL_CYCLE_STAGE].cards == 2 and by_stage[FULL_CYCLE_STAGE].p50_days == 7.0
+    assert all(r.grupo == 'Grupo 1' for r in results)
+
+def test_rollup_store_matches_generated_reports():
+    from collections import Counter
+    from src.rollups import RollupStore
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(400, seed=7, reference_date=as_of)
+    processor = TrelloDataProcessor(as_of=as_of)
+    store = RollupStore.from_reports(*processor.generate_board_reports(data), as_of)
+
+    for start, end in [(date(2024, 3, 1), date(2024, 5, 15)), (date(2024, 5, 20), date(2024, 7, 1))]:
+        reports = processor.generate_task_reports(data, start, end)
+        expected = Counter((r.grupo or 'Sem Grupo', r.status) for r in reports)
+        totals = store.totals(start, end)
+        assert {key: count for key, count in totals.items() if count} == dict(expected)
+
+        for granularity in ['day', 'week', 'month']:
+            series = store.series(start, end, by=['grupo'], granularity=granularity)
+            assert series.index[0] == start
+            assert series.values.sum() == len(reports)
+
+    assert [d.weekday() for d in store.bucket_starts(date(2024, 5, 1), date(2024, 5, 31), 'week')[1:]] == [0] * 4
+
+def test_olap_cube_summaries_match_filtered_reports():
+    from collections import Counter
+    from src.cube import OlapCube
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(400, seed=9, reference_date=as_of)
+    processor = TrelloDataProcessor(as_of=as_of)
+    cube = OlapCube.from_reports(*processor.generate_board_reports(data))
+
+    for start, end in [(date(2024, 3, 1), date(2024, 5, 15)), (date(2024, 5, 20), date(2024, 7, 1))]:
+        reports = processor.generate_task_reports(data, start, end)
+        for grupos in [None, ['Grupo 1', 'Sem Grupo'], ['Grupo 4', 'Grupo 2'], []]:
+            selected = reports if grupos is None else [r for r in reports if (r.grupo or 'Sem Grupo') in grupos]
+            assert cube.summary(start, end, grupos) == processor.generate_report_summary(selected)
+
+            by_status = cube.rollup(['status'], start, end, grupos)
+            assert dict(zip(by_status['status'], by_status['tasks'])) == dict(Counter(r.status for r in selected))
+
+def test_burnup_series_accumulates_scope_and_completions():
+    import numpy as np
+    from src.actions import ListTransitionIndex
+    from src.board_index import BoardIndex
+    from src.burnup import burnup_series, card_completion_days
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(500, seed=8, reference_date=as_of)
+    index = BoardIndex.from_data(data)
+    transitions = ListTransitionIndex.from_data(data)
+    burnup = burnup_series(index, date(2024, 3, 1), as_of, transitions, as_of)
+
+    completed = card_completion_days(index, transitions, as_of)
+    for grupo, series in burnup.groupby('grupo'):
+        assert (np.diff(series['total']) >= 0).all() and (np.diff(series['concluidas']) >= 0).all()
+        positions = [p for p, card in enumerate(index.cards)
+                     if not card.get('closed') and grupo in index.card_group_names(card)]
+        assert series['total'].iloc[-1] == len(positions)
+        assert series['concluidas'].iloc[-1] == int((~np.isnat(completed[positions])).sum())
+
+def test_period_comparison_deltas():
+    from src.comparison import previous_period, group_deltas, collaborator_deltas, metric_deltas
+
+    assert previous_period(date(2024, 5, 1), date(2024, 5, 31)) == (date(2024, 3, 31), date(2024, 4, 30))
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(400, seed=9, reference_date=as_of)
+    processor = TrelloDataProcessor(as_of=as_of)
+    windows = [(date(2024, 5, 2), as_of), previous_period(date(2024, 5, 2), as_of)]
+    current, previous = processor.generate_window_reports(
+        data, windows, include_collaborators=True, task_filter=lambda r: r.grupo is not None
+    )
+    assert all(r.grupo is not None for r in current.task_reports + previous.task_reports)
+
+    deltas = metric_deltas(current.summary, previous.summary)
+    assert deltas['total_tasks'].delta == current.summary.total_tasks - previous.summary.total_tasks
+    assert 'group_summaries' not in deltas
+
+    groups = group_deltas(current.summary, previous.summary)
+    late = groups[groups['metrica'] == 'late_deliveries'].set_index('grupo')
+    for summary in current.summary.group_summaries:
+        assert late.loc[summary.grupo, 'atual'] == summary.late_deliveries
+
+    collaborators = collaborator_deltas(current.collaborator_reports, [])
+    totals = collaborators[collaborators['metrica'] == 'total_tasks']
+    assert (totals['anterior'] == 0).all() and (totals['delta'] == totals['atual']).all()
+
+def test_history_store_round_trips_snapshots():
+    from src.history_store import HistoryStore, board_id_of
+
+    data = generate_board(300, seed=10, reference_date=date(2024, 6, 1))
+    processor = TrelloDataProcessor()
+
+    with HistoryStore(':memory:') as store:
+        first = store.save_snapshot(data, processor, as_of=date(2024, 6, 1))
+        second = store.save_snapshot(data, processor, as_of=date(2024, 6, 8))
+        assert store.save_snapshot(data, processor, as_of=date(2024, 6, 8)) == second
+
+        board_id = board_id_of(data)
+        assert list(store.snapshots(board_id)['snapshot_date']) == ['2024-06-01', '2024-06-08']
+
+        reports = processor.generate_task_reports(data, date(2000, 1, 1), date(2100, 12, 31), as_of=date(2024, 6, 1))
+        assert store.load_task_reports(first) == reports
+
+        late = store.task_rows(board_id, end_date=date(2024, 6, 1), status=['Atrasada'], grupos=['Sem Grupo'])
+        assert len(late) == len([r for r in reports if r.status == 'Atrasada' and r.grupo is None])
+
+        summary = processor.generate_report_summary(reports)
+        counts = store.status_counts(board_id).loc['2024-06-01']
+        assert counts.sum() == summary.total_tasks
+        assert counts['Atrasada'] == summary.late_tasks and counts['Concluída'] == summary.completed_tasks
+
+def test_snapshot_diff_reports_changes_in_our_statuses():
+    import copy
+    from src.snapshot_diff import diff_snapshots
+
+    as_of = date(2024, 6, 1)
+    previous = generate_board(200, seed=11, reference_date=as_of)
+    processor = TrelloDataProcessor()
+    current = copy.deepcopy(previous)
+
+    removed = current['cards'].pop(0)
+    moved = current['cards'][0]
+    done_list = next(l for l in current['lists'] if l['name'] == 'FEITO')
+    moved['idList'] = done_list['id']
+    current['cards'].append(dict(current['cards'][1], id='novo', name='Novo card'))
+
+    diff = diff_snapshots(previous, current, processor, previous_as_of=as_of, current_as_of=as_of)
+    assert [c.card_id for c in diff.by_kind('removido')] == [removed['id']]
+    assert [c.card_id for c in diff.by_kind('adicionado')] == ['novo']
+    assert [(c.card_id, c.after) for c in diff.by_kind('movido')] == [(moved['id'], 'FEITO')]
+
+    statuses = processor.get_card_statuses(previous, as_of)
+    expected_status = [] if statuses[moved['id']] == 'Concluída' else [(moved['id'], 'Concluída')]
+    assert [(c.card_id, c.after) for c in diff.by_kind('status')] == expected_status
+    assert diff.unchanged_cards == len(previous['cards']) - 2
+
+    assert statuses == {
+        card['id']: processor.get_task_status(card, previous['lists'], previous['members'], as_of)
+        for card in previous['cards']
+    }
+
+def test_card_cache_reclassifies_only_changed_cards(monkeypatch):
+    import copy
+    from src.card_cache import CardReportCache
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(300, seed=12, reference_date=as_of)
+    processor = TrelloDataProcessor(as_of=as_of)
+    cache = CardReportCache()
+    start, end = date(2024, 1, 1), date(2024, 12, 31)
+
+    assert processor.generate_task_reports(data, start, end, card_cache=cache) == \
+        processor.generate_task_reports(data, start, end)
+    cached_cards = len(cache)
+
+    changed = copy.deepcopy(data)
+    changed['cards'][0]['idList'] = next(l['id'] for l in changed['lists'] if l['name'] == 'FEITO')
+    misses = cache.misses
+    reports = processor.generate_task_reports(changed, start, end, card_cache=cache)
+    assert reports == processor.generate_task_reports(changed, start, end)
+    assert cache.misses - misses <= 1 and cache.hits >= cached_cards - 1
+
+    small = CardReportCache(max_cards=10)
+    processor.generate_task_reports(data, start, end, card_cache=small)
+    assert len(small) == 10 and small.evictions == cached_cards - 10
+
+    # O cache usa o motor configurado: com o de referência, o motor indexado não é chamado
+    def indexed_card_reports(*args):
+        raise AssertionError('motor indexado usado com PROCESSING_ENGINE de referência')
+    monkeypatch.setattr('src.engines.IndexedEngine.card_reports', indexed_card_reports)
+    assert processor.generate_task_reports(data, start, end, card_cache=CardReportCache()) == \
+        processor.generate_task_reports(data, start, end)
+    indexed = TrelloDataProcessor(engine='indexed', as_of=as_of)
+    with pytest.raises(AssertionError):
+        indexed.generate_task_reports(data, start, end, card_cache=CardReportCache())
+
+def test_watcher_reprocesses_only_changed_exports(tmp_path):
+    import json
+    from src.actions import ListTransitionIndex
+    from src.watcher import DropFolderWatcher, read_manifest, load_processed_board
+
+    as_of = date(2024, 6, 1)
+    folder, output = tmp_path / 'exports', tmp_path / 'processed'
+    folder.mkdir()
+    boards = {name: generate_board(100, seed=seed, reference_date=as_of) for seed, name in enumerate(['a', 'b'])}
+    for name, data in boards.items():
+        (folder / f'{name}.json').write_text(json.dumps(data))
+
+    watcher = DropFolderWatcher(str(folder), str(output), workers=1, debounce=5, as_of=as_of)
+    assert watcher.scan(now=0) == []
+    assert sorted(watcher.scan(now=10)) == ['a.json', 'b.json']
+    watcher.collect(wait=True)
+    assert watcher.scan(now=20) == []
+
+    boards['b']['cards'].pop()
+    (folder / 'b.json').write_text(json.dumps(boards['b']))
+    assert watcher.scan(now=30) == [] and watcher.scan(now=40) == ['b.json']
+    watcher.collect(wait=True)
+    watcher.close()
+
+    manifest = read_manifest(str(output))
+    result = load_processed_board(manifest['b.json'], str(output))
+    assert result['data'] == boards['b'] and manifest['b.json'].cards == 99
+    processor = TrelloDataProcessor(as_of=as_of)
+    assert result['task_reports'] == processor.generate_task_reports(
+        boards['b'], date(2000, 1, 1), date(2100, 12, 31), transitions=ListTransitionIndex.from_data(boards['b'])
+    )
+    assert DropFolderWatcher(str(folder), str(output), debounce=0, as_of=as_of).scan() == []
+
+def test_trello_client_fetches_paginated_board_from_replay_server():
+    import asyncio
+    from src.trello_api import ACTION_TYPES, RateLimiter, TrelloClient, request_key
+    from trello_replay import ReplayServer
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(300, seed=13, reference_date=as_of)
+    for i, action in enumerate(data['actions']):
+        action['id'] = f'action{len(data["actions"]) - i:06d}'
+
+    assert TrelloClient(base_url='https://api.trello.com/1').host_header == 'api.trello.com'
+    assert TrelloClient(base_url='http://127.0.0.1:8080/1').host_header == '127.0.0.1:8080'
+
+    base = '/boards/b1'
+    responses = {
+        request_key(base, {'fields': 'id,name,desc,url,dateLastActivity'}): {'id': 'b1', 'name': data['name']},
+        request_key(f'{base}/cards', {'filter': 'all'}): data['cards'],
+        request_key(f'{base}/lists', {'filter': 'all'}): data['lists'],
+        request_key(f'{base}/members', {'fields': 'id,username,fullName'}): data['members'],
+    }
+    before = None
+    for start in range(0, len(data['actions']) + 1, 100):
+        params = {'filter': ','.join(ACTION_TYPES), 'limit': 100}
+        if before:
+            params['before'] = before
+        page = data['actions'][start:start + 100]
+        responses[request_key(f'{base}/actions', params)] = page
+        before = page[-1]['id'] if page else None
+    cards_key = request_key(f'{base}/cards', {'filter': 'all'})
+
+    async def fetch(url):
+        async with TrelloClient('k', 't', base_url=url, max_connections=2, backoff=0, page_size=100,
+                                rate_limiter=RateLimiter(1000, 1)) as client:
+            return client, await client.fetch_board('b1')
+
+    with ReplayServer(responses, failures={cards_key: [429, 500]}) as server:
+        client, fetched = asyncio.run(fetch(server.url))
+
+    assert fetched.data['actions'] == data['actions'] and fetched.data['cards'] == data['cards']
+    assert client.retries == 2 and server.requests.count(cards_key) == 3
+    assert client.connections_opened == server.connections <= 2 < fetched.requests
+    assert len(fetched.index.cards) == len(data['cards']) and len(fetched.transitions) > 0
+
+    processor = TrelloDataProcessor(as_of=as_of)
+    assert processor.generate_task_reports(fetched.data, date(2024, 1, 1), date(2024, 12, 31)) == \
+        processor.generate_task_reports(data, date(2024, 1, 1), date(2024, 12, 31))
+
+def test_incremental_sync_applies_only_new_actions(tmp_path):
+    import copy
+    from src.sync import BoardSync, sync_board
+    from src.trello_api import RateLimiter
+    from trello_replay import BoardServer
+
+    as_of = date(2024, 6, 1)
+    board = generate_board(300, seed=14, reference_date=as_of)
+    for i, action in enumerate(board['actions']):
+        action['id'] = f'a{len(board["actions"]) - i:06d}'
+    options = dict(backoff=0, rate_limiter=RateLimiter(1000, 1), state_dir=str(tmp_path))
+
+    with BoardServer({'b1': board}) as server:
+        board_sync, result = sync_board('b1', base_url=server.url, **options)
+        assert result.full and len(board_sync.data['cards']) == 300
+
+        moved, due, archived, deleted = board['cards'][:4]
+        done = next(l for l in board['lists'] if l['name'] == 'FEITO')
+        new_card = dict(copy.deepcopy(board['cards'][5]), id='novo', name='Card novo')
+        events = [
+            ('updateCard', {'card': {'id': moved['id'], 'idList': done['id']},
+                            'old': {'idList': moved['idList']}, 'listAfter': done}),
+            ('updateCard', {'card': {'id': due['id'], 'due': '2024-07-01T12:00:00.000Z'}, 'old': {'due': due['due']}}),
+            ('updateCard', {'card': {'id': archived['id'], 'closed': True}, 'old': {'closed': False}}),
+            ('addMemberToCard', {'card': {'id': due['id']}, 'idMember': 'member-extra0'}),
+            ('deleteCard', {'card': {'id': deleted['id']}}),
+            ('createCard', {'card': {'id': 'novo'}, 'list': done}),
+        ]
+        moved['idList'] = done['id']
+        due['due'] = '2024-07-01T12:00:00.000Z'
+        due['idMembers'] = [m for m in due['idMembers'] if m != 'member-extra0'] + ['member-extra0']
+        archived['closed'] = True
+        for card in (moved, due, archived):
+            card['dateLastActivity'] = max(card['dateLastActivity'] or '', '2024-06-01T10:00:00.000Z')
+        board['cards'].remove(deleted)
+        board['cards'].append(new_card)
+        for i, (action_type, data) in enumerate(events):
+            board['actions'].insert(0, {'id': f'b{i:06d}', 'type': action_type, 'date': '2024-06-01T10:00:00.000Z', 'data': data})
+
+        board_sync, result = sync_board('b1', base_url=server.url, **options)
+        assert not result.full and result.actions == len(events) and result.requests == 2
+        assert result.removed_cards == [deleted['id']]
+        assert result.changed_cards == [moved['id'], due['id'], archived['id'], 'novo']
+
+        synced = {card['id']: card for card in board_sync.data['cards']}
+        assert synced == {card['id']: card for card in board['cards']}
+
+        reloaded = BoardSync('b1', str(tmp_path))
+        assert reloaded.cursor.action_id == f'b{len(events) - 1:06d}'
+        _, result = sync_board('b1', base_url=server.url, board_sync=reloaded, **options)
+        assert result.actions == 0 and result.requests == 1
+
+    processor = TrelloDataProcessor(as_of=as_of)
+    start, end = date(2024, 1, 1), date(2024, 12, 31)
+    assert processor.generate_task_reports(reloaded.data, start, end) == processor.generate_task_reports(board, start, end)
+
+def test_webhook_events_keep_live_counters_consistent():
+    from datetime import datetime, timezone
+    from src.actions import ListTransitionIndex
+    from src.live_board import LiveBoardModel
+    from src.webhook import WebhookReceiver, replay_events, synthetic_events
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(300, seed=15, reference_date=as_of)
+    processor = TrelloDataProcessor(as_of=as_of)
+    model = LiveBoardModel(data, processor, as_of=as_of)
+    events = synthetic_events(data, 597, seed=15, start=datetime(2024, 5, 1, tzinfo=timezone.utc))
+    done = next(l for l in data['lists'] if l['name'] == 'FEITO')
+    events += [
+        {'id': 'x1', 'type': 'createCard', 'date': '2024-05-20T10:00:00.000Z',
+         'data': {'card': {'id': 'novo', 'name': 'Card novo'}, 'list': done}},
+        {'id': 'x2', 'type': 'deleteCard', 'date': '2024-05-20T10:00:00.000Z', 'data': {'card': {'id': data['cards'][1]['id']}}},
+        {'id': 'x3', 'type': 'updateList', 'date': '2024-05-20T10:00:00.000Z',
+         'data': {'list': {'id': data['lists'][0]['id'], 'name': 'Tarefas Bloqueadas'}, 'old': {'name': data['lists'][0]['name']}}},
+    ]
+
+    for action in events[:300]:
+        model.apply_action(action)
+    with WebhookReceiver(model, port=0, secret='segredo', callback_url='https://exemplo/webhook') as receiver:
+        stats = replay_events(receiver.url, events[300:], connections=4,
+                              secret='segredo', callback_url='https://exemplo/webhook')
+        assert replay_events(receiver.url, events[:1], connections=1, secret='errado').errors == 1
+    assert stats.errors == 0 and receiver.received == 300 and model.events == 600
+
+    current = dict(model.board.data, actions=list(reversed(events)) + data['actions'])
+    reports = processor.generate_task_reports(
+        current, date(2000, 1, 1), date(2100, 12, 31), transitions=ListTransitionIndex.from_data(current)
+    )
+    assert model.task_reports() == reports
+
+    summary = processor.generate_report_summary(reports)
+    snapshot = model.snapshot()
+    assert model.summary() == summary and model.verify() == []
+    assert snapshot['tasks'] == summary.total_tasks
+    assert snapshot['status'].get('Atrasada', 0) == summary.late_tasks
+    assert set(snapshot['collaborators']) == {c.collaborator_name for c in processor.generate_collaborator_reports(reports)}
+
+def test_summary_aggregate_applies_card_deltas():
+    import random
+    from dataclasses import replace
+    from src.aggregates import SummaryAggregate, card_summary
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(400, seed=21, reference_date=as_of)
+    start, end = date(2024, 1, 1), date(2024, 12, 31)
+    for engine in ('reference', 'indexed'):
+        processor = TrelloDataProcessor(engine=engine, as_of=as_of)
+        reports = processor.generate_task_reports(data, start, end)
+        assert SummaryAggregate.from_reports(reports).summary() == processor.generate_report_summary(reports)
+
+    rows_by_card = {}
+    for row in reports:
+        rows_by_card.setdefault(row.task_id, []).append(row)
+    aggregate = SummaryAggregate.from_reports(reports)
+    rng = random.Random(21)
+    card_ids = list(rows_by_card)
+    for card_id in rng.sample(card_ids, 60):
+        # Troca as linhas do card pelas de outro card (status, grupos e colaboradores diferentes)
+        other = [replace(row, task_id=card_id) for row in rows_by_card[rng.choice(card_ids)]]
+        aggregate.apply(card_summary(rows_by_card[card_id]), card_summary(other))
+        rows_by_card[card_id] = other
+    for card_id in card_ids[:20]:
+        aggregate.apply(card_summary(rows_by_card.pop(card_id)), None)
+
+    current = [row for rows in rows_by_card.values() for row in rows]
+    assert aggregate.mismatches(current, processor) == []
+    assert aggregate.summary() != processor.generate_report_summary(reports)
+
+def test_profile_run_records_processing_stages():
+    import json
+    from src.profiling import current_profile, profile_run, stage
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(200, seed=4, reference_date=as_of)
+    processor = TrelloDataProcessor(as_of=as_of)
+    with profile_run('teste') as profile:
+        with stage('relatórios de tarefas') as timing:
+            reports = processor.generate_task_reports(data, date(2024, 1, 1), date(2024, 12, 31))
+            timing.add_rows(len(reports))
+    assert current_profile() is None
+
+    stages = profile.stages
+    assert stages['relatórios de tarefas'].rows == len(reports) and stages['relatórios de tarefas'].depth == 0
+    assert stages['filtro por período'].depth == 1 and stages['filtro por período'].calls == 1
+    # Status por colaborador chama o status do card: cada card é contado uma vez
+    assert 0 < stages['classificação de status'].calls <= len(reports)
+    assert stages['relatórios de tarefas'].ms >= stages['classificação de status'].ms
+    assert json.loads(profile.to_json())['stages'][0]['name'] == 'relatórios de tarefas'
+    with stage('fora') as timing:
+        assert timing is None
+
+def test_cprofile_capture_writes_loadable_pstats(tmp_path):
+    import pstats
+    from src.profiling import capture_cprofile
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(150, seed=6, reference_date=as_of)
+    processor = TrelloDataProcessor(as_of=as_of)
+    reports, capture = capture_cprofile(
+        processor.generate_task_reports, data, date(2024, 1, 1), date(2024, 12, 31), label='board', top=10
+    )
+    assert reports == processor.generate_task_reports(data, date(2024, 1, 1), date(2024, 12, 31))
+
+    path = tmp_path / 'perfil.pstats'
+    capture.write_pstats(str(path))
+    assert pstats.Stats(str(path)).total_calls == capture.calls
+    assert len(capture.top) == 10 and 'generate_task_reports' in capture.top[0]['function']
+    assert [row['cumtime_ms'] for row in capture.top] == sorted((row['cumtime_ms'] for row in capture.top), reverse=True)
+    assert capture.top_csv().splitlines()[0].startswith('function,calls')
+
+def test_memory_report_counts_shared_artifacts_once():
+    import gc
+    import sys
+    from src.memory import MemoryRegistry, SessionArtifacts, artifact_sizes, deep_sizeof
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(200, seed=8, reference_date=as_of)
+    processor = TrelloDataProcessor(as_of=as_of)
+    reports = processor.generate_task_reports(data, date(2024, 1, 1), date(2024, 12, 31))
+    state = {'board_reports': (data, as_of, reports), 'trello_data': data, 'task_reports': reports}
+
+    sizes = {size.name: size for size in artifact_sizes(state)}
+    assert sizes['trello_data'].exclusive_bytes == sizes['trello_data'].bytes == deep_sizeof(data)
+    assert sizes['board_reports'].exclusive_bytes < sizes['board_reports'].bytes
+    values = list(state.values())
+    assert sum(size.exclusive_bytes for size in sizes.values()) == deep_sizeof(values) - sys.getsizeof(values)
+
+    registry = MemoryRegistry(trace_runs=True)
+    sessions = [SessionArtifacts('a'), SessionArtifacts('b')]
+    for session in sessions:
+        registry.register_session(session)
+        session.update(state, data['name'], len(data['cards']))
+    first, second = registry.measure_sessions()
+    assert first.total_bytes > 0 and second.total_bytes < first.total_bytes / 10
+    del sessions[1], session
+    gc.collect()
+    assert [s.session_id for s in registry.sessions()] == ['a']
+
+    with registry.track_run('a', data['name'], len(data['cards'])) as run:
+        copies = [dict(card) for card in data['cards']]
+    assert run.peak_bytes > deep_sizeof(copies) // 4 and registry.runs[0] is run
+    registry.trace_runs = False
+    with registry.track_run('a', data['name'], 0) as run:
+        assert run is None
+
+def test_metrics_render_prometheus_text_format():
+    from urllib.request import urlopen
+    from src.metrics import MetricsRegistry, MetricsServer
+
+    registry = MetricsRegistry()
+    boards = registry.counter('boards_total', 'Boards', ['source'])
+    seconds = registry.histogram('run_seconds', 'Duração', ['source'], buckets=(0.1, 1.0))
+    ratio = registry.gauge('hit_ratio', 'Acerto')
+    boards.inc(source='app')
+    boards.inc(2, source='cli "x"')
+    for value in (0.05, 0.5, 3):
+        seconds.observe(value, source='app')
+    registry.add_collector('ratio', lambda: ratio.set(0.75))
+
+    text = registry.render()
+    assert '# TYPE boards_total counter' in text and 'boards_total{source="cli \\"x\\""} 2' in text
+    assert 'run_seconds_bucket{source="app",le="0.1"} 1' in text
+    assert 'run_seconds_bucket{source="app",le="1"} 2' in text
+    assert 'run_seconds_bucket{source="app",le="+Inf"} 3' in text
+    assert 'run_seconds_sum{source="app"} 3.55' in text and 'run_seconds_count{source="app"} 3' in text
+    assert 'hit_ratio 0.75' in text
+
+    with MetricsServer(registry, port=0) as server:
+        with urlopen(server.url) as response:
+            assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+            assert response.read().decode('utf-8') == text
+
+def test_headless_modules_import_without_ui_dependencies():
+    import json
+    import subprocess
+    import sys
+
+    script = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        "import cli, src.utils, src.watcher, src.card_cache, src.metrics\n"
+        "import src.webhook, src.live_board, src.sync\n"
+        "seconds = time.perf_counter() - started\n"
+        "heavy = [name for name in ('streamlit', 'plotly', 'pandas') if name in sys.modules]\n"
+        "print(json.dumps({'seconds': seconds, 'heavy': heavy}))\n"
+    )
+    result = json.loads(subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout)
+    assert result['heavy'] == []
+    # Sem Streamlit/Plotly/pandas a CLI sobe em ~0,1 s; antes passava de 1 s
+    assert result['seconds'] < 1.0
+
+    import src.utils
+    assert src.utils.create_status_pie_chart.__module__ == 'src.charts'
+
+def test_shared_board_cache_evicts_unused_boards_over_budget():
+    import gc
+    import json
+    from src.board_cache import SharedBoardCache, content_key
+    from src.board_index import BoardIndex
+
+    raws = [json.dumps(generate_board(50, seed=seed, reference_date=date(2024, 6, 1))).encode() for seed in (1, 2, 3)]
+    keys = [content_key(raw) for raw in raws]
+    cache = SharedBoardCache(max_bytes=10 ** 9)
+
+    first = cache.acquire(keys[0], load=lambda: json.loads(raws[0]))
+    second = cache.acquire(keys[0], load=lambda: json.loads(raws[0]))
+    assert first.data is second.data and cache.stats()['leases'] == 2 and cache.hits == 1
+    index = first.derived('board_index', lambda: BoardIndex.from_data(first.data))
+    assert second.derived('board_index', lambda: None) is index and index.cards is first.data['cards']
+
+    # Orçamento para cerca de dois boards: sem leases, o menos recente sai
+    cache.max_bytes = cache.total_bytes * 2
+    first.release()
+    del second
+    gc.collect()
+    assert cache.stats()['leases'] == 0
+    other = cache.acquire(keys[1], load=lambda: json.loads(raws[1]))
+    third = cache.acquire(keys[2], load=lambda: json.loads(raws[2]))
+    assert keys[0] not in cache and keys[1] in cache and keys[2] in cache and cache.evictions == 1
+
+    # Boards em uso não saem, mesmo acima do orçamento
+    cache.max_bytes = 0
+    cache._evict()
+    assert len(cache) == 2
+    other.release()
+    assert keys[1] not in cache and third.key in cache and cache.acquire(keys[0]) is None
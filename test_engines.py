@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+from datetime import date, timedelta
+
+from src.engines import available_engines
+from src.parity import run_parity, generate_board
+
+def test_engines_match_reference_on_generated_boards():
+    for engine in available_engines()[1:]:
+        for seed in range(3):
+            data = generate_board(400, seed=seed)
+            report = run_parity(data, date.today() - timedelta(days=90), date.today(), engine)
+            assert report.ok, report.mismatches[:5]
+            assert report.task_reports > 0
+
+def test_parity_reports_mismatches():
+    data = generate_board(50, seed=1)
+    report = run_parity(data, date(2000, 1, 1), date(2100, 1, 1), 'indexed')
+    assert report.ok
+
+    from src.parity import diff_values
+    mismatches = []
+    diff_values('x', {'a': [1, 2]}, {'a': [1, 3]}, mismatches)
+    assert [m.path for m in mismatches] == ["x['a'][1]"]
+
+def test_window_reports_match_per_period_reports():
+    from src.data_processor import TrelloDataProcessor
+    from src.windows import weekly_windows
+
+    as_of = date(2024, 6, 1)
+    data = generate_board(400, seed=4, reference_date=as_of)
+    processor = TrelloDataProcessor(as_of=as_of)
+    windows = weekly_windows(as_of, 12) + [(date(2024, 1, 1), as_of)]
+
+    results = processor.generate_window_reports(data, windows, include_collaborators=True)
+    assert [(r.start_date, r.end_date) for r in results] == windows
+    for (start_date, end_date), result in zip(windows, results):
+        reports = processor.generate_task_reports(data, start_date, end_date)
+        assert result.task_reports == reports
+        assert result.summary == processor.generate_report_summary(reports)
+        assert result.collaborator_reports == processor.generate_collaborator_reports(reports)
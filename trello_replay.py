@@ -0,0 +1,143 @@
+"""
+Servidores HTTP locais que substituem a API do Trello nos testes.
+
+ReplayServer devolve respostas gravadas (python cli.py fetch --record ou
+TrelloClient(record=...)) ou montadas à mão; BoardServer simula a API sobre
+boards em memória (sincronização incremental).
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlsplit, parse_qsl
+
+from src.trello_api import request_key
+
+class ReplayServer:
+    """
+    Servidor HTTP local que substitui a API do Trello nos testes.
+
+    As respostas são indexadas por request_key; `failures` enfileira status
+    de erro devolvidos antes da resposta de uma chave (ex.: [429, 500]).
+    """
+
+    def __init__(self, responses: Dict[str, Any], failures: Optional[Dict[str, List[int]]] = None,
+                 base_path: str = '/1'):
+        self.responses = responses
+        self.failures = {key: list(statuses) for key, statuses in (failures or {}).items()}
+        self.base_path = base_path
+        self.requests: List[str] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @classmethod
+    def from_file(cls, path: str, **options) -> 'ReplayServer':
+        """Servidor para uma gravação salva em JSON (chave -> corpo)."""
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f), **options)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}{self.base_path}'
+
+    def respond(self, path: str, params: Dict[str, str]) -> Tuple[int, Any]:
+        """Status e corpo de uma requisição (falhas simuladas antes da resposta)."""
+        key = request_key(path, params)
+        with self._lock:
+            self.requests.append(key)
+            pending = self.failures.get(key)
+            if pending:
+                return pending.pop(0), {'message': 'falha simulada'}
+        return self.lookup(path, params, key)
+
+    def lookup(self, path: str, params: Dict[str, str], key: str) -> Tuple[int, Any]:
+        """Resposta gravada da requisição (sobrescreva para respostas dinâmicas)."""
+        if key not in self.responses:
+            return 404, {'message': f'sem resposta gravada para {key}'}
+        return 200, self.responses[key]
+
+    def _handler(self):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                with replay._lock:
+                    replay.connections += 1
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                path = parts.path[len(replay.base_path):] if parts.path.startswith(replay.base_path) else parts.path
+                status, payload = replay.respond(path, dict(parse_qsl(parts.query)))
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                if status == 429:
+                    self.send_header('Retry-After', '0')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self) -> 'ReplayServer':
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+class BoardServer(ReplayServer):
+    """
+    Servidor local que simula a API do Trello sobre boards em memória.
+
+    Atende board, cards, listas, membros, ações (filter, since, before e
+    limit; ids de ação crescem com o tempo, como os ObjectIds do Trello) e
+    /cards/{id}. Os testes alteram `boards` entre as requisições.
+    """
+
+    def __init__(self, boards: Dict[str, Dict[str, Any]], **options):
+        super().__init__({}, **options)
+        self.boards = boards
+
+    def lookup(self, path: str, params: Dict[str, str], key: str) -> Tuple[int, Any]:
+        parts = path.strip('/').split('/')
+        if parts[0] == 'cards' and len(parts) == 2:
+            for data in self.boards.values():
+                for card in data['cards']:
+                    if card['id'] == parts[1]:
+                        return 200, card
+            return 404, {'message': 'card não encontrado'}
+
+        if parts[0] != 'boards' or len(parts) < 2 or parts[1] not in self.boards:
+            return 404, {'message': f'recurso desconhecido: {path}'}
+        data = self.boards[parts[1]]
+        resource = parts[2] if len(parts) > 2 else None
+        if resource is None:
+            return 200, {'id': parts[1], **{name: value for name, value in data.items() if not isinstance(value, list)}}
+        if resource in ('cards', 'lists', 'members'):
+            return 200, data[resource]
+        if resource != 'actions':
+            return 404, {'message': f'recurso desconhecido: {path}'}
+
+        types = params.get('filter', 'all')
+        actions = data.get('actions', [])
+        if types != 'all':
+            allowed = set(types.split(','))
+            actions = [action for action in actions if action['type'] in allowed]
+        for name, newer in (('since', True), ('before', False)):
+            if name in params:
+                field = 'date' if '-' in params[name] else 'id'
+                actions = [a for a in actions if (a[field] > params[name]) == newer and a[field] != params[name]]
+        return 200, actions[:int(params.get('limit', 50))]